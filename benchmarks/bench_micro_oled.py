@@ -0,0 +1,393 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# bench_micro_oled.py
+#
+# Drawing and display benchmark suite for the Qwiic Micro OLED package
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, May 2021
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2021 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# Runs the drawing primitives, the display flush paths and the cube and demo example
+# workloads against the simulated I2C driver, so no hardware is needed. Results - ops/sec,
+# bytes on the bus per operation or frame, and frame time percentiles - are written to a
+# JSON file.
+#
+# With --compare, the results are checked against a stored baseline file, and the script
+# exits with a non-zero status if anything is slower than the tolerance allows, or writes
+# more bytes to the bus than before.
+#
+#   python benchmarks/bench_micro_oled.py [--output results.json] [--compare baseline.json]
+#
+
+from __future__ import print_function, division
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT_DIR)
+
+import qwiic_micro_oled
+import qwiic_micro_oled_sim
+
+_EXAMPLES_DIR = os.path.join(_ROOT_DIR, "examples")
+
+# Default time spent on each primitive, and number of cube frames
+_DEFAULT_MIN_TIME   = 0.25
+_DEFAULT_CUBE_FRAMES = 360
+_DEFAULT_REPEAT     = 3
+
+# Default allowed slowdown in --compare mode, as a fraction of the baseline rate
+_DEFAULT_TOLERANCE  = 0.20
+
+# Text printed for each font type - only characters defined in the font
+_FONT_TEXT = {0: "Hello World!",
+              1: "Hello World!",
+              2: "12.345",
+              3: "0123",
+              4: "OLED"}
+
+#-------------------------------------------------------------------
+def _load_example(name):
+
+    # Import an example script as a module, without running it
+    path = os.path.join(_EXAMPLES_DIR, name + ".py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+class _NoSleep(object):
+
+    # Stand in for the time module in the example scripts, so their delays are skipped
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+    @staticmethod
+    def sleep(seconds):
+        pass
+
+def _percentiles(values):
+
+    # Nearest rank percentiles of a list of times in seconds, in milliseconds
+    values = sorted(values)
+    summary = {}
+    for pct in (50, 90, 99):
+        summary["p%d" % pct] = values[min(int(math.ceil(pct / 100. * len(values))) - 1,
+                                          len(values) - 1)] * 1000.
+    summary["max"] = values[-1] * 1000.
+
+    return summary
+
+def _new_display(bus_speed):
+
+    bus = qwiic_micro_oled_sim.SimulatedI2C(bus_speed=bus_speed, record=False)
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+    oled.begin()
+    oled.clear(oled.ALL)
+    bus.reset_stats()
+
+    return (oled, bus)
+
+#-------------------------------------------------------------------
+def _time_op(oled, bus, op, minTime, repeat):
+
+    # Call op(i) until minTime has passed, in batches, and return the best rate of repeat
+    # runs, and the bus bytes and modeled bus time of an average call
+    op(0)
+
+    best = None
+    for _ in range(repeat):
+        bus.reset_stats()
+        nOps = 0
+        batch = 1
+        elapsed = 0.0
+        while elapsed < minTime:
+            t0 = time.perf_counter()
+            for i in range(nOps, nOps + batch):
+                op(i)
+            elapsed += time.perf_counter() - t0
+            nOps += batch
+            batch *= 2
+
+        if best is None or nOps / elapsed > best["ops_per_sec"]:
+            best = {"ops": nOps,
+                    "ops_per_sec": nOps / elapsed,
+                    "us_per_op": elapsed * 1e6 / nOps,
+                    "bus_bytes_per_op": bus.bytes_written / nOps,
+                    "bus_ms_per_op": bus.bus_time * 1000. / nOps}
+
+    return best
+
+def primitives(bus_speed, minTime, repeat):
+    """
+        Time each drawing primitive and flush path on its own.
+    """
+    (oled, bus) = _new_display(bus_speed)
+    width = oled.get_lcd_width()
+    height = oled.get_lcd_height()
+
+    # Fixed random coordinates, so every run draws the same thing
+    rand = random.Random(1)
+    coords = [(rand.randrange(width), rand.randrange(height),
+               rand.randrange(width), rand.randrange(height)) for _ in range(256)]
+
+    def coord(i):
+        return coords[i & 255]
+
+    bender = _load_example("qwiic_micro_oled_bitmap").bender
+
+    def display_full(i):
+        oled.invalidate()
+        oled.display()
+
+    def display_partial(i):
+        (x, y, _, _) = coord(i)
+        oled.pixel(x, y, oled.WHITE, oled.XOR)
+        oled.display()
+
+    ops = [("pixel", lambda i: oled.pixel(coord(i)[0], coord(i)[1])),
+           ("line", lambda i: oled.line(*coord(i))),
+           ("rect", lambda i: oled.rect(coord(i)[0] // 2, coord(i)[1] // 2, 24, 16)),
+           ("rect_fill", lambda i: oled.rect_fill(coord(i)[0] // 2, coord(i)[1] // 2, 24, 16)),
+           ("circle", lambda i: oled.circle(coord(i)[0], coord(i)[1], 10)),
+           ("draw_bitmap", lambda i: oled.draw_bitmap(bender)),
+           ("clear_page", lambda i: oled.clear(oled.PAGE)),
+           ("clear_all", lambda i: oled.clear(oled.ALL)),
+           ("display_full", display_full),
+           ("display_partial", display_partial),
+           ("display_unchanged", lambda i: oled.display())]
+
+    results = {}
+    for (name, op) in ops:
+        oled.clear(oled.PAGE)
+        oled.display()
+        results[name] = _time_op(oled, bus, op, minTime, repeat)
+
+    # print() for each font type, one string per call
+    for fontType in sorted(_FONT_TEXT):
+        oled.set_font_type(fontType)
+        text = _FONT_TEXT[fontType]
+
+        def print_text(i):
+            oled.set_cursor(0, 0)
+            oled.print(text)
+
+        result = _time_op(oled, bus, print_text, minTime, repeat)
+        result["chars_per_sec"] = result["ops_per_sec"] * len(text)
+        results["print_font%d" % fontType] = result
+
+    return results
+
+#-------------------------------------------------------------------
+class _FrameTimer(object):
+
+    # Wraps a display object's display() method, to measure each frame - the time from the
+    # end of one display() call to the end of the next, and the bus traffic of each call
+    def __init__(self, oled, bus):
+
+        self.oled = oled
+        self.bus = bus
+        self.frameTimes = []
+        self.frameBytes = []
+        self.frameBusTimes = []
+
+        self._display = oled.display
+        oled.display = self.display
+        self._last = time.perf_counter()
+
+    def display(self):
+
+        nBytes = self.bus.bytes_written
+        busTime = self.bus.bus_time
+        self._display()
+        now = time.perf_counter()
+
+        self.frameTimes.append(now - self._last)
+        self.frameBytes.append(self.bus.bytes_written - nBytes)
+        self.frameBusTimes.append(self.bus.bus_time - busTime)
+        self._last = now
+
+    def summary(self, elapsed):
+
+        nFrames = len(self.frameTimes)
+        return {"frames": nFrames,
+                "elapsed_ms": elapsed * 1000.,
+                "fps": nFrames / elapsed,
+                "frame_ms": _percentiles(self.frameTimes),
+                "bus_bytes_per_frame": sum(self.frameBytes) / nFrames,
+                "bus_ms_per_frame": _percentiles(self.frameBusTimes)}
+
+def _run_workload(bus_speed, run, repeat):
+
+    # Run the workload repeat times on a new display, and keep the fastest run
+    best = None
+    for _ in range(repeat):
+        (oled, bus) = _new_display(bus_speed)
+        timer = _FrameTimer(oled, bus)
+
+        t0 = time.perf_counter()
+        run(oled)
+        elapsed = time.perf_counter() - t0
+
+        if best is None or elapsed < best[0]:
+            best = (elapsed, timer)
+
+    return best[1].summary(best[0])
+
+def workloads(bus_speed, cubeFrames, repeat):
+    """
+        Time the cube and demo example workloads, frame by frame.
+    """
+    cube = _load_example("qwiic_micro_oled_cube")
+    demo = _load_example("qwiic_micro_oled_demo")
+    demo.time = _NoSleep()
+
+    def run_cube(oled):
+        for frame in range(cubeFrames):
+            cube.drawCube(oled, frame)
+            oled.display()
+
+    def run_demo(oled):
+        random.seed(1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            demo.pixelExample(oled)
+            demo.lineExample(oled)
+            demo.shapeExample(oled)
+            demo.textExamples(oled)
+
+    return {"cube": _run_workload(bus_speed, run_cube, repeat),
+            "demo": _run_workload(bus_speed, run_demo, repeat)}
+
+#-------------------------------------------------------------------
+def compare(results, baseline, tolerance):
+    """
+        Compare results with a baseline. Returns a list of (name, metric, baseline value,
+        value, regressed) tuples.
+    """
+    checks = []
+
+    def check(name, metric, old, new, higherIsBetter):
+        if higherIsBetter:
+            regressed = new < old * (1.0 - tolerance)
+        else:
+            regressed = new > old * (1.0 + tolerance)
+        checks.append((name, metric, old, new, regressed))
+
+    for (name, result) in sorted(results["primitives"].items()):
+        old = baseline.get("primitives", {}).get(name)
+        if old is None:
+            continue
+        check(name, "ops_per_sec", old["ops_per_sec"], result["ops_per_sec"], True)
+        # Bus traffic doesn't depend on the host, so any increase is a regression
+        if result["bus_bytes_per_op"] > old["bus_bytes_per_op"]:
+            checks.append((name, "bus_bytes_per_op", old["bus_bytes_per_op"],
+                           result["bus_bytes_per_op"], True))
+
+    for (name, result) in sorted(results["workloads"].items()):
+        old = baseline.get("workloads", {}).get(name)
+        if old is None:
+            continue
+        check(name, "fps", old["fps"], result["fps"], True)
+        check(name, "frame_ms.p99", old["frame_ms"]["p99"], result["frame_ms"]["p99"], False)
+        checks.append((name, "bus_bytes_per_frame", old["bus_bytes_per_frame"],
+                       result["bus_bytes_per_frame"],
+                       result["bus_bytes_per_frame"] > old["bus_bytes_per_frame"]))
+
+    return checks
+
+def runBenchmark():
+
+    parser = argparse.ArgumentParser(description="Qwiic Micro OLED benchmark suite")
+    parser.add_argument("--output", default="bench_results.json",
+                        help="file to write the JSON results to")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="baseline JSON results to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=_DEFAULT_TOLERANCE,
+                        help="allowed slowdown against the baseline, as a fraction")
+    parser.add_argument("--bus-speed", type=int, default=400000,
+                        help="simulated I2C bus speed in Hz, for the modeled bus time")
+    parser.add_argument("--min-time", type=float, default=_DEFAULT_MIN_TIME,
+                        help="seconds to spend timing each primitive")
+    parser.add_argument("--repeat", type=int, default=_DEFAULT_REPEAT,
+                        help="number of runs of each benchmark - the fastest is reported")
+    parser.add_argument("--cube-frames", type=int, default=_DEFAULT_CUBE_FRAMES,
+                        help="number of cube example frames to draw")
+    args = parser.parse_args()
+
+    results = {"python": platform.python_version(),
+               "platform": platform.platform(),
+               "bus_speed": args.bus_speed,
+               "primitives": primitives(args.bus_speed, args.min_time, args.repeat),
+               "workloads": workloads(args.bus_speed, args.cube_frames, args.repeat)}
+
+    with open(args.output, "w") as outFile:
+        json.dump(results, outFile, indent=2, sort_keys=True)
+
+    print("%-20s %14s %12s %14s" % ("primitive", "ops/sec", "us/op", "bus bytes/op"))
+    for (name, result) in sorted(results["primitives"].items()):
+        print("%-20s %14.1f %12.2f %14.1f" % (name, result["ops_per_sec"], result["us_per_op"],
+                                              result["bus_bytes_per_op"]))
+
+    print()
+    print("%-20s %8s %10s %10s %10s %16s" % ("workload", "frames", "fps", "p50 ms", "p99 ms",
+                                             "bus bytes/frame"))
+    for (name, result) in sorted(results["workloads"].items()):
+        print("%-20s %8d %10.1f %10.3f %10.3f %16.1f" % (name, result["frames"], result["fps"],
+                                                         result["frame_ms"]["p50"],
+                                                         result["frame_ms"]["p99"],
+                                                         result["bus_bytes_per_frame"]))
+
+    print("\nResults written to %s" % args.output)
+
+    if not args.compare:
+        return 0
+
+    with open(args.compare) as inFile:
+        baseline = json.load(inFile)
+
+    print("\nCompared with %s (tolerance %d%%):" % (args.compare, args.tolerance * 100))
+    failed = False
+    for (name, metric, old, new, regressed) in compare(results, baseline, args.tolerance):
+        failed = failed or regressed
+        print("%-20s %-20s %14.2f %14.2f   %s" % (name, metric, old, new,
+                                                  "REGRESSED" if regressed else "ok"))
+
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(runBenchmark())
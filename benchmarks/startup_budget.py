@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# startup_budget.py
+#
+# Startup time budget check for the Qwiic Micro OLED package
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, May 2021
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2021 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# Measures, in fresh Python processes, the time to import qwiic_micro_oled and the
+# time from creating a display object to the end of its first display() call. The
+# first display is run against a driver that only counts I2C transactions, so the
+# number of transactions is checked as well - it doesn't depend on the host.
+#
+# Exits with a non-zero status if any measurement is over its budget.
+#
+#   python benchmarks/startup_budget.py [--import-ms N] [--first-display-ms N]
+#
+
+from __future__ import print_function
+import argparse
+import os
+import subprocess
+import sys
+
+# Default budgets - generous enough for a Raspberry Pi Zero
+_IMPORT_BUDGET_MS           = 250.0
+_FIRST_DISPLAY_BUDGET_MS    = 100.0
+_FIRST_DISPLAY_TRANSACTIONS = 150
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run in a child process, so nothing is imported or cached beforehand
+_MEASURE_SCRIPT = """
+import time
+t0 = time.perf_counter()
+import qwiic_micro_oled
+t1 = time.perf_counter()
+
+class CountingDriver(object):
+    transactions = 0
+    def writeByte(self, address, commandCode, value):
+        self.transactions += 1
+    def writeBlock(self, address, commandCode, value):
+        self.transactions += 1
+
+driver = CountingDriver()
+t2 = time.perf_counter()
+oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=driver)
+oled.begin()
+oled.print("Hello World")
+oled.display()
+t3 = time.perf_counter()
+
+print((t1 - t0)*1000., (t3 - t2)*1000., driver.transactions)
+"""
+
+def measure(runs):
+    """
+        Measure the import time, the time to the first display, and the transactions
+        of the first display, in child processes. Returns the median of each.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = _ROOT_DIR + os.pathsep + env.get("PYTHONPATH", "")
+
+    results = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", _MEASURE_SCRIPT], env=env)
+        results.append([float(value) for value in output.split()])
+
+    medians = []
+    for column in zip(*results):
+        column = sorted(column)
+        medians.append(column[len(column) // 2])
+
+    return medians
+
+def runBudget():
+
+    parser = argparse.ArgumentParser(description="Qwiic Micro OLED startup time budget check")
+    parser.add_argument("--runs", type=int, default=5, help="number of processes to measure")
+    parser.add_argument("--import-ms", type=float, default=_IMPORT_BUDGET_MS,
+                        help="import time budget, in milliseconds")
+    parser.add_argument("--first-display-ms", type=float, default=_FIRST_DISPLAY_BUDGET_MS,
+                        help="time to first display budget, in milliseconds")
+    parser.add_argument("--transactions", type=int, default=_FIRST_DISPLAY_TRANSACTIONS,
+                        help="I2C transaction budget for the first display")
+    args = parser.parse_args()
+
+    (importMs, firstDisplayMs, transactions) = measure(args.runs)
+
+    checks = [("import time (ms)", importMs, args.import_ms),
+              ("time to first display (ms)", firstDisplayMs, args.first_display_ms),
+              ("first display I2C transactions", transactions, args.transactions)]
+
+    failed = False
+    for (name, value, budget) in checks:
+        over = value > budget
+        failed = failed or over
+        print("%-32s %10.2f   budget %10.2f   %s" % (name, value, budget, "OVER" if over else "ok"))
+
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(runBudget())
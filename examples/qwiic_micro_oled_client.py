@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# qwiic_micro_oled_client.py
+#
+# Simple Example for the Qwiic MicroOLED Device
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, May 2021
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https:# www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2021 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+# Example - show a clock in the bottom of the screen, through the display server.
+#
+# Start the server first - it owns the display, so other programs can use the rest
+# of the screen at the same time:
+#
+#   python -m qwiic_micro_oled_server
+#
+
+from __future__ import print_function
+import qwiic_micro_oled_server
+import time
+import sys
+
+
+def runExample():
+
+    print("\nSparkFun Micro OLED Display Client Example\n")
+
+    #  The client draws into a window of the screen - the bottom 16 rows. clear() and
+    #  drawing only affect the window, so other clients aren't overwritten.
+    try:
+        myOLED = qwiic_micro_oled_server.DisplayClient(y=32, height=16)
+    except OSError:
+        print("The display server isn't running. Start it with: python -m qwiic_micro_oled_server", \
+            file=sys.stderr)
+        return
+
+    myOLED.begin()
+    myOLED.set_font_type(1)
+
+    while True:
+        myOLED.clear(myOLED.PAGE)
+        myOLED.set_cursor(0, 0)
+        myOLED.print(time.strftime("%H:%M:%S"))
+
+        #  Only the changed parts of the window are sent to the server
+        myOLED.display()
+        time.sleep(1)
+
+
+if __name__ == '__main__':
+    try:
+        runExample()
+    except (KeyboardInterrupt, SystemExit) as exErr:
+        print("\nEnding OLED Display Client Example")
+        sys.exit(0)
@@ -40,68 +40,24 @@
 
 from __future__ import print_function, division
 import qwiic_micro_oled
+import qwiic_micro_oled_wireframe
 import sys
-import time
-import math
 
-d = 3
-px = [-d,  d,  d, -d, -d,  d,  d, -d ]
-py = [-d, -d,  d,  d, -d, -d,  d,  d ]
-pz = [-d, -d, -d, -d,  d,  d,  d,  d ]
+# A cube mesh, drawn in perspective - rotation, projection and line drawing are all
+# handled by the wireframe module
+cube = qwiic_micro_oled_wireframe.Wireframe(qwiic_micro_oled_wireframe.cube_mesh(3),
+                                            focal=600, distance=150)
 
-p2x = [0,0,0,0,0,0,0,0]
-p2y = [0,0,0,0,0,0,0,0]
+def drawCube(oled, frame):
 
-r = [0,0,0]
-
-SHAPE_SIZE=600
-def drawCube(oled):
-
-    global p2x, p2y, r
-
-
-    r[0]=r[0] + math.pi/180.0 #  Add a degree
-    r[1]=r[1] + math.pi/180.0 #  Add a degree
-    r[2]=r[2] + math.pi/180.0 #  Add a degree
-    if r[0] >= 360.0*math.pi/180.0:
-        r[0] = 0
-    if r[1] >= 360.0*math.pi/180.0:
-        r[1] = 0
-    if r[2] >= 360.0*math.pi/180.0:
-        r[2] = 0
-
-    scrWidth = oled.get_lcd_width()
-    scrHeight = oled.get_lcd_height()
-
-    for i in range(8):
-
-        px2 = px[i]
-        py2 = math.cos(r[0])*py[i] - math.sin(r[0])*pz[i]
-        pz2 = math.sin(r[0])*py[i] + math.cos(r[0])*pz[i]
-
-        px3 = math.cos(r[1])*px2 + math.sin(r[1])*pz2
-        py3 = py2
-        pz3 = -math.sin(r[1])*px2 + math.cos(r[1])*pz2
-
-        ax = math.cos(r[2])*px3 - math.sin(r[2])*py3
-        ay = math.sin(r[2])*px3 + math.cos(r[2])*py3
-        az = pz3-150
-
-        p2x[i] = scrWidth/2+ax*SHAPE_SIZE/az
-        p2y[i] = scrHeight/2+ay*SHAPE_SIZE/az
+    # The angle comes from the frame number, so when frames are dropped the cube
+    # still turns at a steady rate - a degree about each axis per frame
+    cube.set_rotation(frame, frame, frame)
 
     oled.clear(oled.PAGE)
 
-    for i in range(3):
-
-        oled.line(p2x[i],p2y[i],p2x[i+1],p2y[i+1])
-        oled.line(p2x[i+4],p2y[i+4],p2x[i+5],p2y[i+5])
-        oled.line(p2x[i],p2y[i],p2x[i+4],p2y[i+4])
-
-    oled.line(p2x[3],p2y[3],p2x[0],p2y[0])
-    oled.line(p2x[7],p2y[7],p2x[4],p2y[4])
-    oled.line(p2x[3],p2y[3],p2x[7],p2y[7])
-    oled.display()
+    # Draw the 12 edges of the cube in one call
+    cube.draw(oled)
 
 def runExample():
 
@@ -128,10 +84,9 @@ def runExample():
     myOLED.display()
 
 
-    while True:
-
-        drawCube(myOLED)
-        time.sleep(.01)
+    # Draw the cube at a steady 30 frames per second - run_animation() displays
+    # each frame, and sleeps for whatever time is left
+    myOLED.run_animation(drawCube, fps=30)
 
 
 
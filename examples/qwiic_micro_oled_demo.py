@@ -116,6 +116,21 @@ def shapeExample(myOLED):
     paddle0Velocity = -1  # Paddle 0 velocity
     paddle1Velocity = 1  # Paddle 1 velocity
 
+    # The paddles and ball are sprites. Draw the ball once, and copy it into a sprite
+    myOLED.clear(myOLED.PAGE)
+    myOLED.circle(ball_rad, ball_rad, ball_rad)
+    ball = myOLED.get_sprite(0, 0, ball_rad*2 + 1, ball_rad*2 + 1)
+    paddle = qwiic_micro_oled.Sprite.from_pixels([[1] * paddleW] * paddleH)
+
+    # Draw the Pong Field once, into a background canvas. Each frame copies it into
+    # the screen buffer, and draws the sprites over it.
+    field = qwiic_micro_oled.Canvas(lWidth, lHeight)
+
+    # Draw an outline of the screen:
+    field.rect(0, 0, lWidth - 1, lHeight)
+
+    # Draw the center line
+    field.rect_fill(lWidth//2 - 1, 0, 2, lHeight)
 
     while (ball_X - ball_rad > 1) and (ball_X + ball_rad < lWidth - 2):
 
@@ -160,21 +175,11 @@ def shapeExample(myOLED):
 
             paddle1Velocity = -paddle1Velocity
 
-        # Draw the Pong Field
-        myOLED.clear(myOLED.PAGE)  # Clear the page
-
-        # Draw an outline of the screen:
-        myOLED.rect(0, 0, lWidth - 1, lHeight)
-
-        # Draw the center line
-        myOLED.rect_fill(lWidth//2 - 1, 0, 2, lHeight)
-
-        # Draw the Paddles:
-        myOLED.rect_fill(paddle0_X, paddle0_Y, paddleW, paddleH)
-        myOLED.rect_fill(paddle1_X, paddle1_Y, paddleW, paddleH)
-
-        # # Draw the ball:
-        myOLED.circle(ball_X, ball_Y, ball_rad)
+        # Draw the Pong Field, then the paddles and ball:
+        myOLED.draw_canvas(field)
+        myOLED.blit(paddle, paddle0_X, paddle0_Y)
+        myOLED.blit(paddle, paddle1_X, paddle1_Y)
+        myOLED.blit(ball, ball_X - ball_rad, ball_Y - ball_rad)
 
         # Actually draw everything on the screen:
         myOLED.display()
@@ -250,26 +255,22 @@ def textExamples(myOLED):
     # This font looks like 7-segment displays.
     # Lets use this big-ish font to display readings from the
     # analog pins.
+    myOLED.clear(myOLED.PAGE)            # Clear the display
+    myOLED.set_font_type(0)         # Smallest font
+
+    # Print the labels once. The readings are numeric fields - setting a new
+    # value only redraws the digits that changed.
+    fields = []
+    for (i, label) in enumerate(["A0: ", "A1: ", "A2: "]):
+        myOLED.set_cursor(0, i*16)
+        myOLED.print(label)
+        fields.append(qwiic_micro_oled.NumericField(myOLED, len(label)*(myOLED.get_font_width() + 1), \
+                                                    i*16, 3, font_type=2, fmt="%.3d"))
+
     for i in range(25):
 
-        myOLED.clear(myOLED.PAGE)            # Clear the display
-        myOLED.set_cursor(0, 0)        # Set cursor to top-left
-        myOLED.set_font_type(0)         # Smallest font
-        myOLED.print("A0: ")          # Print "A0"
-        myOLED.set_font_type(2)         # 7-segment font
-        myOLED.print("%.3d" % randint(0,255))
-
-        myOLED.set_cursor(0, 16)       # Set cursor to top-middle-left
-        myOLED.set_font_type(0)         # Repeat
-        myOLED.print("A1: ")
-        myOLED.set_font_type(2)
-
-        myOLED.print("%.3d" % randint(0,255))
-        myOLED.set_cursor(0, 32)
-        myOLED.set_font_type(0)
-        myOLED.print("A2: ")
-        myOLED.set_font_type(2)
-        myOLED.print("%.3d" % randint(0,255))
+        for field in fields:
+            field.set_value(randint(0,255))
 
         myOLED.display()
         time.sleep(.1)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# qwiic_micro_oled_gradient.py
+#
+# Simple Example for the Qwiic MicroOLED Device
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, May 2021
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https:# www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2021 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+# Example - dither a moving grayscale pattern onto the OLED, a frame at a time.
+#
+
+from __future__ import print_function
+import qwiic_micro_oled
+import qwiic_micro_oled_dither
+import math
+import sys
+
+
+def gray_frames(width, height):
+
+    #  A ripple spreading from the middle of the screen, as bytes of gray values
+    frame = bytearray(width * height)
+    t = 0
+    while True:
+        i = 0
+        for y in range(height):
+            for x in range(width):
+                r = math.hypot(x - width / 2., y - height / 2.)
+                frame[i] = int(127.5 + 127.5 * math.cos(r / 3. - t))
+                i += 1
+        yield frame
+        t += 0.3
+
+
+def runExample():
+
+    print("\nSparkFun Micro OLED Gradient Example\n")
+    myOLED = qwiic_micro_oled.QwiicMicroOled()
+
+    if not myOLED.connected:
+        print("The Qwiic Micro OLED device isn't connected to the system. Please check your connection", \
+            file=sys.stderr)
+        return
+
+    myOLED.begin()
+    myOLED.clear(myOLED.ALL)  #  Clear the display's memory (gets rid of artifacts)
+
+    width = myOLED.get_lcd_width()
+    height = myOLED.get_lcd_height()
+
+    #  The ditherer reuses its buffers, so each frame is converted without new allocations
+    ditherer = qwiic_micro_oled_dither.Ditherer(width, height, qwiic_micro_oled_dither.FLOYD_STEINBERG)
+
+    for frame in ditherer.stream(gray_frames(width, height)):
+        myOLED.write_buffer(frame)
+        myOLED.display()
+
+
+if __name__ == '__main__':
+    try:
+        runExample()
+    except (KeyboardInterrupt, SystemExit) as exErr:
+        print("\nEnding OLED Gradient Example")
+        sys.exit(0)
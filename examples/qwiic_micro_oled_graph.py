@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# qwiic_micro_oled_graph.py
+#
+# Simple Example for the Qwiic MicroOLED Device
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, May 2021
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https:# www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2021 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+# Example - plot a value as a graph scrolling across the OLED.
+#
+
+from __future__ import print_function
+import qwiic_micro_oled
+import math
+import time
+import sys
+
+
+def runExample():
+
+    print("\nSparkFun Micro OLED Graph Example\n")
+    myOLED = qwiic_micro_oled.QwiicMicroOled()
+
+    if not myOLED.connected:
+        print("The Qwiic Micro OLED device isn't connected to the system. Please check your connection", \
+            file=sys.stderr)
+        return
+
+    myOLED.begin()
+    myOLED.clear(myOLED.ALL)  #  Clear the display's memory (gets rid of artifacts)
+    myOLED.clear(myOLED.PAGE)  #  Clear the display's buffer
+
+    # A title that stays put, and the graph under it
+    myOLED.set_font_type(0)
+    myOLED.set_cursor(0, 0)
+    myOLED.print("Signal")
+
+    graphTop = 10
+    graphHeight = myOLED.get_lcd_height() - graphTop
+    xLast = myOLED.get_lcd_width() - 1
+
+    t = 0
+    while True:
+        value = math.sin(t / 8.) * math.sin(t / 23.)
+        y = graphTop + int((1 - value) * (graphHeight - 1) / 2)
+
+        #  Move the graph one column left, then draw only the newest column
+        myOLED.scroll_buffer(-1, 0, 0, graphTop)
+        myOLED.line_v(xLast, y, graphTop + graphHeight - y)
+        myOLED.display()
+
+        t += 1
+        time.sleep(0.03)
+
+
+if __name__ == '__main__':
+    try:
+        runExample()
+    except (KeyboardInterrupt, SystemExit) as exErr:
+        print("\nEnding OLED Graph Example")
+        sys.exit(0)
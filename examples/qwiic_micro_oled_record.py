@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# qwiic_micro_oled_record.py
+#
+# Simple Example for the Qwiic MicroOLED Device
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, May 2021
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https:# www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2021 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+# Example - record the cube animation to a file, then play it back from the file.
+#
+
+from __future__ import print_function
+import qwiic_micro_oled
+import qwiic_micro_oled_recorder
+import qwiic_micro_oled_wireframe
+import sys
+
+cube = qwiic_micro_oled_wireframe.Wireframe(qwiic_micro_oled_wireframe.cube_mesh(3),
+                                            focal=600, distance=150)
+
+def drawCube(oled, frame):
+
+    cube.set_rotation(frame, frame, frame)
+    oled.clear(oled.PAGE)
+    cube.draw(oled)
+
+def runExample():
+
+    print("\nSparkFun Micro OLED Record Example\n")
+    myOLED = qwiic_micro_oled.QwiicMicroOled()
+
+    if not myOLED.connected:
+        print("The Qwiic Micro OLED device isn't connected to the system. Please check your connection", \
+            file=sys.stderr)
+        return
+
+    myOLED.begin()
+    myOLED.clear(myOLED.ALL)  #  Clear the display's memory (gets rid of artifacts)
+
+    #  Every frame written to the display while recording is saved, with its time
+    with qwiic_micro_oled_recorder.Recorder("cube.qmor", myOLED) as recorder:
+        myOLED.run_animation(drawCube, fps=30, duration=5)
+
+    print("Recorded %d frames in %d bytes" % (recorder.frame_count, recorder.size))
+
+    #  Play it back at the recorded speed - no drawing, only the changed bytes are sent
+    player = qwiic_micro_oled_recorder.Player("cube.qmor")
+    player.play(myOLED)
+
+    #  With Pillow installed, the recording can be saved as an animated GIF
+    try:
+        player.export_gif("cube.gif", scale=4)
+        print("Saved cube.gif")
+    except ImportError:
+        pass
+
+
+if __name__ == '__main__':
+    try:
+        runExample()
+    except (KeyboardInterrupt, SystemExit) as exErr:
+        print("\nEnding OLED Record Example")
+        sys.exit(0)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# qwiic_micro_oled_ticker.py
+#
+# Simple Example for the Qwiic MicroOLED Device
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, May 2021
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https:# www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2021 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+# Example - scroll a message across the OLED with the hardware scroll.
+#
+
+from __future__ import print_function
+import qwiic_micro_oled
+import sys
+
+
+def runExample():
+
+    print("\nSparkFun Micro OLED Ticker Example\n")
+    myOLED = qwiic_micro_oled.QwiicMicroOled()
+
+    if not myOLED.connected:
+        print("The Qwiic Micro OLED device isn't connected to the system. Please check your connection", \
+            file=sys.stderr)
+        return
+
+    myOLED.begin()
+    myOLED.clear(myOLED.ALL)  #  Clear the display's memory (gets rid of artifacts)
+    myOLED.clear(myOLED.PAGE)  #  Clear the display's buffer
+
+    # A title that stays put, and a message scrolling under it
+    myOLED.set_font_type(0)
+    myOLED.set_cursor(0, 0)
+    myOLED.print("Status:")
+    myOLED.display()
+
+    ticker = qwiic_micro_oled.Ticker(myOLED, "All systems go - 23.5C - 41% RH", y=24, font_type=1)
+
+    #  Each step only sends the scroll command and the new column to the display
+    ticker.run(speed=30)
+
+
+if __name__ == '__main__':
+    try:
+        runExample()
+    except (KeyboardInterrupt, SystemExit) as exErr:
+        print("\nEnding OLED Ticker Example")
+        sys.exit(0)
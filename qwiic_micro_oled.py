@@ -53,10 +53,17 @@ New to qwiic? Take a look at the entire [SparkFun qwiic ecosystem](https://www.s
 """
 
 from __future__ import print_function
+import os
+import sys
 import math
+import time
+import threading
+import contextlib
+import collections
 import qwiic_i2c
 
 from qwiic_oled_base import QwiicOledBase
+from qwiic_oled_base import oled_fonts
 
 # Define the device name and I2C addresses. These are set in the class defintion
 # as class variables, making them avilable without having to create a class instance.
@@ -72,6 +79,399 @@ _AVAILABLE_I2C_ADDRESS = [0x3D, 0x3C]
 _LCDWIDTH            = 64
 _LCDHEIGHT           = 48
 
+# SSD1306 I2C control bytes - what follows is a command or display (GDDRAM) data. With
+# the continuation bit (Co) set, only one byte follows before the next control byte.
+_I2C_COMMAND         = 0x00
+_I2C_DATA            = 0x40
+_I2C_CONTINUATION    = 0x80
+
+# The most bytes each I2C driver writes in one block transaction, after the control byte.
+# The Linux driver uses SMBus block writes, which are limited to 32 bytes. A driver can
+# give its own limit with a max_block_size attribute.
+_DEFAULT_CHUNK_SIZE  = 32
+_DRIVER_CHUNK_SIZES  = {"LinuxI2C": 32, "CircuitPythonI2C": 255, "MicroPythonI2C": 255}
+
+# Flush cost model, in bus bytes. Opening a window costs a command transaction with the
+# five page and column address commands, plus the data block transaction header.
+_WINDOW_COMMANDS     = 5
+_BLOCK_HEADER_BYTES  = 2    # address + control byte
+
+# Screen buffer operations used when drawing
+_OP_SET              = 0
+_OP_CLEAR            = 1
+_OP_XOR              = 2
+
+# The bit of each row within a page, and the mask to clear it
+_PAGE_BITS           = tuple(1 << i for i in range(8))
+_PAGE_MASKS          = tuple(~(1 << i) & 0xFF for i in range(8))
+
+# Smallest batch of pixels worth handing to NumPy
+_NUMPY_MIN_BATCH     = 64
+
+# Default overhead of one I2C transaction (start/stop, acks, driver call), in bytes
+_DEFAULT_TRANSACTION_COST = 2
+
+# SSD1306 scroll commands
+_ACTIVATE_SCROLL         = 0x2F
+_LEFT_HORIZONTAL_SCROLL  = 0x27
+_CONTENT_SCROLL_RIGHT    = 0x2C     # scroll the contents of a window one column
+_CONTENT_SCROLL_LEFT     = 0x2D
+
+# The 64 pixel wide panel shows the middle GDDRAM columns, 32-95 - see set_column_address()
+# in the base class
+_GDDRAM_COLUMN_OFFSET    = 32
+
+# The controller needs about two display frames between content scroll commands
+_CONTENT_SCROLL_INTERVAL = 0.02
+
+# The batch of drivers that don't batch writes - one context shared by every flush
+_NO_BATCH                = contextlib.nullcontext()
+
+# NumPy is optional. It's only imported the first time it's needed, since the
+# import is slow on small boards.
+_numpy = None
+
+def _get_numpy():
+
+    global _numpy
+
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+
+    return _numpy if _numpy is not False else None
+
+def _resolve_future(future, error):
+
+    # Complete an asyncio future from display_async() - runs in the future's event loop
+    if future.done():
+        return
+
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(None)
+
+def _percentiles(values):
+
+    # Summary of a list of times in seconds - nearest rank percentiles, in milliseconds
+    if not values:
+        return {"p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+
+    values = sorted(values)
+    summary = {}
+    for pct in (50, 90, 99):
+        summary["p%d" % pct] = values[min(int(math.ceil(pct / 100. * len(values))) - 1, len(values) - 1)] * 1000.
+    summary["max"] = values[-1] * 1000.
+
+    return summary
+
+# Instrumentation (see QwiicMicroOled.set_stats_enabled()). Upper bounds of the latency
+# histogram buckets, in milliseconds - a last bucket holds everything slower.
+_LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1., 2.5, 5., 10., 25., 50., 100., 250., 1000.)
+
+# The drawing calls counted. Only calls made by the user are counted, not the calls
+# they make in turn (the pixel() calls of line(), for example).
+_STATS_DRAW_CALLS = ("pixel", "pixels", "line", "lines", "line_h", "line_v", "rect",
+                     "rect_fill", "circle", "draw_char", "draw_bitmap", "draw_image",
+                     "print", "write", "clear", "blit", "fill_region", "invert_region",
+                     "copy_region", "scroll_buffer")
+
+# The calls timed - display() and begin() as called by the user, and each write of a
+# frame to the device (by display(), or by the background worker)
+_STATS_TIMED_CALLS = {"begin": "begin", "display": "display", "_flush_frame": "flush"}
+
+class _LatencyHistogram(object):
+
+    def __init__(self):
+        self.counts = [0] * (len(_LATENCY_BUCKETS_MS) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+
+        ms = seconds * 1000.
+        iBucket = 0
+        while iBucket < len(_LATENCY_BUCKETS_MS) and ms > _LATENCY_BUCKETS_MS[iBucket]:
+            iBucket += 1
+
+        self.counts[iBucket] += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def summary(self):
+
+        count = sum(self.counts)
+        # the bucket upper bounds - None for the last, unbounded, bucket
+        bounds = list(_LATENCY_BUCKETS_MS) + [None]
+        return {"count": count,
+                "total_ms": self.total,
+                "mean_ms": self.total / count if count else 0.0,
+                "max_ms": self.max,
+                "buckets": [[bound, n] for (bound, n) in zip(bounds, self.counts)]}
+
+class _StatsDriver(object):
+
+    # Stands in for the I2C driver while stats are enabled, counting what is written. With
+    # stats disabled the display object uses the driver directly, so counting costs nothing.
+    def __init__(self, driver):
+
+        self.driver = driver
+        self.reset()
+
+    def reset(self):
+
+        self.commandTransactions = 0
+        self.commandBytes = 0
+        self.dataTransactions = 0
+        self.dataBytes = 0
+        self.busBytes = 0
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+    def _count(self, control, nBytes):
+
+        if control & _I2C_DATA:
+            self.dataTransactions += 1
+            self.dataBytes += nBytes
+        else:
+            self.commandTransactions += 1
+            self.commandBytes += nBytes
+
+        # on the bus, each transaction also sends the device address and the control byte
+        self.busBytes += nBytes + 2
+
+    def writeByte(self, address, commandCode, value):
+        self.driver.writeByte(address, commandCode, value)
+        self._count(commandCode, 1)
+
+    def writeWord(self, address, commandCode, value):
+        self.driver.writeWord(address, commandCode, value)
+        self._count(commandCode, 2)
+
+    def writeBlock(self, address, commandCode, value):
+        self.driver.writeBlock(address, commandCode, value)
+        if commandCode & _I2C_CONTINUATION:
+            self._count_continued(commandCode, value)
+        else:
+            self._count(commandCode, len(value))
+
+    def _count_continued(self, control, value):
+
+        # Commands led by continuation control bytes, maybe followed by data. Each
+        # continuation control byte is followed by one byte, then the next control byte.
+        nBytes = [0, 0]     # command, data
+        i = 0
+        while i < len(value):
+            if control & _I2C_CONTINUATION:
+                nBytes[bool(control & _I2C_DATA)] += 1
+                i += 1
+                if i < len(value):
+                    control = value[i]
+                    i += 1
+            else:
+                nBytes[bool(control & _I2C_DATA)] += len(value) - i
+                break
+
+        # a transaction carrying display data is counted as a data transaction
+        if nBytes[1]:
+            self.dataTransactions += 1
+        else:
+            self.commandTransactions += 1
+        self.commandBytes += nBytes[0]
+        self.dataBytes += nBytes[1]
+        self.busBytes += len(value) + 2
+
+# Fonts are loaded the first time they're used, and shared by every display object in the
+# process. The font files are packaged with the OLED base package.
+_FONT_DIR = os.path.join(os.path.dirname(oled_fonts.__file__), "fonts")
+_FONT_HEADER_SIZE = 6
+
+_fonts = {}
+
+class _SharedFont(object):
+
+    # A font read from one of the packaged font files. It has the same interface as the
+    # base package's OLEDFont, but keeps the font data in a single immutable bytes object.
+    # Each row of a character is font.width bytes - plus a blank byte for fonts one page
+    # high, since those have no margin encoded.
+
+    def __init__(self, fontFile):
+
+        with open(fontFile, "rb") as fp:
+            data = fp.read()
+
+        fHeader = bytearray(data[:_FONT_HEADER_SIZE])
+        self.width      = fHeader[0]
+        self.height     = fHeader[1]
+        self.start_char = fHeader[2]
+        self.total_char = fHeader[3]
+        self.map_width  = fHeader[4]*100 + fHeader[5] #two bytes values into integer 16
+
+        rowsPerChar = int(math.ceil(self.height/8.))
+        self._nRows = self.total_char * rowsPerChar
+
+        fontData = data[_FONT_HEADER_SIZE:_FONT_HEADER_SIZE + self._nRows * self.width]
+        if len(fontData) != self._nRows * self.width:
+            raise ValueError("Error reading font data. File:%s" % fontFile)
+
+        if rowsPerChar == 1:
+            fontData = b"".join(fontData[i:i + self.width] + b"\x00" \
+                                    for i in range(0, len(fontData), self.width))
+            self._lenRow = self.width + 1
+        else:
+            self._lenRow = self.width
+
+        self._fontData = fontData
+
+    # key => the absolute index into the font data rows
+    def __getitem__(self, key):
+
+        if key < 0 or key >= self._nRows:
+            raise IndexError("Index (%d) out of range[0,%d]." % (key, self._nRows))
+
+        iStart = key * self._lenRow
+        return self._fontData[iStart:iStart + self._lenRow]
+
+def _get_font(fontType):
+
+    font = _fonts.get(fontType)
+    if font is None:
+        fontFile = os.path.join(_FONT_DIR, "%d_%s.bin" % (fontType, oled_fonts.font_names()[fontType]))
+        font = _SharedFont(fontFile)
+        _fonts[fontType] = font
+
+    return font
+
+# Glyph strips, shared by all display objects. For each font type and vertical bit
+# shift (0-7), a list with each glyph of the font as a tuple of page strips - the
+# bytes of the glyph's columns that land in each page.
+_glyphStrips = {}
+
+def _get_glyph_strips(fontType, font, shift):
+
+    strips = _glyphStrips.get((fontType, shift))
+    if strips is not None:
+        return strips
+
+    rowsPerChar = max(font.height // 8, 1)
+    charPerRow = font.map_width // font.width
+
+    strips = []
+    for iChar in range(font.total_char):
+
+        # location of the character in the font map - see draw_char() in the base class
+        iStart = (iChar // charPerRow) * charPerRow * rowsPerChar + iChar % charPerRow
+        rows = [bytes(font[iStart + row * charPerRow]) for row in range(rowsPerChar)]
+
+        strips.append(tuple(_shift_strips(rows, shift)))
+
+    _glyphStrips[(fontType, shift)] = strips
+    return strips
+
+def _shift_strips(rows, shift):
+
+    # Shift page strips (the bytes of each page, top page first) down by shift bits. Shifted,
+    # they span one more page - each page gets the bottom of the row above and the top of
+    # its own row.
+    if shift == 0:
+        return list(rows)
+
+    pages = [bytes((b << shift) & 0xFF for b in rows[0])]
+    for row in range(1, len(rows)):
+        pages.append(bytes(((b << shift) | (a >> (8 - shift))) & 0xFF \
+                            for (a, b) in zip(rows[row - 1], rows[row])))
+    pages.append(bytes(a >> (8 - shift) for a in rows[-1]))
+
+    return pages
+
+def _get_strip_masks(nRows, shift):
+
+    # The bits of each page covered by a glyph of nRows pages, shifted down by shift bits
+    if shift == 0:
+        return (0xFF,) * nRows
+
+    return ((0xFF << shift) & 0xFF,) + (0xFF,) * (nRows - 1) + (0xFF >> (8 - shift),)
+
+# Rendered text (see QwiicMicroOled.render_text()), shared by all display objects. A
+# least recently used cache, limited in entries and in bytes of packed bitmaps.
+_TEXT_CACHE_ENTRIES = 128
+_TEXT_CACHE_BYTES   = 64 * 1024
+
+class _TextCache(object):
+
+    def __init__(self, maxEntries, maxBytes):
+
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self._entries = collections.OrderedDict()  # key => (sprite, size)
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+
+        with self._lock:
+            self._entries.clear()
+            self.nBytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get(self, key):
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, sprite, size):
+
+        with self._lock:
+            if key in self._entries:
+                return
+
+            self._entries[key] = (sprite, size)
+            self.nBytes += size
+            self._trim()
+
+    def set_limits(self, maxEntries, maxBytes):
+
+        with self._lock:
+            self.maxEntries = maxEntries
+            self.maxBytes = maxBytes
+            self._trim()
+
+    def _trim(self):
+
+        # drop the least recently used entries until both limits are met
+        while self._entries and (len(self._entries) > self.maxEntries or self.nBytes > self.maxBytes):
+            (_, (_, size)) = self._entries.popitem(last=False)
+            self.nBytes -= size
+            self.evictions += 1
+
+    def stats(self):
+
+        with self._lock:
+            return {"hits": self.hits,
+                    "misses": self.misses,
+                    "evictions": self.evictions,
+                    "entries": len(self._entries),
+                    "bytes": self.nBytes,
+                    "max_entries": self.maxEntries,
+                    "max_bytes": self.maxBytes}
+
+_textCache = _TextCache(_TEXT_CACHE_ENTRIES, _TEXT_CACHE_BYTES)
+
 
 class QwiicMicroOled(QwiicOledBase):
     """
@@ -81,6 +481,10 @@ class QwiicMicroOled(QwiicOledBase):
                         If not provided, the default address is used.
         :param i2c_driver: An existing i2c driver object. If not provided
                         a driver object is created.
+        :param raw_i2c: If True and no driver is given, write plain I2C messages through
+                        /dev/i2c-1 (see qwiic_micro_oled_raw_i2c) - a window of the display in
+                        one message, rather than 32 byte SMBus blocks. Falls back to the qwiic
+                        I2C driver if the bus doesn't support it. Default is False
         :return: The OLED Display device object.
         :rtype: Object
     """
@@ -89,10 +493,2718 @@ class QwiicMicroOled(QwiicOledBase):
     device_name         =_DEFAULT_NAME
     available_addresses = _AVAILABLE_I2C_ADDRESS
 
-    def __init__(self, address=None, i2c_driver=None):
+    # Sprite blit modes, see blit(). The XOR draw mode is also a blit mode, and NORM
+    # is the same as MASK.
+    OR                  = 2
+    AND_NOT             = 3
+    MASK                = 4
+
+    def __init__(self, address=None, i2c_driver=None, raw_i2c=False):
 
         # Did the user specify an I2C address?
         self.address = address if address is not None else self.available_addresses[0]
 
+        if raw_i2c and i2c_driver is None:
+            import qwiic_micro_oled_raw_i2c
+            i2c_driver = qwiic_micro_oled_raw_i2c.get_i2c_driver()
+
         # Instantiate OLED Display Driver - Base Class
-        super().__init__(address, _LCDWIDTH, _LCDHEIGHT, i2c_driver)
\ No newline at end of file
+        super().__init__(address, _LCDWIDTH, _LCDHEIGHT, i2c_driver)
+
+        # The base class returns early if an I2C driver isn't available
+        if self._i2c is None:
+            return
+
+        self._init_screen(self.LCDWIDTH, self.LCDHEIGHT)
+
+        # Largest block write of the I2C driver, see set_chunk_size()
+        self._chunkSize = self._driver_chunk_size()
+
+        # Shadow buffer - a copy of what was last written to the device GDDRAM.
+        # Disabled (None) by default, see set_shadow_mode()
+        self._shadowMode = False
+        self._shadow = None
+        self._mergeGap = 0
+        self.set_flush_cost(_DEFAULT_TRANSACTION_COST)
+
+        # Background display worker, see set_background_display(). The bus lock keeps
+        # the worker's writes from interleaving with other device commands.
+        self._busLock = threading.RLock()
+        self._flushCond = threading.Condition()
+        self._flushWorker = None
+        self._backgroundDisplay = False
+        self._stopFlush = False
+        self._frameSlots = None
+        self._framePending = False
+        self._frameSeq = 0
+        self._doneSeq = 0
+        self._droppedFrames = 0
+        self._flushWaiters = []
+        self._flushError = None
+        self._failedLo = None
+        self._failedHi = None
+
+        # Instrumentation, see set_stats_enabled(). Disabled by default.
+        self._statsDriver = None
+        self._drawCalls = None
+        self._latency = None
+        self._statsDepth = 0
+        self._statsHook = None
+        self._statsSaved = None
+
+        # Time of the last content scroll command, see scroll_content()
+        self._lastContentScroll = 0.0
+
+        # Called with each frame written to the device, see set_frame_hook()
+        self._frameHook = None
+
+    def _init_screen(self, width, height):
+
+        # The screen buffer is a fixed bytearray, written to the device through
+        # memoryview slices - updating the display never copies the buffer. The base
+        # class's buffer (with the logo) is kept if it's the right size.
+        self.LCDWIDTH = int(width)
+        self.LCDHEIGHT = int(height)
+        self._nPages = int(math.ceil(self.LCDHEIGHT/8.))
+
+        if len(self._screenbuffer) == self.LCDWIDTH * self._nPages:
+            self._screenbuffer = bytearray(self._screenbuffer)
+        else:
+            self._screenbuffer = bytearray(self.LCDWIDTH * self._nPages)
+        self._blankBuffer = bytes(len(self._screenbuffer))
+        self._screenView = memoryview(self._screenbuffer)
+
+        # Dirty region tracking. For each display page (a row 8 pixels high), keep
+        # the range of columns [lo, hi) changed since the last call to display().
+        # The buffer starts out with the logo and the device contents are unknown,
+        # so everything is dirty.
+        self._dirtyLo = [0] * self._nPages
+        self._dirtyHi = [self.LCDWIDTH] * self._nPages
+
+    #--------------------------------------------------------------------------
+    def is_connected(self):
+        """
+            Determine if the OLED device is connected to the I2C bus of this display's driver.
+
+            :return: True if the device is connected, otherwise False.
+            :rtype: bool
+
+        """
+        return self._i2c.isDeviceConnected(self.address)
+
+    connected = property(is_connected)
+
+    #--------------------------------------------------------------------------
+    # I2C transport. Commands are sent as command streams - one control byte, then as
+    # many commands as fit in a block write. A window update either sends its address
+    # commands as a stream and then the data, or leads the first data block with them,
+    # each behind a continuation control byte - whichever the cost model makes cheaper.
+
+    def begin(self):
+        """
+            Initialize the operation of the SSD1306 display driver for the OLED module.
+            The init sequence is sent as one command stream.
+
+            :return: No return value
+
+        """
+        self.set_font_type(0)
+        self.set_color(self.WHITE)
+        self.set_draw_modee(self.NORM)
+        self.set_cursor(0, 0)
+
+        commands = [0xAE,                       # display off
+                    0xD5, 0x80,                 # display clock divide ratio - the suggested 0x80
+                    0xA8, self.LCDHEIGHT - 1,   # multiplex ratio
+                    0xD3, 0x00,                 # display offset - none
+                    0x40,                       # start line 0
+                    0x8D, 0x14,                 # enable the charge pump
+                    0xA6,                       # normal (not inverted) display
+                    0xA4,                       # display follows the RAM contents
+                    0xA1,                       # segment remap
+                    0xC8,                       # COM scan direction - decrement
+                    0xDA, 0x02 if len(self._screenbuffer) == 512 else 0x12,   # COM pins - rect (128x32) or square and large
+                    0x81, 0x8F,                 # contrast
+                    0xD9, 0x22,                 # pre-charge period
+                    0xDB, 0x30,                 # VCOMH deselect level
+                    0xAF]                       # display on
+
+        with self._busLock, self._batch():
+            self._send_commands(commands)
+
+        # Erase the controller's memory, so no random data is shown
+        self.clear(self.ALL)
+
+    def set_chunk_size(self, size=None):
+        """
+            Set the most bytes written to the I2C driver in one block transaction (not counting
+            the control byte). By default it's chosen for the driver - 32 bytes for the Linux
+            driver's SMBus block writes, 255 for the CircuitPython and MicroPython drivers.
+
+            :param size: The chunk size in bytes, from 1 to the driver's default, or None to use
+                        the driver's default.
+
+            :return: No return value
+
+        """
+        most = self._driver_chunk_size()
+        if size is None:
+            size = most
+        elif not 1 <= int(size) <= most:
+            raise ValueError("set_chunk_size - the chunk size must be 1 to %d bytes, not %d." % (most, size))
+
+        self._chunkSize = int(size)
+
+    def get_chunk_size(self):
+        """
+            Return the most bytes written to the I2C driver in one block transaction.
+
+            :return: The chunk size, in bytes
+            :rtype: integer
+
+        """
+        return self._chunkSize
+
+    chunk_size = property(get_chunk_size, set_chunk_size)
+
+    def _driver_chunk_size(self):
+
+        driver = self._i2c.driver if isinstance(self._i2c, _StatsDriver) else self._i2c
+
+        size = getattr(driver, "max_block_size", None)
+        if size is None:
+            size = _DRIVER_CHUNK_SIZES.get(type(driver).__name__, _DEFAULT_CHUNK_SIZE)
+
+        return int(size)
+
+    def _batch(self):
+
+        # Drivers that can send many messages in one call (see qwiic_micro_oled_raw_i2c) hold
+        # the writes made in the batch, and send them together at its end
+        batch = getattr(self._i2c, "batch", None)
+        return batch() if batch is not None else _NO_BATCH
+
+    def _send_commands(self, commands):
+
+        for iStart in range(0, len(commands), self._chunkSize):
+            self._i2c.writeBlock(self.address, _I2C_COMMAND, commands[iStart:iStart + self._chunkSize])
+
+    def _send_data(self, data):
+
+        for iStart in range(0, len(data), self._chunkSize):
+            self._i2c.writeBlock(self.address, _I2C_DATA, data[iStart:iStart + self._chunkSize])
+
+    def _window_commands(self, page, column):
+
+        # The page and column address commands of the base class, set_page_address() and
+        # set_column_address()
+        commands = [0x22, page & (self.LCDHEIGHT - 1), self.LCDHEIGHT - 1]
+        if len(self._screenbuffer) == 384:
+            commands += [(0x10 | (column >> 4)) + 0x02, column & 0x0F]
+        else:
+            commands += [0x21, column & (self.LCDWIDTH - 1), self.LCDWIDTH - 1]
+
+        return commands
+
+    def _write_run(self, commands, data):
+
+        # Send the window commands, then the data - in the fewest bus bytes, counting each
+        # transaction's overhead
+        chunk = self._chunkSize
+        nData = len(data)
+        nPrefix = 2 * len(commands)     # commands, their continuation bytes and the data control byte
+        nFirst = min(chunk - nPrefix, nData)
+
+        if nFirst > 0:
+            costSeparate = (1 + (nData + chunk - 1) // chunk) * self._transactionCost + len(commands)
+            costCombined = (1 + (nData - nFirst + chunk - 1) // chunk) * self._transactionCost + nPrefix
+            if costCombined < costSeparate:
+                prefix = bytearray()
+                for command in commands[1:]:
+                    prefix.append(_I2C_CONTINUATION)
+                    prefix.append(command)
+                prefix.append(_I2C_DATA)
+
+                self._i2c.writeBlock(self.address, _I2C_CONTINUATION,
+                                     bytes(commands[:1]) + prefix + data[:nFirst])
+                self._send_data(data[nFirst:])
+                return
+
+        self._send_commands(commands)
+        self._send_data(data)
+
+    #--------------------------------------------------------------------------
+    # Dirty region helpers
+
+    def _mark_dirty(self, x, y, width, height):
+
+        # clip the rectangle to the screen, then widen the range of each page it touches
+        x0 = max(int(x), 0)
+        x1 = min(int(x + width), self.LCDWIDTH)
+        y0 = max(int(y), 0)
+        y1 = min(int(y + height), self.LCDHEIGHT)
+
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        for page in range(y0 // 8, (y1 - 1) // 8 + 1):
+            if x0 < self._dirtyLo[page]:
+                self._dirtyLo[page] = x0
+            if x1 > self._dirtyHi[page]:
+                self._dirtyHi[page] = x1
+
+    def _mark_clean(self):
+
+        self._dirtyLo[:] = [self.LCDWIDTH] * self._nPages
+        self._dirtyHi[:] = [0] * self._nPages
+
+    #--------------------------------------------------------------------------
+    def invalidate(self):
+        """
+            Mark the entire screen buffer as changed, so the next call to display()
+            sends all of it to the device.
+
+            :return: No return value
+
+        """
+        self._dirtyLo[:] = [0] * self._nPages
+        self._dirtyHi[:] = [self.LCDWIDTH] * self._nPages
+
+    #--------------------------------------------------------------------------
+    # Shadow buffer / incremental flush
+
+    def set_shadow_mode(self, enable):
+        """
+            Enable or disable the shadow buffer. When enabled, a copy of the last frame written
+            to the device is kept, and display() only sends the bytes that differ from it.
+
+            :param enable: True to enable the shadow buffer, False to disable it.
+
+            :return: No return value
+
+        """
+        if self._flushWorker is not None:
+            self.wait_display()
+
+        self._shadowMode = bool(enable)
+
+        # The device contents are unknown until the next full write
+        self._shadow = None
+        self.invalidate()
+
+    def get_shadow_mode(self):
+        """
+            Return if the shadow buffer (diff based display updates) is enabled.
+
+            :return: True if the shadow buffer is enabled
+            :rtype: bool
+
+        """
+        return self._shadowMode
+
+    shadow_mode = property(get_shadow_mode, set_shadow_mode)
+
+    def set_flush_cost(self, transaction_cost):
+        """
+            Tune how display() merges changed byte runs when the shadow buffer is enabled.
+            Two runs on a page are sent as one window when resending the unchanged bytes between
+            them costs less than opening another window.
+
+            The cost also decides if a window's address commands are sent in a transaction of
+            their own, or ahead of its data in the first data transaction.
+
+            :param transaction_cost: The overhead of a single I2C transaction, in bytes on the bus.
+                        Raise it when transactions are relatively expensive (fast bus, slow host),
+                        lower it for slow buses. Default is 2.
+
+            :return: No return value
+
+        """
+        windowCost = 2 * (transaction_cost + _BLOCK_HEADER_BYTES) + _WINDOW_COMMANDS
+
+        self._mergeGap = max(int(windowCost), 0)
+
+        # the cost of each transaction in the transport, including the address and control byte
+        self._transactionCost = transaction_cost + _BLOCK_HEADER_BYTES
+
+    def get_flush_cost(self):
+        """
+            Return the largest run of unchanged bytes display() will resend to join two changed runs.
+
+            :return: Merge gap, in bytes
+            :rtype: integer
+
+        """
+        return self._mergeGap
+
+    def _diff_windows(self, frame, page, lo, hi):
+
+        # Split [lo, hi) of the page into the runs that differ from the shadow buffer,
+        # merging runs that are closer than the merge gap.
+        shadow = self._shadow
+        iLine = page * self.LCDWIDTH
+
+        windows = []
+        start = -1
+        end = -1
+        for i in range(iLine + lo, iLine + hi):
+
+            if frame[i] == shadow[i]:
+                continue
+
+            if start < 0:
+                start = i
+            elif i - end > self._mergeGap:
+                windows.append((page, start - iLine, end - iLine))
+                start = i
+            end = i + 1
+
+        if start >= 0:
+            windows.append((page, start - iLine, end - iLine))
+
+        return windows
+
+    def _flush_windows(self, frame, dirtyLo, dirtyHi):
+
+        # List the (page, lo, hi) column windows of the frame that have to be written
+        windows = []
+        for page in range(self._nPages):
+
+            lo = dirtyLo[page]
+            hi = dirtyHi[page]
+            if lo >= hi:
+                continue
+
+            if self._shadow is None:
+                windows.append((page, lo, hi))
+            else:
+                windows.extend(self._diff_windows(frame, page, lo, hi))
+
+        return windows
+
+    def _write_window(self, view, page, lo, hi):
+
+        # set the window once - the column address auto-increments as data is written
+        lineStart = page * self.LCDWIDTH  # offset in the frame for the current page
+        self._write_run(self._window_commands(page, lo), view[lineStart + lo:lineStart + hi])
+
+    def _flush_frame(self, frame, view, dirtyLo, dirtyHi):
+
+        # Write the changed parts of a frame (the screen buffer or a snapshot of it) to the device
+        with self._busLock:
+            try:
+                with self._batch():
+                    for window in self._flush_windows(frame, dirtyLo, dirtyHi):
+                        self._write_window(view, *window)
+            except Exception:
+                # part of the frame may have been written - what the device shows is unknown
+                self._shadow = None
+                raise
+
+            if self._shadowMode:
+                if self._shadow is None:
+                    self._shadow = bytearray(frame)
+                else:
+                    self._shadow[:] = frame
+
+            if self._frameHook is not None:
+                self._frameHook(frame)
+
+    #--------------------------------------------------------------------------
+    # Bulk move the changed parts of the screen buffer to the SSD1306 controller's memory.
+    #
+    # The screen buffer is never copied: the I2C writes are fed memoryview slices of it.
+    # A display() keeps no memory once it returns. The only objects it makes are small
+    # ones, freed before it returns, whose size doesn't depend on the frame: the list of
+    # windows, each window's address commands, the memoryview slices handed to the driver,
+    # and (when commands and data share a transaction) one block of at most the chunk size.
+
+    def display(self):
+        """
+            Display the current screen buffer on the Display device.
+            Only the pages and column ranges changed since the last call are sent to the device.
+            With the shadow buffer enabled, only the bytes that differ from the device are sent.
+
+            With background display enabled (see set_background_display()), the screen buffer
+            is copied and sent to the device by a worker thread, and this call returns right away.
+
+            :return: No return value
+
+        """
+        if self._flushWorker is not None:
+            if self._backgroundDisplay:
+                self._submit_frame()
+                return
+
+            # a frame from display_async() may still be on its way
+            self.wait_display()
+
+        self._flush_frame(self._screenbuffer, self._screenView, self._dirtyLo, self._dirtyHi)
+        self._mark_clean()
+
+    def set_frame_hook(self, hook):
+        """
+            Set a function called with each frame written to the device - by display(), or
+            scroll_content(). It's called as hook(frame), where frame is the page packed
+            screen image (the same layout as the screen buffer). The frame is only valid during
+            the call, so the hook has to copy anything it keeps. With background display
+            enabled, the hook is called from the worker thread.
+
+            :param hook: The hook function, or None to remove it.
+
+            :return: No return value
+
+        """
+        self._frameHook = hook
+
+    #--------------------------------------------------------------------------
+    # Background display - frames are copied and handed to a worker thread that
+    # writes them to the device. If a newer frame arrives before the worker picks up
+    # the pending one, the pending frame is replaced (the latest frame wins) and
+    # its changed regions are carried over to the newer frame.
+
+    def set_background_display(self, enable):
+        """
+            Enable or disable background display. When enabled, display() copies the screen
+            buffer and returns, while a worker thread sends the frame to the device. If display()
+            is called again before the frame is sent, only the newest frame is sent.
+
+            :param enable: True to enable background display, False to disable it.
+
+            :return: No return value
+
+        """
+        self._backgroundDisplay = bool(enable)
+
+        if self._backgroundDisplay:
+            self._start_flush_worker()
+        else:
+            self._stop_flush_worker()
+
+    def get_background_display(self):
+        """
+            Return if background display is enabled.
+
+            :return: True if background display is enabled
+            :rtype: bool
+
+        """
+        return self._backgroundDisplay
+
+    background_display = property(get_background_display, set_background_display)
+
+    def get_dropped_frames(self):
+        """
+            Return the number of frames that were replaced by a newer frame before they were
+            sent to the device (see set_background_display()).
+
+            :return: Number of dropped frames
+            :rtype: integer
+
+        """
+        return self._droppedFrames
+
+    def wait_display(self, timeout=None):
+        """
+            Wait until all frames handed to the background worker are written to the device.
+
+            :param timeout: The longest time to wait, in seconds. If not set, wait until done.
+
+            :return: True if all frames were written, False if the timeout expired
+            :rtype: bool
+
+        """
+        with self._flushCond:
+            done = self._flushCond.wait_for(lambda: self._doneSeq >= self._frameSeq, timeout)
+            self._raise_flush_error()
+
+        return done
+
+    async def display_async(self):
+        """
+            Display the current screen buffer on the Display device, without blocking the
+            asyncio event loop. The screen buffer is copied and sent to the device by a worker
+            thread. Completes when the frame - or a newer frame that replaced it - has been written.
+
+            :return: No return value
+
+        """
+        import asyncio
+
+        self._start_flush_worker()
+        seq = self._submit_frame()
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._flushCond:
+            if self._doneSeq >= seq:
+                self._raise_flush_error()
+                return
+            self._flushWaiters.append((seq, loop, future))
+
+        await future
+
+    def _start_flush_worker(self):
+
+        if self._flushWorker is not None:
+            return
+
+        # Two frame snapshots - the pending frame, and the one being written
+        self._frameSlots = []
+        for _ in range(2):
+            frame = bytearray(len(self._screenbuffer))
+            self._frameSlots.append((frame, memoryview(frame),
+                                        [self.LCDWIDTH] * self._nPages, [0] * self._nPages))
+
+        # The regions of frames that failed to be written, until the error is raised
+        self._failedLo = [self.LCDWIDTH] * self._nPages
+        self._failedHi = [0] * self._nPages
+
+        self._stopFlush = False
+        self._flushWorker = threading.Thread(target=self._flush_worker, name="QwiicMicroOled display")
+        self._flushWorker.daemon = True
+        self._flushWorker.start()
+
+    def _stop_flush_worker(self):
+
+        if self._flushWorker is None:
+            return
+
+        with self._flushCond:
+            self._stopFlush = True
+            self._flushCond.notify_all()
+
+        self._flushWorker.join()
+        self._flushWorker = None
+
+        with self._flushCond:
+            self._raise_flush_error()
+
+    def _submit_frame(self):
+
+        # Copy the screen buffer into the pending frame, and wake up the worker
+        with self._flushCond:
+            self._raise_flush_error()
+
+            (frame, _, pendingLo, pendingHi) = self._frameSlots[0]
+            frame[:] = self._screenbuffer
+
+            if self._framePending:
+                # replace the stale frame - and keep the regions it would have updated
+                self._droppedFrames += 1
+                for page in range(self._nPages):
+                    pendingLo[page] = min(pendingLo[page], self._dirtyLo[page])
+                    pendingHi[page] = max(pendingHi[page], self._dirtyHi[page])
+            else:
+                pendingLo[:] = self._dirtyLo
+                pendingHi[:] = self._dirtyHi
+                self._framePending = True
+
+            self._frameSeq += 1
+            seq = self._frameSeq
+            self._flushCond.notify_all()
+
+        self._mark_clean()
+        return seq
+
+    def _flush_worker(self):
+
+        while True:
+            with self._flushCond:
+                self._flushCond.wait_for(lambda: self._framePending or self._stopFlush)
+                if not self._framePending:
+                    return
+
+                # take the pending frame - the other slot is free for the next one
+                self._frameSlots.reverse()
+                self._framePending = False
+                seq = self._frameSeq
+
+            (frame, view, dirtyLo, dirtyHi) = self._frameSlots[1]
+            error = None
+            try:
+                self._flush_frame(frame, view, dirtyLo, dirtyHi)
+            except Exception as exError: # pylint: disable=broad-except
+                error = exError
+
+            with self._flushCond:
+                self._doneSeq = seq
+                if error is not None:
+                    self._flushError = error
+                    for page in range(self._nPages):
+                        self._failedLo[page] = min(self._failedLo[page], dirtyLo[page])
+                        self._failedHi[page] = max(self._failedHi[page], dirtyHi[page])
+
+                waiters = [waiter for waiter in self._flushWaiters if waiter[0] <= seq]
+                self._flushWaiters = [waiter for waiter in self._flushWaiters if waiter[0] > seq]
+                self._flushCond.notify_all()
+
+            for (_, loop, future) in waiters:
+                loop.call_soon_threadsafe(_resolve_future, future, error)
+
+    def _raise_flush_error(self):
+
+        # An error from the worker thread is raised in the caller's thread. Call with _flushCond held.
+        # The regions of the failed frames are marked dirty again, so the next display() resends them.
+        error = self._flushError
+        if error is not None:
+            self._flushError = None
+            for page in range(self._nPages):
+                self._dirtyLo[page] = min(self._dirtyLo[page], self._failedLo[page])
+                self._dirtyHi[page] = max(self._dirtyHi[page], self._failedHi[page])
+            self._failedLo[:] = [self.LCDWIDTH] * self._nPages
+            self._failedHi[:] = [0] * self._nPages
+            raise error
+
+    #--------------------------------------------------------------------------
+    # Instrumentation - opt in counters of the I2C traffic and drawing calls, and
+    # latency histograms. While enabled, the I2C driver is wrapped by a counting driver
+    # and the counted methods are wrapped on this object. Disabling removes the wrappers,
+    # so there's no cost at all when stats aren't in use.
+
+    def set_stats_enabled(self, enable):
+        """
+            Enable or disable stats collection. When enabled, the display object counts the I2C
+            transactions and bytes it writes (command and data), the display() calls and the
+            drawing calls by type, and keeps latency histograms of begin(), display() and of
+            each frame written to the device. Enabling stats resets them.
+
+            :param enable: True to enable stats, False to disable them.
+
+            :return: No return value
+
+        """
+        enable = bool(enable)
+        if enable == self.get_stats_enabled():
+            return
+
+        # the background worker must be idle while the driver and methods are swapped
+        if self._flushWorker is not None:
+            self.wait_display()
+
+        with self._busLock:
+            if enable:
+                self._statsDriver = _StatsDriver(self._i2c)
+                self._i2c = self._statsDriver
+                self.reset_stats()
+
+                self._statsSaved = {}
+                for name in _STATS_DRAW_CALLS + tuple(_STATS_TIMED_CALLS):
+                    self._statsSaved[name] = self.__dict__.get(name)
+                    method = getattr(self, name)
+                    if name in _STATS_TIMED_CALLS:
+                        setattr(self, name, self._stats_timed_call(_STATS_TIMED_CALLS[name], method))
+                    else:
+                        setattr(self, name, self._stats_draw_call(name, method))
+            else:
+                self._i2c = self._statsDriver.driver
+                self._statsDriver = None
+
+                for (name, saved) in self._statsSaved.items():
+                    if saved is None:
+                        delattr(self, name)
+                    else:
+                        setattr(self, name, saved)
+                self._statsSaved = None
+
+    def get_stats_enabled(self):
+        """
+            Return if stats collection is enabled.
+
+            :return: True if stats are enabled
+            :rtype: bool
+
+        """
+        return self._statsDriver is not None
+
+    stats_enabled = property(get_stats_enabled, set_stats_enabled)
+
+    def stats(self):
+        """
+            Return the stats collected since they were enabled or last reset.
+
+            The latency histograms (begin_latency, display_latency and flush_latency) have
+            the number of calls, their total, mean and max time in milliseconds, and a list
+            of [upper bound in ms, count] buckets. The last bucket's upper bound is None.
+
+            :return: A dictionary of the stats, or None if stats are not enabled
+            :rtype: dict
+
+        """
+        driver = self._statsDriver
+        if driver is None:
+            return None
+
+        return {"transactions": driver.commandTransactions + driver.dataTransactions,
+                "command_transactions": driver.commandTransactions,
+                "command_bytes": driver.commandBytes,
+                "data_transactions": driver.dataTransactions,
+                "data_bytes": driver.dataBytes,
+                "bus_bytes": driver.busBytes,
+                "display_calls": sum(self._latency["display"].counts),
+                "draw_calls": dict(self._drawCalls),
+                "begin_latency": self._latency["begin"].summary(),
+                "display_latency": self._latency["display"].summary(),
+                "flush_latency": self._latency["flush"].summary()}
+
+    def reset_stats(self):
+        """
+            Reset all the stats counters and histograms to zero.
+
+            :return: No return value
+
+        """
+        if self._statsDriver is None:
+            return
+
+        self._statsDriver.reset()
+        self._drawCalls = dict((name, 0) for name in _STATS_DRAW_CALLS)
+        self._latency = dict((event, _LatencyHistogram()) for event in _STATS_TIMED_CALLS.values())
+
+    def set_stats_hook(self, hook):
+        """
+            Set a function called after each timed call while stats are enabled, for
+            forwarding the numbers to a metrics system. It's called as
+            hook(event, seconds, bus_bytes), where event is "begin", "display" or "flush"
+            (a frame written to the device), seconds is the call's latency, and bus_bytes the
+            bytes it wrote to the I2C bus. With background display enabled, "flush" events
+            are reported from the worker thread.
+
+            :param hook: The hook function, or None to remove it.
+
+            :return: No return value
+
+        """
+        self._statsHook = hook
+
+    def _stats_draw_call(self, name, method):
+
+        def draw_call(*args, **kwargs):
+            # only count the outermost drawing call
+            if self._statsDepth:
+                return method(*args, **kwargs)
+
+            self._drawCalls[name] += 1
+            self._statsDepth += 1
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._statsDepth -= 1
+
+        return draw_call
+
+    def _stats_timed_call(self, name, method):
+
+        def timed_call(*args, **kwargs):
+            driver = self._statsDriver
+            nBytes = driver.busBytes
+            tStart = time.perf_counter()
+
+            # drawing done by begin() isn't counted. The flush worker thread can't touch the
+            # depth, but it never draws.
+            nested = name != "flush"
+            if nested:
+                self._statsDepth += 1
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                if nested:
+                    self._statsDepth -= 1
+
+            latency = time.perf_counter() - tStart
+            self._latency[name].record(latency)
+
+            hook = self._statsHook
+            if hook is not None:
+                hook(name, latency, driver.busBytes - nBytes)
+
+            return result
+
+        return timed_call
+
+    #--------------------------------------------------------------------------
+    # Animation scheduler - runs a render function at a fixed frame rate
+
+    def run_animation(self, render_fn, fps=30, frames=None, duration=None):
+        """
+            Run an animation at a fixed frame rate. Each frame, render_fn draws into the screen
+            buffer and the screen buffer is displayed. The time left in the frame is slept. When
+            behind schedule, frames are skipped (not rendered) to catch up.
+
+            The animation runs until render_fn returns False, the number of frames or the
+            duration is reached, or the render function raises an exception.
+
+            :param render_fn: Function called as render_fn(oled, frame) to draw each frame. frame
+                        is the scheduled frame number, counting skipped frames - so motion based on
+                        it keeps to time.
+            :param fps: The frame rate, in frames per second. Default is 30
+            :param frames: Stop after this many scheduled frames. If not set, there is no limit.
+            :param duration: Stop after this many seconds. If not set, there is no limit.
+
+            :return: Statistics of the run - frames displayed and dropped, the achieved frame
+                        rate, and percentiles of the render time, display time and the frame
+                        start jitter (lateness), in milliseconds.
+            :rtype: dict
+
+        """
+        period = 1.0 / fps
+        renderTimes = []
+        displayTimes = []
+        jitters = []
+        nDropped = 0
+
+        tStart = time.perf_counter()
+        frame = 0
+        while True:
+
+            if frames is not None and frame >= frames:
+                break
+
+            deadline = tStart + frame * period
+            now = time.perf_counter()
+            if duration is not None and now - tStart >= duration:
+                break
+
+            # more than a frame behind - skip the frames that were missed
+            if now - deadline >= period:
+                nMissed = int((now - deadline) / period)
+                if frames is not None:
+                    nMissed = min(nMissed, frames - frame)
+                nDropped += nMissed
+                frame += nMissed
+                continue
+
+            jitters.append(now - deadline)
+
+            result = render_fn(self, frame)
+            tRendered = time.perf_counter()
+            renderTimes.append(tRendered - now)
+            if result is False:
+                break
+
+            self.display()
+            tDisplayed = time.perf_counter()
+            displayTimes.append(tDisplayed - tRendered)
+
+            frame += 1
+            tSleep = tStart + frame * period - tDisplayed
+            if tSleep > 0:
+                time.sleep(tSleep)
+
+        elapsed = time.perf_counter() - tStart
+
+        return {
+            "frames":       len(displayTimes),
+            "dropped":      nDropped,
+            "fps":          len(displayTimes) / elapsed if elapsed > 0 else 0.0,
+            "target_fps":   fps,
+            "render_ms":    _percentiles(renderTimes),
+            "display_ms":   _percentiles(displayTimes),
+            "jitter_ms":    _percentiles(jitters),
+        }
+
+    #--------------------------------------------------------------------------
+    def clear(self, mode, value=0):
+        """
+            Clear the display on the OLED Device.
+
+            :param mode: To clear GDRAM inside the LCD controller, pass in the variable mode = ALL,
+                 and to clear screen page buffer pass in the variable mode = PAGE.
+            :param value: The value to clear the screen to. Default value is 0
+
+            :return: No return value
+
+        """
+        if mode == self.ALL:
+            if self._flushWorker is not None:
+                self.wait_display()
+
+            # Write each of the controller's 8 pages (128 columns)
+            fill = bytes((value & 0xFF,)) * 0x80
+            with self._busLock, self._batch():
+                for i in range(8):
+                    self._write_run(self._window_commands(i, 0), fill)
+        elif value == 0:
+            self._screenbuffer[:] = self._blankBuffer
+        else:
+            self._screenbuffer[:] = bytes((value & 0xFF,)) * len(self._screenbuffer)
+
+        # Either the buffer changed (PAGE), or the device memory no longer matches it (ALL)
+        self.invalidate()
+
+        # After clearing the device memory, its contents are known again
+        if mode == self.ALL and self._shadowMode:
+            self._shadow = bytearray([value & 0xFF]) * len(self._screenbuffer)
+
+    #--------------------------------------------------------------------------
+    # Draw color pixel in the screen buffer's x,y position with NORM or XOR draw mode.
+    #
+    # All the drawing primitives of the base class (line, rect, rect_fill, circle, draw_char)
+    # end up here, so this is where their dirty regions are tracked.
+
+    def pixel(self, x, y, color=None, mode=None):
+        """
+            Draw a pixel at a given position, with a given color. Pixel copy mode is
+            either Normal (source copy) or XOR
+
+            :param x: The X position on the display
+            :param y: The Y position on the display
+            :param color: The color to draw. If not set, the default foreground color is used.
+            :param mode: The mode to draw the pixl to the screen bufffer. Value can be either
+                        XOR or NORM. Default is NORM
+
+            :return: No return value
+
+        """
+        if color is None:
+            color = self.foreColor
+
+        if mode is None:
+            mode = self.drawMode
+
+        if  x < 0 or  x >= self.LCDWIDTH or y < 0 or y >= self.LCDHEIGHT:
+            return
+
+        x = int(x)
+        y = int(y)
+        page = y >> 3
+        index = x + page*self.LCDWIDTH
+
+        if mode == self.XOR:
+            if color != self.WHITE:
+                return
+            self._screenbuffer[index] ^= (1 << (y & 7))
+
+        elif color == self.WHITE:
+            self._screenbuffer[index] |= (1 << (y & 7))
+        else:
+            self._screenbuffer[index] &= (~(1 << (y & 7)) & 0xff)
+
+        if x < self._dirtyLo[page]:
+            self._dirtyLo[page] = x
+        if x >= self._dirtyHi[page]:
+            self._dirtyHi[page] = x + 1
+
+    #--------------------------------------------------------------------------
+    # Batched drawing. Coordinates are rounded and clipped once per call, then
+    # the pixels are written straight into the screen buffer.
+
+    def _draw_op(self, color, mode):
+
+        # Map a color and draw mode to a buffer operation - None if nothing is drawn
+        if color is None:
+            color = self.foreColor
+
+        if mode is None:
+            mode = self.drawMode
+
+        if mode == self.XOR:
+            return _OP_XOR if color == self.WHITE else None
+
+        return _OP_SET if color == self.WHITE else _OP_CLEAR
+
+    def pixels(self, xs, ys, color=None, mode=None):
+        """
+            Draw a set of pixels with a given color. Pixel copy mode is either Normal (source copy) or XOR.
+            Coordinates are rounded to the nearest pixel, and pixels off the screen are skipped.
+
+            :param xs: Sequence (or NumPy array) of the X positions of the pixels
+            :param ys: Sequence (or NumPy array) of the Y positions of the pixels
+            :param color: The color to draw. If not set, the default foreground color is used.
+            :param mode: The mode to draw the pixels to the screen bufffer. Value can be either
+                        XOR or NORM. Default is NORM
+
+            :return: No return value
+
+        """
+        op = self._draw_op(color, mode)
+        if op is None:
+            return
+
+        # NumPy pays off for arrays and for large batches
+        np = _get_numpy()
+        if np is not None and (hasattr(xs, "ndim") or len(xs) >= _NUMPY_MIN_BATCH):
+            self._pixels_numpy(np, xs, ys, op)
+            return
+
+        buf = self._screenbuffer
+        lenLine = self.LCDWIDTH
+        lenHeight = self.LCDHEIGHT
+        dirtyLo = self._dirtyLo
+        dirtyHi = self._dirtyHi
+        bits = _PAGE_BITS if op != _OP_CLEAR else _PAGE_MASKS
+
+        for (x, y) in zip(xs, ys):
+
+            if x.__class__ is not int:
+                x = int(round(x))
+            if y.__class__ is not int:
+                y = int(round(y))
+            if x < 0 or x >= lenLine or y < 0 or y >= lenHeight:
+                continue
+
+            page = y >> 3
+            index = x + page*lenLine
+            if op == _OP_SET:
+                buf[index] |= bits[y & 7]
+            elif op == _OP_CLEAR:
+                buf[index] &= bits[y & 7]
+            else:
+                buf[index] ^= bits[y & 7]
+
+            if x < dirtyLo[page]:
+                dirtyLo[page] = x
+            if x >= dirtyHi[page]:
+                dirtyHi[page] = x + 1
+
+    def _pixels_numpy(self, np, xs, ys, op):
+
+        xs = np.rint(np.asarray(xs, dtype=float)).astype(np.intp).ravel()
+        ys = np.rint(np.asarray(ys, dtype=float)).astype(np.intp).ravel()
+
+        onScreen = (xs >= 0) & (xs < self.LCDWIDTH) & (ys >= 0) & (ys < self.LCDHEIGHT)
+        xs = xs[onScreen]
+        ys = ys[onScreen]
+        if len(xs) == 0:
+            return
+
+        pages = ys >> 3
+        index = xs + pages*self.LCDWIDTH
+        bits = np.left_shift(1, ys & 7).astype(np.uint8)
+
+        # ufunc.at applies repeated indices one after the other, like pixel() calls would
+        screen = np.frombuffer(self._screenbuffer, dtype=np.uint8)
+        if op == _OP_SET:
+            np.bitwise_or.at(screen, index, bits)
+        elif op == _OP_CLEAR:
+            np.bitwise_and.at(screen, index, ~bits)
+        else:
+            np.bitwise_xor.at(screen, index, bits)
+
+        lo = np.full(self._nPages, self.LCDWIDTH, dtype=np.intp)
+        hi = np.zeros(self._nPages, dtype=np.intp)
+        np.minimum.at(lo, pages, xs)
+        np.maximum.at(hi, pages, xs + 1)
+        for page in range(self._nPages):
+            if lo[page] < self._dirtyLo[page]:
+                self._dirtyLo[page] = int(lo[page])
+            if hi[page] > self._dirtyHi[page]:
+                self._dirtyHi[page] = int(hi[page])
+
+    def lines(self, segments, color=None, mode=None):
+        """
+            Draw a set of lines with a given color. Pixel copy mode is either Normal (source copy) or XOR.
+            The end points are rounded to the nearest pixel, and each line is drawn like line() does.
+
+            :param segments: Sequence of (x0, y0, x1, y1) line segments, or a NumPy array of shape (N, 4)
+            :param color: The color to draw. If not set, the default foreground color is used.
+            :param mode: The mode to draw the lines to the screen bufffer. Value can be either
+                        XOR or NORM. Default is NORM
+
+            :return: No return value
+
+        """
+        op = self._draw_op(color, mode)
+        if op is None:
+            return
+
+        if hasattr(segments, "ndim"):
+            np = _get_numpy()
+            segments = np.rint(np.asarray(segments, dtype=float)).astype(np.intp).reshape(-1, 4).tolist()
+        else:
+            segments = [(int(round(x0)), int(round(y0)), int(round(x1)), int(round(y1))) \
+                            for (x0, y0, x1, y1) in segments]
+
+        for (x0, y0, x1, y1) in segments:
+            self._raster_line(x0, y0, x1, y1, op)
+
+    # pylint: disable=too-many-locals, too-many-branches
+    def _raster_line(self, x0, y0, x1, y1, op):
+
+        # Integer Bresenham, giving the same pixels as line(). The range of steps that
+        # lands on the screen is solved for up front, so the loop has no bounds checks.
+        steep = abs(y1 - y0) > abs(x1 - x0)
+        if steep:
+            (x0, y0) = (y0, x0)
+            (x1, y1) = (y1, x1)
+
+        if x0 > x1:
+            (x0, x1) = (x1, x0)
+            (y0, y1) = (y1, y0)
+
+        dx = x1 - x0
+        dy = abs(y1 - y0)
+        ystep = 1 if y0 < y1 else -1
+        (lenMajor, lenMinor) = (self.LCDHEIGHT, self.LCDWIDTH) if steep else (self.LCDWIDTH, self.LCDHEIGHT)
+
+        # Step k draws (x0 + k, y0 + ystep*n(k)), where n(k) = -((dx//2 - k*dy) // dx) is the
+        # number of minor axis steps taken so far. Clip k to the major axis ...
+        kLo = max(0, -x0)
+        kHi = min(dx, lenMajor - x0)
+
+        # ... and to the minor axis, where n(k) has to stay in [nLo, nHi]
+        (nLo, nHi) = (-y0, lenMinor - 1 - y0) if ystep > 0 else (y0 - lenMinor + 1, y0)
+        c = dx // 2
+        if dy == 0:
+            if nLo > 0 or nHi < 0:
+                return
+        else:
+            if nLo > 0:
+                kLo = max(kLo, (c + (nLo - 1)*dx) // dy + 1)
+            kHi = min(kHi, (c + nHi*dx) // dy + 1)
+
+        if kLo >= kHi:
+            return
+
+        n = -((c - kLo*dy) // dx)
+        err = c - kLo*dy + n*dx
+        y = y0 + ystep*n
+
+        buf = self._screenbuffer
+        lenLine = self.LCDWIDTH
+        bits = _PAGE_BITS if op != _OP_CLEAR else _PAGE_MASKS
+
+        for x in range(x0 + kLo, x0 + kHi):
+
+            (px, py) = (y, x) if steep else (x, y)
+            index = px + (py >> 3)*lenLine
+            if op == _OP_SET:
+                buf[index] |= bits[py & 7]
+            elif op == _OP_CLEAR:
+                buf[index] &= bits[py & 7]
+            else:
+                buf[index] ^= bits[py & 7]
+
+            err -= dy
+            if err < 0:
+                y += ystep
+                err += dx
+
+        # mark the bounding box of the drawn pixels
+        (xa, xb) = (x0 + kLo, x0 + kHi - 1)
+        ya = y0 + ystep*n
+        yb = y0 + ystep*(-((c - (kHi - 1)*dy) // dx))
+        if steep:
+            (xa, xb, ya, yb) = (ya, yb, xa, xb)
+        self._mark_dirty(min(xa, xb), min(ya, yb), abs(xb - xa) + 1, abs(yb - ya) + 1)
+    # pylint: enable=too-many-locals, too-many-branches
+
+    #--------------------------------------------------------------------------
+    # Set the current font type number, ie changing to different fonts base on the type provided.
+
+    def set_font_type(self, font_type):
+        """
+            Set the current font type number, ie changing to different fonts base on the type provided.
+            A font is loaded the first time it's used, and then shared by all displays.
+
+            :param type: The type to set the font to.
+            :return: True if the font was set, otherwise False
+
+        """
+        if font_type >= self.nFonts or font_type < 0:
+            return False
+
+        self.fontType = font_type
+        self._font = _get_font(font_type)
+
+        return True
+
+    font_type = property(QwiicOledBase.get_font_type, set_font_type)
+
+    #--------------------------------------------------------------------------
+    # Byte level drawing - used to blit pre-packed data into the screen buffer
+
+    def _blit_bytes(self, index, data, mask, op):
+
+        # Write data into the screen buffer at index, changing only the bits in mask
+        # (the same for every byte). Data bits outside of mask must be zero. The bytes
+        # are combined as one large integer, so the work is done in C.
+        n = len(data)
+        end = index + n
+        buf = self._screenbuffer
+
+        if mask == 0xFF and op != _OP_XOR:
+            buf[index:end] = data if op == _OP_SET else bytes(n)
+            return
+
+        old = int.from_bytes(buf[index:end], "little")
+        if op == _OP_XOR:
+            new = old ^ int.from_bytes(data, "little")
+        else:
+            new = old & (((~mask & 0xFF) * ((1 << (8*n)) - 1)) // 0xFF)
+            if op == _OP_SET:
+                new |= int.from_bytes(data, "little")
+
+        buf[index:end] = new.to_bytes(n, "little")
+
+    #--------------------------------------------------------------------------
+    # Draw character c using color and draw mode at x,y.
+    #
+    # The glyph is copied from pre-packed page strips (see _get_glyph_strips()) a page
+    # at a time, instead of pixel by pixel.
+
+    def draw_char(self, x, y, c, color=None, mode=None):
+        """
+            Draw character c using color and draw mode at x,y. Pixel copy mode is either Normal (source copy) or XOR
+
+            :param x: The X position on the display
+            :param y: The Y position on the display
+            :param c: The character to draw
+            :param color: The color to draw. If not set, the default foreground color is used.
+            :param mode: The mode to draw the pixl to the screen bufffer. Value can be either XOR or NORM. Default is NORM
+
+            :return: No return value
+
+        """
+        if color is None:
+            color = self.foreColor
+
+        if mode is None:
+            mode = self.drawMode
+
+        font = self._font
+        if font is None:
+            return
+
+        if isinstance(c, str):
+            c = ord(c)
+
+        if c < font.start_char or c > (font.start_char + font.total_char - 1): # no bitmap for the required c
+            return
+
+        # The glyph background is drawn with the inverse of color - only an odd color value
+        # makes that WHITE. Leave that case to the pixel by pixel version.
+        if (~color & 0xFF) == self.WHITE:
+            super().draw_char(x, y, c, color, mode)
+            return
+
+        # In NORM mode, the character cell is replaced (WHITE) or cleared. In XOR mode,
+        # only a WHITE glyph changes anything.
+        if mode == self.XOR:
+            if color != self.WHITE:
+                return
+            op = _OP_XOR
+        else:
+            op = _OP_SET if color == self.WHITE else _OP_CLEAR
+
+        x = int(x)
+        y = int(y)
+        shift = y & 7
+        strips = _get_glyph_strips(self.fontType, font, shift)[c - font.start_char]
+        nRows = max(font.height // 8, 1)
+        masks = _get_strip_masks(nRows, shift)
+
+        # clip the columns to the screen
+        lenChar = len(strips[0])
+        c0 = max(-x, 0)
+        c1 = min(lenChar, self.LCDWIDTH - x)
+        if c0 >= c1:
+            return
+
+        # the rows of the last page below the screen's last row are clipped too
+        lastPage = self._nPages - 1
+        lastRows = self._page_masks(0, self.LCDHEIGHT, lastPage, self._nPages)[0]
+
+        pageTop = y >> 3
+        for (i, strip) in enumerate(strips):
+
+            page = pageTop + i
+            if page < 0 or page > lastPage:
+                continue
+
+            if c0 > 0 or c1 < lenChar:
+                strip = strip[c0:c1]
+
+            mask = masks[i]
+            if page == lastPage and lastRows != 0xFF:
+                strip = bytes(b & lastRows for b in strip)
+                mask &= lastRows
+
+            self._blit_bytes(page*self.LCDWIDTH + x + c0, strip, mask, op)
+
+        self._mark_dirty(x + c0, y, c1 - c0, nRows*8)
+
+    #--------------------------------------------------------------------------
+    # Rendered text. A line of text is rendered once into a sprite - its glyph strips
+    # side by side - and kept in a cache shared by all display objects. print() blits
+    # the cached sprites, so printing the same text again is a copy per page row.
+
+    def render_text(self, text, font_type=None):
+        """
+            Render a line of text into a sprite, the way print() draws it: each character cell
+            is the font width wide, followed by a blank column. The sprite's mask covers the
+            character cells, so a MASK mode blit replaces them like print() does. Results are
+            cached - see get_text_cache_stats().
+
+            :param text: The text to render. Characters not in the font are left blank.
+            :param font_type: The font to use. Default is the current font
+
+            :return: The rendered text - its width is the sprite's width
+            :rtype: Sprite
+
+        """
+        if font_type is None:
+            font_type = self.fontType
+
+        if not isinstance(text, (bytes, bytearray)):
+            text = bytearray(str(text), encoding='ascii')
+
+        key = (font_type, bytes(text))
+        sprite = _textCache.get(key)
+        if sprite is not None:
+            return sprite
+
+        font = _get_font(font_type)
+        strips = _get_glyph_strips(font_type, font, 0)
+        nRows = len(strips[0])
+        lenStrip = len(strips[0][0])
+        advance = font.width + 1
+
+        pages = [bytearray() for _ in range(nRows)]
+        masks = [bytearray() for _ in range(nRows)]
+        for c in bytearray(text):
+            iGlyph = c - font.start_char
+            known = 0 <= iGlyph < font.total_char
+            for row in range(nRows):
+                pages[row] += strips[iGlyph][row] if known else bytes(lenStrip)
+                pages[row] += bytes(advance - lenStrip)
+                masks[row] += (b"\xFF" if known else b"\x00") * lenStrip
+                masks[row] += bytes(advance - lenStrip)
+
+        sprite = Sprite(len(text) * advance, nRows * 8, b"".join(pages), b"".join(masks))
+        _textCache.put(key, sprite, 2 * len(text) * advance * nRows)
+
+        return sprite
+
+    def get_text_cache_stats(self):
+        """
+            Return the counters and limits of the rendered text cache, which is shared by all
+            display objects.
+
+            :return: Dictionary with the cache hits, misses, evictions, the number of entries
+                        and their size in bytes, and the max_entries and max_bytes limits
+            :rtype: dict
+
+        """
+        return _textCache.stats()
+
+    def set_text_cache_limits(self, max_entries=_TEXT_CACHE_ENTRIES, max_bytes=_TEXT_CACHE_BYTES):
+        """
+            Set the limits of the rendered text cache, which is shared by all display objects.
+            The least recently used entries are dropped to stay within them.
+
+            :param max_entries: The most rendered strings kept. Default is 128
+            :param max_bytes: The most bytes of rendered bitmaps kept. Default is 65536
+
+            :return: No return value
+
+        """
+        _textCache.set_limits(max(int(max_entries), 0), max(int(max_bytes), 0))
+
+    def clear_text_cache(self):
+        """
+            Empty the rendered text cache and reset its counters.
+
+            :return: No return value
+
+        """
+        _textCache.clear()
+
+    #--------------------------------------------------------------------------
+    def print(self, text):
+        """
+            Print a line of text on the display using the current font,
+            starting at the current position.
+
+            :param text: The line of text to write.
+
+            :return: No return value
+
+        """
+        # a list or array? If not, make it one
+        if not hasattr(text, '__len__'): # scalar?
+            text = str(text)
+
+        if isinstance(text, str):
+            text = bytearray(text, encoding='ascii')
+
+        # The cached text only covers WHITE text. Other colors clear the character cells
+        # or draw nothing - leave those to write().
+        font = self._font
+        if font is None or self.foreColor != self.WHITE:
+            for curr in text:
+                self.write(curr)
+            return
+
+        mode = self.XOR if self.drawMode == self.XOR else self.MASK
+        advance = font.width + 1
+        lastX = self.LCDWIDTH - font.width
+        text = bytes(bytearray(text))
+
+        # Print the text a line at a time - write() starts a new line once the cursor is
+        # past the last position a character fits
+        i = 0
+        while i < len(text):
+            nFit = max((lastX - self.cursorX) // advance + 1, 1)
+            line = text[i:i + nFit]
+            self.blit(self.render_text(line), self.cursorX, self.cursorY, mode)
+            i += len(line)
+
+            self.cursorX += len(line) * advance
+            if self.cursorX > lastX:
+                self.cursorY += font.height
+                self.cursorX = 0
+
+    #--------------------------------------------------------------------------
+    def draw_bitmap(self, bitArray):
+        """
+            Draw Bitmap image on screen.
+            To use, create int array that is 64x48 pixels (384 bytes). Then call .draw_bitmap and pass it the array.
+
+            :param bitArray: The bitmap to draw
+            :return: No return value
+
+        """
+        if len(bitArray) != len(self._screenbuffer):
+            print("draw_bitmap - Invalid Input size.", file=sys.stderr)
+            return
+
+        self._screenbuffer[:] = bitArray
+        self.invalidate()
+
+    #--------------------------------------------------------------------------
+    # Draw an image or 2D array into the screen buffer, packing it into the page layout
+    # with array operations instead of per pixel calls.
+
+    def draw_image(self, image, x=0, y=0, threshold=128):
+        """
+            Draw an image on the screen buffer at the given position. The image replaces the
+            screen buffer contents within its bounds, and is clipped to the screen.
+
+            :param image: The image to draw. Either a 2D NumPy array (bool or integer values),
+                        a 2D sequence of values (requires NumPy), or a PIL Image.
+            :param x: The X position of the image's left edge. Default is 0
+            :param y: The Y position of the image's top edge. Default is 0
+            :param threshold: Integer pixel values equal to or above this are drawn WHITE,
+                        values below are BLACK. Not used for bool arrays. Default is 128
+
+            :return: No return value
+
+        """
+        np = _get_numpy()
+        isPIL = hasattr(image, "mode") and hasattr(image, "convert")
+
+        if np is None:
+            if not isPIL:
+                raise TypeError("draw_image - NumPy is required to draw arrays.")
+
+            self._draw_pil_image(image, int(x), int(y), threshold)
+            return
+
+        if isPIL:
+            if image.mode != "1":
+                image = image.convert("L")
+            pixels = np.asarray(image)
+        else:
+            pixels = np.asarray(image)
+
+        if pixels.ndim != 2:
+            raise ValueError("draw_image - image must be two dimensional.")
+
+        if pixels.dtype != np.bool_:
+            pixels = pixels >= threshold
+
+        x = int(x)
+        y = int(y)
+        rect = self._image_rect(x, y, pixels.shape[1], pixels.shape[0])
+        if rect is None:
+            return
+        (x0, y0, x1, y1, p0, p1) = rect
+
+        # Place the visible part of the image on a page aligned canvas and pack each
+        # column of 8 rows into a byte - bit 0 is the top row of the page.
+        nPages = p1 - p0
+        yOff = y0 - p0*8
+        canvas = np.zeros((nPages*8, x1 - x0), dtype=np.bool_)
+        canvas[yOff:yOff + y1 - y0] = pixels[y0 - y:y1 - y, x0 - x:x1 - x]
+        bits = np.packbits(canvas.reshape(nPages, 8, x1 - x0), axis=1, bitorder="little")[:, 0, :]
+
+        masks = np.asarray(bytearray(self._page_masks(y0, y1, p0, p1)), dtype=np.uint8)
+
+        screen = np.frombuffer(self._screenbuffer, dtype=np.uint8).reshape(self._nPages, self.LCDWIDTH)
+        region = screen[p0:p1, x0:x1]
+        region &= ~masks[:, None]
+        region |= bits
+
+        self._mark_dirty(x0, y0, x1 - x0, y1 - y0)
+
+    def _draw_pil_image(self, image, x, y, threshold):
+
+        # Pack the image without NumPy, letting PIL do the per pixel work
+        from PIL import Image
+
+        rect = self._image_rect(x, y, image.size[0], image.size[1])
+        if rect is None:
+            return
+        (x0, y0, x1, y1, p0, p1) = rect
+
+        nPages = p1 - p0
+        bw = image.convert("L").crop((x0 - x, y0 - y, x1 - x, y1 - y))
+        bw = bw.point([255 if i >= threshold else 0 for i in range(256)], "1")
+
+        canvas = Image.new("1", (x1 - x0, nPages*8), 0)
+        canvas.paste(bw, (0, y0 - p0*8))
+
+        # Rotated a quarter turn clockwise, each row of the canvas is a screen column, packed
+        # into bytes from the bottom page up - with the top row of each page in bit 0.
+        transpose = getattr(Image, "Transpose", Image)
+        packed = canvas.transpose(transpose.ROTATE_270).tobytes()
+
+        masks = self._page_masks(y0, y1, p0, p1)
+        for page in range(nPages):
+            keep = ~masks[page] & 0xFF
+            iLine = (p0 + page) * self.LCDWIDTH
+            iPacked = nPages - 1 - page
+            for col in range(x1 - x0):
+                index = iLine + x0 + col
+                self._screenbuffer[index] = (self._screenbuffer[index] & keep) | packed[iPacked]
+                iPacked += nPages
+
+        self._mark_dirty(x0, y0, x1 - x0, y1 - y0)
+
+    def _image_rect(self, x, y, width, height):
+
+        # Clip an image rectangle to the screen - return the visible rectangle and page range
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + width, self.LCDWIDTH)
+        y1 = min(y + height, self.LCDHEIGHT)
+
+        if x0 >= x1 or y0 >= y1:
+            return None
+
+        return (x0, y0, x1, y1, y0 // 8, (y1 - 1) // 8 + 1)
+
+    @staticmethod
+    def _page_masks(y0, y1, p0, p1):
+
+        # For each page in [p0, p1), the bits covered by the rows [y0, y1)
+        masks = []
+        for page in range(p0, p1):
+            lo = max(y0 - page*8, 0)
+            hi = min(y1 - page*8, 8)
+            masks.append(((0xFF << lo) & (0xFF >> (8 - hi))) & 0xFF)
+
+        return masks
+
+    #--------------------------------------------------------------------------
+    # Sprites - small images packed in the page layout, drawn a page row at a time.
+    # A sprite at a y position that isn't a multiple of 8 uses a copy of its pages
+    # shifted down (see Sprite), so every row is a plain byte-wise operation.
+
+    def blit(self, sprite, x, y, mode=None):
+        """
+            Draw a sprite in the screen buffer, clipped to the screen.
+
+            :param sprite: The Sprite to draw
+            :param x: The X position of the sprite's left edge
+            :param y: The Y position of the sprite's top edge
+            :param mode: How the sprite is combined with the screen buffer:
+                        OR sets the sprite's pixels, XOR flips them (drawing the sprite
+                        again at the same place erases it), AND_NOT clears them, and MASK
+                        (or NORM) replaces the pixels set in the sprite's mask with the sprite.
+                        Default is OR
+
+            :return: No return value
+
+        """
+        if mode is None:
+            mode = self.OR
+
+        if mode not in (self.OR, self.XOR, self.AND_NOT, self.MASK, self.NORM):
+            print("blit - Invalid mode.", file=sys.stderr)
+            return
+
+        x = int(x)
+        y = int(y)
+
+        # clip the columns to the screen
+        c0 = max(-x, 0)
+        c1 = min(sprite.width, self.LCDWIDTH - x)
+        if c0 >= c1:
+            return
+
+        n = c1 - c0
+        clipped = c0 > 0 or c1 < sprite.width
+        keep = (1 << (8*n)) - 1
+        buf = self._screenbuffer
+        pageTop = y >> 3
+
+        # the rows of the last page below the screen's last row are clipped too
+        lastPage = self._nPages - 1
+        lastRows = self._page_masks(0, self.LCDHEIGHT, lastPage, self._nPages)[0]
+
+        for (i, (data, mask)) in enumerate(sprite._get_rows(y & 7)):
+
+            page = pageTop + i
+            if page < 0 or page > lastPage:
+                continue
+
+            if clipped:
+                data = (data >> (8*c0)) & keep
+                mask = (mask >> (8*c0)) & keep
+
+            if page == lastPage and lastRows != 0xFF:
+                rows = (lastRows * keep) // 0xFF
+                data &= rows
+                mask &= rows
+
+            index = page*self.LCDWIDTH + x + c0
+            old = int.from_bytes(buf[index:index + n], "little")
+
+            if mode == self.OR:
+                new = old | data
+            elif mode == self.XOR:
+                new = old ^ data
+            elif mode == self.AND_NOT:
+                new = old & ~data
+            else:
+                new = (old & ~mask) | (data & mask)
+
+            buf[index:index + n] = new.to_bytes(n, "little")
+
+        self._mark_dirty(x + c0, y, n, sprite.height)
+
+    def get_sprite(self, x, y, width, height):
+        """
+            Copy a rectangle of the screen buffer into a new sprite. Pixels outside the
+            screen are BLACK.
+
+            :param x: The X position of the rectangle's left edge
+            :param y: The Y position of the rectangle's top edge
+            :param width: The width of the rectangle
+            :param height: The height of the rectangle
+
+            :return: The sprite
+            :rtype: Sprite
+
+        """
+        x = int(x)
+        y = int(y)
+        width = int(width)
+        height = int(height)
+        shift = y & 7
+        pageTop = y >> 3
+
+        def page_bytes(page):
+            # the bytes of a screen page under the rectangle, blank off screen
+            if page < 0 or page >= self._nPages:
+                return bytes(width)
+            iLine = page*self.LCDWIDTH
+            return bytes(self._screenbuffer[iLine + c] if 0 <= c < self.LCDWIDTH else 0 \
+                            for c in range(x, x + width))
+
+        # each sprite page is the bottom of one screen page and the top of the next
+        data = bytearray()
+        for i in range((height + 7) // 8):
+            upper = page_bytes(pageTop + i)
+            if shift == 0:
+                data += upper
+            else:
+                lower = page_bytes(pageTop + i + 1)
+                data += bytes(((a >> shift) | (b << (8 - shift))) & 0xFF for (a, b) in zip(upper, lower))
+
+        return Sprite(width, height, data)
+
+    #--------------------------------------------------------------------------
+    # Canvases - off-screen buffers with the same drawing API, composited into the
+    # screen buffer.
+
+    def draw_canvas(self, canvas, x=0, y=0, mode=None, mask=None):
+        """
+            Draw a canvas into the screen buffer, clipped to the screen. A canvas at a page
+            aligned y position (a multiple of 8) with no mask is copied a page row at a time,
+            and only the columns that actually change are marked for the next display().
+
+            :param canvas: The Canvas to draw
+            :param x: The X position of the canvas's left edge. Default is 0
+            :param y: The Y position of the canvas's top edge. Default is 0
+            :param mode: How the canvas is combined with the screen buffer - OR, XOR, AND_NOT or
+                        MASK, as for blit(). Default is MASK, which replaces the screen buffer
+                        under the canvas
+            :param mask: A Canvas the same size as canvas. In MASK mode, only the pixels set
+                        in the mask are drawn. Default is the whole canvas
+
+            :return: No return value
+
+        """
+        if mode is None:
+            mode = self.MASK
+
+        x = int(x)
+        y = int(y)
+
+        if mask is not None or mode not in (self.MASK, self.NORM) or (y & 7) or (canvas.LCDHEIGHT & 7):
+            self.blit(canvas._get_layer(mask), x, y, mode)
+            return
+
+        c0 = max(-x, 0)
+        c1 = min(canvas.LCDWIDTH, self.LCDWIDTH - x)
+        if c0 >= c1:
+            return
+
+        data = canvas._get_pages()
+        buf = self._screenbuffer
+        pageTop = y >> 3
+        n = c1 - c0
+
+        for i in range(canvas._nPages):
+            page = pageTop + i
+            if page < 0 or page >= self._nPages:
+                continue
+
+            iSrc = i*canvas.LCDWIDTH + c0
+            iDst = page*self.LCDWIDTH + x + c0
+            new = data[iSrc:iSrc + n]
+            old = buf[iDst:iDst + n]
+            if old == new:
+                continue
+
+            # the range of columns that differ
+            diff = int.from_bytes(old, "little") ^ int.from_bytes(new, "little")
+            lo = ((diff & -diff).bit_length() - 1) // 8
+            hi = (diff.bit_length() + 7) // 8
+
+            buf[iDst:iDst + n] = new
+            self._mark_dirty(x + c0 + lo, page*8, hi - lo, 8)
+
+    #--------------------------------------------------------------------------
+    # Region operations. These work on a page row of bytes at a time, with a mask for
+    # the rows of the top and bottom pages a region only partly covers, instead of
+    # pixel by pixel.
+
+    def fill_region(self, x, y, width, height, color=None, mode=None):
+        """
+            Fill a rectangle of the screen buffer, clipped to the screen.
+
+            :param x: The X position of the rectangle's left edge
+            :param y: The Y position of the rectangle's top edge
+            :param width: The width of the rectangle
+            :param height: The height of the rectangle
+            :param color: The color to fill with. If not set, the default foreground color is used.
+            :param mode: The draw mode - XOR or NORM. Default is the current draw mode
+
+            :return: No return value
+
+        """
+        op = self._draw_op(color, mode)
+        rect = self._image_rect(int(x), int(y), int(width), int(height))
+        if op is None or rect is None:
+            return
+
+        (x0, y0, x1, y1, p0, p1) = rect
+        n = x1 - x0
+
+        for (page, mask) in zip(range(p0, p1), self._page_masks(y0, y1, p0, p1)):
+            self._blit_bytes(page*self.LCDWIDTH + x0, bytes((mask,)) * n, mask, op)
+
+        self._mark_dirty(x0, y0, n, y1 - y0)
+
+    def rect_fill(self, x, y, width, height, color=None, mode=None):
+        """
+            Draw a filled rectangle on the diplay. A color can be specified. Pixel copy mode is either Normal (source copy) or XOR
+
+            :param x: The X starting position for the rectangle
+            :param y: The Y starting position for the rectangle.
+            :param width: The width of the rectangle
+            :param height: The height of the rectangle
+            :param color: The color to draw. If not set, the default foreground color is used.
+            :param mode: The mode to draw the pixl to the screen bufffer.
+                        Value can be either XOR or NORM. Default is NORM
+
+            :return: No return value
+
+        """
+        self.fill_region(x, y, width, height, color, mode)
+
+    def invert_region(self, x, y, width, height):
+        """
+            Invert the pixels of a rectangle of the screen buffer, clipped to the screen.
+
+            :param x: The X position of the rectangle's left edge
+            :param y: The Y position of the rectangle's top edge
+            :param width: The width of the rectangle
+            :param height: The height of the rectangle
+
+            :return: No return value
+
+        """
+        self.fill_region(x, y, width, height, self.WHITE, self.XOR)
+
+    def copy_region(self, x, y, width, height, dst_x, dst_y):
+        """
+            Copy a rectangle of the screen buffer to another position. The rectangles can
+            overlap - the source is read before anything is written. The parts of either
+            rectangle that are off the screen aren't copied.
+
+            :param x: The X position of the source rectangle's left edge
+            :param y: The Y position of the source rectangle's top edge
+            :param width: The width of the rectangle
+            :param height: The height of the rectangle
+            :param dst_x: The X position of the destination's left edge
+            :param dst_y: The Y position of the destination's top edge
+
+            :return: No return value
+
+        """
+        x = int(x)
+        y = int(y)
+        dx = int(dst_x) - x
+        dy = int(dst_y) - y
+
+        # clip the source to the screen, then the destination
+        rect = self._image_rect(x, y, int(width), int(height))
+        if rect is None:
+            return
+        (x0, y0, x1, y1) = rect[:4]
+
+        rect = self._image_rect(x0 + dx, y0 + dy, x1 - x0, y1 - y0)
+        if rect is None:
+            return
+        (x0, y0, x1, y1, p0, p1) = rect
+
+        n = x1 - x0
+        ones = ((1 << (8*n)) - 1) // 0xFF
+        buf = self._screenbuffer
+
+        def source_page(page):
+            # the source columns of a page, as a little endian integer
+            if page < 0 or page >= self._nPages:
+                return 0
+            index = page*self.LCDWIDTH + x0 - dx
+            return int.from_bytes(buf[index:index + n], "little")
+
+        # Each destination page is the bottom of one source page and the top of the next.
+        # All of them are read before any is written.
+        rows = []
+        for (page, mask) in zip(range(p0, p1), self._page_masks(y0, y1, p0, p1)):
+            top = page*8 - dy
+            shift = top & 7
+            data = source_page(top >> 3)
+            if shift:
+                data = ((data >> shift) & ((0xFF >> shift) * ones)) | \
+                       ((source_page((top >> 3) + 1) << (8 - shift)) & (((0xFF << (8 - shift)) & 0xFF) * ones))
+            rows.append((page, mask * ones, data))
+
+        for (page, mask, data) in rows:
+            index = page*self.LCDWIDTH + x0
+            old = int.from_bytes(buf[index:index + n], "little")
+            buf[index:index + n] = ((old & ~mask) | (data & mask)).to_bytes(n, "little")
+
+        self._mark_dirty(x0, y0, n, y1 - y0)
+
+    def scroll_buffer(self, dx, dy, x=0, y=0, width=None, height=None, fill=None):
+        """
+            Scroll the contents of a rectangle of the screen buffer, and fill the part it
+            uncovers. Only the new content then has to be drawn - a scrolling graph draws its
+            newest column, and a text log its newest line. Nothing is sent to the device until
+            the next display(); see scroll_content() for scrolling the device's memory.
+
+            :param dx: The distance to scroll right, in pixels. Negative values scroll left
+            :param dy: The distance to scroll down, in pixels. Negative values scroll up
+            :param x: The X position of the rectangle's left edge. Default is 0
+            :param y: The Y position of the rectangle's top edge. Default is 0
+            :param width: The width of the rectangle. Default is to the right edge of the screen
+            :param height: The height of the rectangle. Default is to the bottom of the screen
+            :param fill: The color of the uncovered pixels. Default is BLACK
+
+            :return: No return value
+
+        """
+        x = int(x)
+        y = int(y)
+        dx = int(dx)
+        dy = int(dy)
+        if width is None:
+            width = self.LCDWIDTH - x
+        if height is None:
+            height = self.LCDHEIGHT - y
+        if fill is None:
+            fill = self.BLACK
+
+        rect = self._image_rect(x, y, int(width), int(height))
+        if rect is None or (dx == 0 and dy == 0):
+            return
+
+        (x0, y0, x1, y1) = rect[:4]
+        width = x1 - x0
+        height = y1 - y0
+        nCols = min(abs(dx), width)
+        nRows = min(abs(dy), height)
+
+        if nCols < width and nRows < height:
+            self.copy_region(x0 + max(-dx, 0), y0 + max(-dy, 0), width - nCols, height - nRows,
+                             x0 + max(dx, 0), y0 + max(dy, 0))
+
+        # the columns and rows uncovered
+        if nCols:
+            self.fill_region(x0 if dx > 0 else x1 - nCols, y0, nCols, height, fill, self.NORM)
+        if nRows:
+            self.fill_region(x0, y0 if dy > 0 else y1 - nRows, width, nRows, fill, self.NORM)
+
+    #--------------------------------------------------------------------------
+    # Hardware scrolling
+
+    def scroll_left(self, start, stop):
+        """
+            Set row start to row stop on the OLED to scroll left.
+            Refer to http://learn.microview.io/intro/general-overview-of-microview.html for explanation of the rows.
+
+            :param start: The staring position on the display
+            :param stop: The stopping position on the display
+
+            :return: No return value
+
+        """
+        if stop < start:        # stop must be larger or equal to start
+            return
+
+        self.scroll_stop()       # need to disable scrolling before starting to avoid memory corrupt
+
+        with self._busLock:
+            self._send_commands([_LEFT_HORIZONTAL_SCROLL, 0x00, start, 0x7, stop, 0x00, 0xFF, _ACTIVATE_SCROLL])
+
+    def scroll_content(self, right, page_start, page_end, x_start=0, x_end=None, column=None):
+        """
+            Scroll the contents of a window of the display one column, with the controller's
+            content scroll command, and write a new column into the side of the window it
+            uncovers. The screen buffer (and shadow buffer) are scrolled the same way, so they
+            match the display. Only the command and the new column are sent on the bus.
+
+            Consecutive calls are spaced at least two display frames apart, as the controller
+            needs.
+
+            :param right: True to scroll right, False to scroll left
+            :param page_start: The first page (8 pixel row) of the window
+            :param page_end: The last page of the window
+            :param x_start: The left edge of the window. Default is 0
+            :param x_end: The right edge of the window, exclusive. Default is the display width
+            :param column: The bytes of the new column, one per page - bit 0 is the top pixel
+                        of a page. Default is a blank column.
+
+            :return: No return value
+
+        """
+        if x_end is None:
+            x_end = self.LCDWIDTH
+
+        page_start = max(int(page_start), 0)
+        page_end = min(int(page_end), self._nPages - 1)
+        x_start = max(int(x_start), 0)
+        x_end = min(int(x_end), self.LCDWIDTH)
+        if page_end < page_start or x_end <= x_start:
+            return
+
+        if column is None:
+            column = bytes(page_end - page_start + 1)
+
+        # The device has to show the window's contents before they're scrolled
+        if self._flushWorker is not None:
+            self.wait_display()
+        for page in range(page_start, page_end + 1):
+            if self._dirtyLo[page] < x_end and self._dirtyHi[page] > x_start:
+                self.display()
+                if self._flushWorker is not None:
+                    self.wait_display()
+                break
+
+        wait = self._lastContentScroll + _CONTENT_SCROLL_INTERVAL - time.perf_counter()
+        if wait > 0:
+            time.sleep(wait)
+
+        revealed = x_start if right else x_end - 1
+
+        with self._busLock:
+            self._send_commands([_CONTENT_SCROLL_RIGHT if right else _CONTENT_SCROLL_LEFT, 0x00,
+                                 page_start, 0x01, page_end,
+                                 x_start + _GDDRAM_COLUMN_OFFSET, x_end - 1 + _GDDRAM_COLUMN_OFFSET])
+            self._lastContentScroll = time.perf_counter()
+
+            for (i, page) in enumerate(range(page_start, page_end + 1)):
+                iStart = page * self.LCDWIDTH + x_start
+                iEnd = page * self.LCDWIDTH + x_end
+                for frame in (self._screenbuffer, self._shadow):
+                    if frame is None:
+                        continue
+                    if right:
+                        frame[iStart + 1:iEnd] = frame[iStart:iEnd - 1]
+                    else:
+                        frame[iStart:iEnd - 1] = frame[iStart + 1:iEnd]
+                    frame[page * self.LCDWIDTH + revealed] = column[i]
+
+                self._write_window(self._screenView, page, revealed, revealed + 1)
+
+            if self._frameHook is not None:
+                self._frameHook(self._screenbuffer)
+
+    #--------------------------------------------------------------------------
+    def get_screenbuffer(self):
+        """
+            Return a pointer to the start of the RAM screen buffer for direct access.
+            Since the caller can change the buffer, it is all sent on the next display().
+
+            :return: The internal screen buffer
+            :rtype: integer array
+
+        """
+        self.invalidate()
+        return self._screenbuffer
+
+    def write_buffer(self, data, offset=0):
+        """
+            Copy page packed bytes into the screen buffer, starting at the given byte offset:
+            one byte per column for each page, bit 0 at the top. Only the columns written are
+            sent on the next display().
+
+            :param data: The bytes to copy
+            :param offset: The screen buffer offset of the first byte. Default is 0
+
+            :return: No return value
+
+        """
+        offset = int(offset)
+        end = offset + len(data)
+        if offset < 0 or end > len(self._screenbuffer):
+            raise ValueError("write_buffer - data doesn't fit in the screen buffer.")
+
+        self._screenbuffer[offset:end] = data
+
+        # mark the columns written on each page they touch
+        iStart = offset
+        while iStart < end:
+            page = iStart // self.LCDWIDTH
+            iEnd = min(end, (page + 1) * self.LCDWIDTH)
+            self._mark_dirty(iStart - page * self.LCDWIDTH, page * 8, iEnd - iStart, 8)
+            iStart = iEnd
+
+
+class DisplayGroup(object):
+    """
+    DisplayGroup
+
+        A group of displays that are updated together. Displays on different I2C buses are
+        updated in parallel, by one worker thread per bus. Displays that share a bus are
+        updated one after the other.
+
+        :param displays: A list of display objects to add to the group. Each display is placed
+                        on the bus of its I2C driver object. Default is an empty group.
+        :return: The display group object.
+        :rtype: Object
+    """
+
+    def __init__(self, displays=None):
+
+        self._displays = []     # list of (display, bus key)
+        self._workers = {}      # bus key -> single thread executor
+
+        for oled in displays or []:
+            self.add(oled)
+
+    def __len__(self):
+        return len(self._displays)
+
+    def __iter__(self):
+        return iter([oled for (oled, _) in self._displays])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    #--------------------------------------------------------------------------
+    def add(self, display, bus=None):
+        """
+            Add a display to the group.
+
+            :param display: The display object to add
+            :param bus: A value identifying the physical I2C bus of the display. Displays with
+                        the same bus value are never written at the same time - for example,
+                        displays behind the same I2C mux. Default is the display's I2C driver object.
+
+            :return: No return value
+
+        """
+        if bus is None:
+            # the display's own driver - not the stats counting wrapper around it
+            bus = display._i2c
+            if isinstance(bus, _StatsDriver):
+                bus = bus.driver
+
+        self._displays.append((display, bus))
+
+    def remove(self, display):
+        """
+            Remove a display from the group.
+
+            :param display: The display object to remove
+
+            :return: No return value
+
+        """
+        self._displays = [(oled, bus) for (oled, bus) in self._displays if oled is not display]
+
+    def begin(self):
+        """
+            Initialize all the displays of the group, in parallel across buses.
+
+            :return: The time each display's begin() took, in seconds, in the order the displays
+                        were added.
+            :rtype: list
+
+        """
+        return self._run("begin")
+
+    def display(self):
+        """
+            Display the screen buffers of all the displays of the group, in parallel across buses.
+
+            :return: The time each display's own update took, in seconds, in the order the
+                        displays were added. Time spent waiting for other displays on the same
+                        bus isn't counted.
+            :rtype: list
+
+        """
+        return self._run("display")
+
+    def close(self):
+        """
+            Stop the group's worker threads. They are started again if needed.
+
+            :return: No return value
+
+        """
+        for executor in self._workers.values():
+            executor.shutdown(wait=True)
+        self._workers = {}
+
+    #--------------------------------------------------------------------------
+    def _run(self, method):
+
+        # the displays on each bus, in order
+        buses = {}
+        for (i, (oled, bus)) in enumerate(self._displays):
+            buses.setdefault(bus, []).append((i, oled))
+
+        latencies = [0.0] * len(self._displays)
+
+        # A single bus gains nothing from a worker thread
+        if len(buses) == 1:
+            for (i, latency) in self._run_bus(list(buses.values())[0], method):
+                latencies[i] = latency
+            return latencies
+
+        futures = [self._get_worker(bus).submit(self._run_bus, bus_displays, method) \
+                        for (bus, bus_displays) in buses.items()]
+
+        # wait for all the buses before raising an error from any of them
+        errors = []
+        for future in futures:
+            try:
+                for (i, latency) in future.result():
+                    latencies[i] = latency
+            except Exception as exError: # pylint: disable=broad-except
+                errors.append(exError)
+
+        if errors:
+            raise errors[0]
+
+        return latencies
+
+    @staticmethod
+    def _run_bus(bus_displays, method):
+
+        # each display is timed on its own, from when its update starts
+        results = []
+        for (i, oled) in bus_displays:
+            tStart = time.perf_counter()
+            getattr(oled, method)()
+            results.append((i, time.perf_counter() - tStart))
+
+        return results
+
+    def _get_worker(self, bus):
+
+        executor = self._workers.get(bus)
+        if executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="DisplayGroup bus")
+            self._workers[bus] = executor
+
+        return executor
+
+class Sprite(object):
+    """
+    Sprite
+
+        A small image for drawing with blit(), packed in the display's page layout. The
+        sprite's pages are pre-shifted for each vertical position within a page the first time
+        it's drawn there, so drawing it is always byte-wise.
+
+        :param width: The width of the sprite, in pixels
+        :param height: The height of the sprite, in pixels
+        :param data: The sprite image, in the screen buffer layout - for each page (8 rows) from
+                        the top, one byte per column, with bit 0 the top row. That is
+                        width * ceil(height / 8) bytes.
+        :param mask: The pixels drawn in MASK mode, in the same layout as data. Default is the
+                        whole sprite rectangle.
+        :return: The sprite object.
+        :rtype: Object
+    """
+
+    def __init__(self, width, height, data, mask=None):
+
+        self.width = int(width)
+        self.height = int(height)
+        nPages = (self.height + 7) // 8
+
+        data = bytes(bytearray(data))
+        if len(data) != self.width * nPages:
+            raise ValueError("Sprite data must be %d bytes, not %d." % (self.width * nPages, len(data)))
+
+        if mask is None:
+            mask = b"\xFF" * len(data)
+        mask = bytes(bytearray(mask))
+        if len(mask) != len(data):
+            raise ValueError("Sprite mask must be %d bytes, not %d." % (len(data), len(mask)))
+
+        # bits below the sprite's last row aren't part of it
+        rowMasks = QwiicMicroOled._page_masks(0, self.height, 0, nPages)
+        self._pages = [bytes(b & rowMask for b in data[page*self.width:(page + 1)*self.width]) \
+                            for (page, rowMask) in enumerate(rowMasks)]
+        self._maskPages = [bytes(b & rowMask for b in mask[page*self.width:(page + 1)*self.width]) \
+                            for (page, rowMask) in enumerate(rowMasks)]
+
+        # shift (0-7) => list of (data, mask) of each page row, as little endian integers
+        self._rows = {}
+
+    @classmethod
+    def from_pixels(cls, pixels, mask=None):
+        """
+            Create a sprite from rows of pixel values.
+
+            :param pixels: A sequence of rows, each a sequence of pixel values - a true value
+                        is a WHITE pixel. All the rows must be the same length.
+            :param mask: The pixels drawn in MASK mode, as rows of values. Default is the whole
+                        sprite rectangle.
+
+            :return: The sprite
+            :rtype: Sprite
+
+        """
+        def pack(rows):
+            rows = [list(row) for row in rows]
+            width = len(rows[0]) if rows else 0
+            packed = bytearray()
+            for top in range(0, len(rows), 8):
+                band = rows[top:top + 8]
+                packed += bytes(sum(1 << bit for (bit, row) in enumerate(band) if row[col]) \
+                                    for col in range(width))
+            return (width, len(rows), packed)
+
+        (width, height, data) = pack(pixels)
+        if mask is not None:
+            mask = pack(mask)[2]
+
+        return cls(width, height, data, mask)
+
+    def _get_rows(self, shift):
+
+        rows = self._rows.get(shift)
+        if rows is None and not self._pages:
+            return []
+
+        if rows is None:
+            dataPages = _shift_strips(self._pages, shift)
+            maskPages = _shift_strips(self._maskPages, shift)
+            rows = [(int.from_bytes(data, "little"), int.from_bytes(mask, "little")) \
+                        for (data, mask) in zip(dataPages, maskPages)]
+
+            # a shifted sprite that still fits in its pages has an empty last page
+            if len(rows) > 1 and rows[-1] == (0, 0):
+                rows.pop()
+
+            self._rows[shift] = rows
+
+        return rows
+
+class _NoDevice(object):
+
+    # The I2C driver of a canvas - there's no device, so any device command is an error
+    def _no_device(self, *args):
+        raise TypeError("A Canvas isn't connected to a device - draw it into a display with draw_canvas().")
+
+    writeCommand = writeByte = writeWord = writeBlock = _no_device
+    readByte = readWord = readBlock = _no_device
+
+    def isDeviceConnected(self, devAddress):
+        return False
+
+class Canvas(QwiicMicroOled):
+    """
+    Canvas
+
+        An off-screen drawing buffer, packed in the display's page layout, with the drawing
+        API of the display object - pixel(), line(), rect(), print(), blit() and so on. It isn't
+        connected to a device: draw it into a display's screen buffer with draw_canvas().
+
+        Static content can be drawn once into a canvas, and copied into the screen buffer
+        each frame before the moving parts are drawn over it.
+
+        :param width: The width of the canvas, in pixels. Default is the display width
+        :param height: The height of the canvas, in pixels. Default is the display height
+        :return: The canvas object.
+        :rtype: Object
+    """
+
+    def __init__(self, width=_LCDWIDTH, height=_LCDHEIGHT):
+
+        # A display object whose driver refuses device writes, with a blank screen buffer
+        # of the canvas size
+        super().__init__(i2c_driver=_NoDevice())
+        self.address = None
+        self._init_screen(width, height)
+        self._screenbuffer[:] = self._blankBuffer
+        self.set_font_type(0)
+
+        # A copy of the buffer for drawing into displays, made again when the canvas has
+        # been drawn on since (the dirty region tracks that). The generation counts copies.
+        self._pages = None
+        self._generation = 0
+        self._layer = None
+        self._layerKey = None
+
+    #--------------------------------------------------------------------------
+    def clear(self, mode=None, value=0):
+        """
+            Clear the canvas.
+
+            :param mode: Not used - a canvas has no device memory. Accepted so canvases can be
+                        cleared like displays.
+            :param value: The value to clear the canvas to. Default value is 0
+
+            :return: No return value
+
+        """
+        if value == 0:
+            self._screenbuffer[:] = self._blankBuffer
+        else:
+            self._screenbuffer[:] = bytes((value & 0xFF,)) * len(self._screenbuffer)
+
+        self.invalidate()
+
+    def display(self):
+        """
+            A canvas has no device to display on - draw it into a display with draw_canvas().
+        """
+        raise TypeError("A Canvas can't be displayed - draw it into a display with draw_canvas().")
+
+    async def display_async(self):
+        """
+            A canvas has no device to display on - draw it into a display with draw_canvas().
+        """
+        raise TypeError("A Canvas can't be displayed - draw it into a display with draw_canvas().")
+
+    def set_background_display(self, enable):
+        """
+            A canvas has no device, so no background display - only disabling it is accepted.
+
+            :param enable: False. True raises a TypeError
+
+            :return: No return value
+
+        """
+        if enable:
+            raise TypeError("A Canvas has no device to display on in the background.")
+
+    background_display = property(QwiicMicroOled.get_background_display, set_background_display)
+
+    def _get_pages(self):
+
+        if self._pages is None or self._dirtyLo != [self.LCDWIDTH] * self._nPages:
+            self._pages = bytes(self._screenbuffer)
+            self._generation += 1
+            self._mark_clean()
+
+        return self._pages
+
+    def _get_layer(self, mask):
+
+        # The canvas as a sprite, for drawing with a mask, mode or position blit() handles
+        data = self._get_pages()
+        maskData = mask._get_pages() if mask is not None else None
+        key = (self._generation, mask, mask._generation if mask is not None else None)
+
+        if self._layerKey != key:
+            self._layer = Sprite(self.LCDWIDTH, self.LCDHEIGHT, data, maskData)
+            self._layerKey = key
+
+        return self._layer
+
+class NumericField(object):
+    """
+    NumericField
+
+        A numeric readout at a fixed place on the display, in a fixed number of character
+        cells. When the value changes, only the cells whose characters changed are redrawn,
+        so only their columns are sent by the next display().
+
+        :param oled: The display object to draw on
+        :param x: The X position of the field's left edge
+        :param y: The Y position of the field's top edge
+        :param width: The number of characters in the field
+        :param font_type: The font to use. Default is the display's current font
+        :param fmt: The % format used to turn values into text. Default is "%s"
+        :return: The numeric field object.
+        :rtype: Object
+    """
+
+    def __init__(self, oled, x, y, width, font_type=None, fmt="%s"):
+
+        if font_type is None:
+            font_type = oled.get_font_type()
+
+        self.oled = oled
+        self.x = int(x)
+        self.y = int(y)
+        self.width = int(width)
+        self.fmt = fmt
+
+        self._fontType = font_type
+        font = _get_font(font_type)
+        self._advance = font.width + 1
+
+        # a blank cell, to clear characters that aren't in the font
+        nRows = max(font.height // 8, 1)
+        self._blank = Sprite(self._advance - 1, nRows * 8, bytes((self._advance - 1) * nRows))
+
+        self._value = None
+        self._text = None
+
+    #--------------------------------------------------------------------------
+    def set_value(self, value):
+        """
+            Set the value shown. The text is right aligned in the field, and cut to the
+            field width.
+
+            :param value: The new value
+
+            :return: The number of character cells redrawn
+            :rtype: integer
+
+        """
+        self._value = value
+        return self.set_text(self.fmt % value)
+
+    def get_value(self):
+        """
+            Return the value shown.
+
+            :return: The last value set
+        """
+        return self._value
+
+    value = property(get_value, set_value)
+
+    def set_text(self, text):
+        """
+            Set the text shown. The text is right aligned in the field, and cut to the
+            field width.
+
+            :param text: The new text
+
+            :return: The number of character cells redrawn
+            :rtype: integer
+
+        """
+        text = str(text).rjust(self.width)[-self.width:] if self.width else ""
+        old = self._text
+        self._text = text
+
+        nDrawn = 0
+        for (i, c) in enumerate(text):
+            if old is not None and old[i] == c:
+                continue
+
+            self._draw_cell(i, c)
+            nDrawn += 1
+
+        return nDrawn
+
+    def redraw(self):
+        """
+            Draw every character cell of the field again - for example, after the screen
+            buffer was cleared.
+
+            :return: No return value
+
+        """
+        if self._text is not None:
+            for (i, c) in enumerate(self._text):
+                self._draw_cell(i, c)
+
+    def _draw_cell(self, i, c):
+
+        # replace the character cell - blit marks just its columns dirty
+        sprite = self.oled.render_text(c, self._fontType)
+        x = self.x + i * self._advance
+
+        if any(sprite._maskPages[0]):
+            self.oled.blit(sprite, x, self.y, self.oled.MASK)
+        else:
+            self.oled.blit(self._blank, x, self.y, self.oled.MASK)
+
+class Ticker(object):
+    """
+    Ticker
+
+        A line of text scrolling across a band of the display, moved with the controller's
+        content scroll command. Each step sends the scroll command and writes only the newly
+        uncovered column, instead of the whole screen buffer.
+
+        The band is made of whole pages (8 pixel rows) - everything in its columns scrolls
+        with the text. The text is repeated, with a gap between repetitions.
+
+        :param oled: The display object to scroll the text on
+        :param text: The text to scroll
+        :param y: The Y position of the top of the text. Default is 0
+        :param x: The left edge of the band. Default is 0
+        :param width: The width of the band. Default is to the right edge of the display
+        :param font_type: The font to use. Default is the display's current font
+        :param right: True to scroll the text right, False to scroll it left. Default is False
+        :param gap: Blank columns between repetitions of the text. Default is the band width
+        :return: The ticker object.
+        :rtype: Object
+    """
+
+    def __init__(self, oled, text, y=0, x=0, width=None, font_type=None, right=False, gap=None):
+
+        if width is None:
+            width = oled.get_lcd_width() - x
+        if font_type is None:
+            font_type = oled.get_font_type()
+
+        self.oled = oled
+        self.right = bool(right)
+
+        self._x = max(int(x), 0)
+        self._xEnd = min(int(x + width), oled.get_lcd_width())
+        self._y = int(y)
+        self._fontType = font_type
+        self._gap = self._xEnd - self._x if gap is None else max(int(gap), 0)
+
+        self.set_text(text)
+
+    #--------------------------------------------------------------------------
+    def set_text(self, text):
+        """
+            Set the text to scroll. The band is cleared, and the new text starts scrolling in
+            from the edge.
+
+            :param text: The text to scroll
+
+            :return: No return value
+
+        """
+        font = _get_font(self._fontType)
+        shift = self._y & 7
+        strips = _get_glyph_strips(self._fontType, font, shift)
+        nPages = len(strips[0])
+        advance = font.width + 1
+
+        # the columns of the text, and the gap after it, for each page of the band
+        pages = [bytearray() for _ in range(nPages)]
+        for c in bytearray(str(text), encoding="ascii"):
+            iGlyph = c - font.start_char
+            glyph = strips[iGlyph] if 0 <= iGlyph < font.total_char else ((b"",) * nPages)
+            for (page, strip) in zip(pages, glyph):
+                page += strip
+                page += bytes(advance - len(strip))
+
+        for page in pages:
+            page += bytes(self._gap)
+
+        # each column as the bytes of its pages - clipped to the display
+        pageTop = self._y >> 3
+        iPages = [i for i in range(nPages) if 0 <= pageTop + i < self.oled._nPages]
+        self._pageStart = pageTop + (iPages[0] if iPages else 0)
+        self._pageEnd = pageTop + (iPages[-1] if iPages else -1)
+        self._columns = [bytes(pages[i][col] for i in iPages) for col in range(len(pages[0]))]
+        self._offset = 0
+
+        # clear the band - the next step sends it to the device before scrolling
+        oled = self.oled
+        for page in range(self._pageStart, self._pageEnd + 1):
+            iLine = page * oled.LCDWIDTH
+            oled._screenbuffer[iLine + self._x:iLine + self._xEnd] = bytes(self._xEnd - self._x)
+        oled._mark_dirty(self._x, self._pageStart * 8, self._xEnd - self._x,
+                         (self._pageEnd - self._pageStart + 1) * 8)
+
+    def step(self, n=1):
+        """
+            Scroll the text by a number of columns.
+
+            :param n: The number of columns to scroll. Default is 1
+
+            :return: No return value
+
+        """
+        if not self._columns:
+            return
+
+        nColumns = len(self._columns)
+        for _ in range(n):
+            # scrolling left, the text enters from the right starting with its first column.
+            # Scrolling right, it enters from the left starting with its last column.
+            if self.right:
+                column = self._columns[(nColumns - self._gap - 1 - self._offset) % nColumns]
+            else:
+                column = self._columns[self._offset % nColumns]
+            self._offset += 1
+
+            self.oled.scroll_content(self.right, self._pageStart, self._pageEnd,
+                                     self._x, self._xEnd, column)
+
+    def run(self, speed=30, duration=None, steps=None):
+        """
+            Scroll the text at a constant speed, until the duration has passed or the number of
+            steps is done. Runs until interrupted if neither is set.
+
+            :param speed: The scroll speed, in columns per second. The controller limits it to
+                        about 50. Default is 30
+            :param duration: How long to run, in seconds. Default is no limit
+            :param steps: The number of columns to scroll. Default is no limit
+
+            :return: The number of columns scrolled
+            :rtype: integer
+
+        """
+        period = 1.0 / speed
+        tStart = time.perf_counter()
+        tNext = tStart
+        nSteps = 0
+
+        while (steps is None or nSteps < steps) and \
+                (duration is None or time.perf_counter() - tStart < duration):
+
+            wait = tNext - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+
+            self.step()
+            nSteps += 1
+
+            # keep to the schedule - but don't try to catch up after a stall
+            tNext = max(tNext + period, time.perf_counter() - period)
+
+        return nSteps
@@ -0,0 +1,375 @@
+#-----------------------------------------------------------------------------
+# qwiic_micro_oled_dither.py
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, May 2021
+#
+#
+# More information on qwiic is at https:= www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2021 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name, too-many-instance-attributes, too-many-arguments
+
+"""
+qwiic_micro_oled_dither
+=======================
+Convert grayscale images to the display's 1 bit page layout, with threshold, ordered
+(Bayer) or Floyd-Steinberg dithering.
+
+The output is page packed, like the screen buffer: for each page (8 rows) from the top, one
+byte per column, with bit 0 the top row. An image the size of the display can be copied
+straight into the screen buffer, and a smaller one drawn as a sprite::
+
+    oled.write_buffer(qwiic_micro_oled_dither.dither(image))
+
+    thumbnail = qwiic_micro_oled.Sprite(32, 24, qwiic_micro_oled_dither.dither(small_image))
+    oled.blit(thumbnail, 16, 8, oled.MASK)
+
+A Ditherer converts frames of one size, reusing its buffers from frame to frame, so a stream
+of frames - from a camera or a video file, say - is converted without allocating new buffers
+each frame::
+
+    ditherer = qwiic_micro_oled_dither.Ditherer(64, 48, qwiic_micro_oled_dither.BAYER)
+    for frame in ditherer.stream(camera_frames()):
+        oled.write_buffer(frame)
+        oled.display()
+
+Images are 2D NumPy arrays (integer or float values 0-255, or bool), sequences of rows,
+PIL images, or bytes of 8 bit gray values one row after the other. With NumPy, threshold and
+Bayer dithering are array operations. Without it, they're done a row at a time with byte
+translation tables. Floyd-Steinberg carries each pixel's error to the next one, so it's a
+loop over the pixels either way - NumPy only converts the input.
+
+"""
+
+from __future__ import print_function, division
+
+import qwiic_micro_oled
+
+# Dithering methods
+THRESHOLD               = "threshold"
+BAYER                   = "bayer"
+FLOYD_STEINBERG         = "floyd-steinberg"
+
+_METHODS                = (THRESHOLD, BAYER, FLOYD_STEINBERG)
+
+# Default frame size, the Micro OLED's
+_LCDWIDTH               = 64
+_LCDHEIGHT              = 48
+
+# Bayer matrix sizes
+_BAYER_SIZES            = (2, 4, 8)
+_DEFAULT_BAYER_SIZE     = 4
+
+def _bayer_matrix(size):
+
+    # Each doubling places four copies of the smaller matrix: 4M, 4M+2 / 4M+3, 4M+1
+    matrix = [[0]]
+    while len(matrix) < size:
+        n = len(matrix)
+        matrix = [[4*matrix[i % n][j % n] + ((0, 2), (3, 1))[i // n][j // n] for j in range(2*n)] \
+                    for i in range(2*n)]
+
+    return matrix
+
+def _is_image(frame):
+
+    return hasattr(frame, "mode") and hasattr(frame, "convert")
+
+
+class Ditherer(object):
+    """
+    Ditherer
+
+        Converts grayscale frames of one size to the display's page layout. The buffers are
+        made once, and reused for each frame.
+
+        :param width: The frame width, in pixels. Default is 64, the display width
+        :param height: The frame height, in pixels. Default is 48, the display height
+        :param method: THRESHOLD, BAYER or FLOYD_STEINBERG. Default is FLOYD_STEINBERG
+        :param threshold: Gray values equal to or above this are WHITE. For BAYER, the matrix
+                        is moved up or down by the difference from 128. Default is 128
+        :param bayer_size: The Bayer matrix size - 2, 4 or 8. Default is 4
+        :param use_numpy: True to use NumPy, False not to. Default is None, to use NumPy if
+                        it's installed.
+        :return: The ditherer object.
+        :rtype: Object
+    """
+
+    def __init__(self, width=_LCDWIDTH, height=_LCDHEIGHT, method=FLOYD_STEINBERG, threshold=128,
+                 bayer_size=_DEFAULT_BAYER_SIZE, use_numpy=None):
+
+        if method not in _METHODS:
+            raise ValueError("Ditherer - unknown method %r." % method)
+        if bayer_size not in _BAYER_SIZES:
+            raise ValueError("Ditherer - the Bayer matrix size must be 2, 4 or 8.")
+
+        self.width = int(width)
+        self.height = int(height)
+        self.method = method
+        self.threshold = int(threshold)
+        self._nPages = (self.height + 7) // 8
+
+        self._np = qwiic_micro_oled._get_numpy() if use_numpy is not False else None
+        if use_numpy and self._np is None:
+            raise ImportError("Ditherer - NumPy isn't installed.")
+
+        # The output, returned by convert() each time
+        self._out = bytearray(self.width * self._nPages)
+
+        # Bayer thresholds - white if the gray value is equal or above
+        matrix = _bayer_matrix(bayer_size)
+        levels = [[(2*level + 1) * 128 // (bayer_size * bayer_size) + self.threshold - 128 \
+                        for level in row] for row in matrix]
+        self._bayerSize = bayer_size
+
+        # Floyd-Steinberg - the error carried down from the row above, in 1/16ths, and the
+        # errors of the current row
+        self._above = [0] * self.width
+        self._errors = [0] * self.width
+        self._rowBits = bytearray(self.width)
+
+        np = self._np
+        if np is not None:
+            self._grayArray = np.zeros((self.height, self.width), dtype=np.uint8)
+            # the rows below the last are never set, so the last page is padded with zeros
+            self._bitArray = np.zeros((self._nPages * 8, self.width), dtype=np.bool_)
+            self._packArray = np.empty((self._nPages, 8, self.width), dtype=np.uint8)
+            self._shiftArray = np.arange(8, dtype=np.uint8).reshape(1, 8, 1)
+            self._outArray = np.frombuffer(self._out, dtype=np.uint8).reshape(self._nPages, self.width)
+            self._bayerArray = np.array([[levels[i % bayer_size][j % bayer_size] for j in range(self.width)] \
+                                            for i in range(self.height)], dtype=np.int16)
+        else:
+            # gray value => 0 or 1, for threshold and for each position in the Bayer matrix
+            self._thresholdTable = bytes(1 if v >= self.threshold else 0 for v in range(256))
+            self._bayerTables = [[bytes(1 if v >= level else 0 for v in range(256)) for level in row] \
+                                    for row in levels]
+
+    #--------------------------------------------------------------------------
+    def convert(self, frame):
+        """
+            Convert a frame to the display's page layout.
+
+            :param frame: The frame - a 2D NumPy array, a sequence of rows, a PIL image, or
+                        bytes of gray values one row after the other. It must be the size
+                        given to the ditherer.
+
+            :return: The page packed frame. The same buffer is returned for every frame and
+                        changed by the next call - copy it to keep it.
+            :rtype: bytearray
+
+        """
+        if self._np is not None:
+            gray = self._gray_array(frame)
+            if self.method != FLOYD_STEINBERG:
+                self._convert_array(gray)
+                return self._out
+            gray = memoryview(self._np.ascontiguousarray(gray)).cast("B")
+        else:
+            gray = self._gray_bytes(frame)
+
+        if self.method == THRESHOLD:
+            row_bits = self._threshold_row
+        elif self.method == BAYER:
+            row_bits = self._bayer_row
+        else:
+            row_bits = self._error_diffusion_row
+
+        # Each row's bits are 0 or 1 bytes. Shifted to the row's bit in its page, the 8 rows
+        # of a page combine into the page's bytes as one large integer.
+        width = self.width
+        for page in range(self._nPages):
+            packed = 0
+            for bit in range(min(8, self.height - page*8)):
+                packed |= int.from_bytes(row_bits(gray, page*8 + bit), "little") << bit
+            self._out[page*width:(page + 1)*width] = packed.to_bytes(width, "little")
+
+        return self._out
+
+    def stream(self, frames):
+        """
+            Convert a stream of frames, one at a time as they're read.
+
+            :param frames: An iterable of frames, as for convert()
+
+            :return: A generator of page packed frames. Each is the same buffer, changed by
+                        the next frame - copy a frame to keep it.
+            :rtype: generator
+
+        """
+        for frame in frames:
+            yield self.convert(frame)
+
+    #--------------------------------------------------------------------------
+    # Input conversion - to a 2D uint8 array with NumPy, to bytes without
+
+    def _size_error(self, size):
+
+        return ValueError("Ditherer - the frame is %dx%d, not %dx%d." % (size[0], size[1], self.width, self.height))
+
+    def _gray_array(self, frame):
+
+        np = self._np
+
+        if _is_image(frame):
+            if frame.mode != "L":
+                frame = frame.convert("L")
+            pixels = np.asarray(frame)
+        elif isinstance(frame, (bytes, bytearray, memoryview)):
+            if len(frame) != self.width * self.height:
+                raise ValueError("Ditherer - the frame must be %d bytes, not %d." % (self.width * self.height, len(frame)))
+            return np.frombuffer(frame, dtype=np.uint8).reshape(self.height, self.width)
+        else:
+            pixels = np.asarray(frame)
+
+        if pixels.shape != (self.height, self.width):
+            raise self._size_error(pixels.shape[::-1] if pixels.ndim == 2 else (0, 0))
+
+        if pixels.dtype == np.uint8:
+            return pixels
+
+        if pixels.dtype == np.bool_:
+            np.multiply(pixels, 255, out=self._grayArray, casting="unsafe")
+        else:
+            np.clip(pixels, 0, 255, out=self._grayArray, casting="unsafe")
+
+        return self._grayArray
+
+    def _gray_bytes(self, frame):
+
+        if _is_image(frame):
+            if frame.size != (self.width, self.height):
+                raise self._size_error(frame.size)
+            return frame.convert("L").tobytes()
+
+        if isinstance(frame, (bytes, bytearray)):
+            gray = frame
+        elif isinstance(frame, memoryview):
+            gray = frame.tobytes()
+        else:
+            rows = list(frame)
+            if len(rows) != self.height or any(len(row) != self.width for row in rows):
+                raise self._size_error((len(rows[0]) if rows else 0, len(rows)))
+            gray = bytes(bytearray(255 if v is True else min(max(int(v), 0), 255) for row in rows for v in row))
+
+        if len(gray) != self.width * self.height:
+            raise ValueError("Ditherer - the frame must be %d bytes, not %d." % (self.width * self.height, len(gray)))
+
+        return gray
+
+    #--------------------------------------------------------------------------
+    # Dithering
+
+    def _convert_array(self, gray):
+
+        # Threshold or Bayer with NumPy, packed into the output buffer through its view
+        np = self._np
+        bits = self._bitArray[:self.height]
+
+        if self.method == THRESHOLD:
+            np.greater_equal(gray, self.threshold, out=bits)
+        else:
+            np.greater_equal(gray, self._bayerArray, out=bits)
+
+        np.left_shift(self._bitArray.view(np.uint8).reshape(self._nPages, 8, self.width), self._shiftArray,
+                      out=self._packArray)
+        np.bitwise_or.reduce(self._packArray, axis=1, out=self._outArray)
+
+    def _threshold_row(self, gray, y):
+
+        return gray[y*self.width:(y + 1)*self.width].translate(self._thresholdTable)
+
+    def _bayer_row(self, gray, y):
+
+        # Every bayer_size-th column shares a threshold, so each takes one translate
+        row = gray[y*self.width:(y + 1)*self.width]
+        bits = self._rowBits
+        tables = self._bayerTables[y % self._bayerSize]
+        for (j, table) in enumerate(tables):
+            bits[j::self._bayerSize] = row[j::self._bayerSize].translate(table)
+
+        return bits
+
+    def _error_diffusion_row(self, gray, y):
+
+        # Floyd-Steinberg: 7/16 of a pixel's error goes to the next pixel, and 3/16, 5/16 and
+        # 1/16 to the pixels below left, below and below right. Errors are kept in 1/16ths.
+        width = self.width
+        above = self._above
+        errors = self._errors
+        bits = self._rowBits
+        threshold = self.threshold
+
+        if y == 0:
+            above[:] = errors[:] = [0] * width
+
+        row = gray[y*width:(y + 1)*width]
+        error = 0
+        for x in range(width):
+            value = row[x] + ((above[x] + 7*error + 8) >> 4)
+            if value >= threshold:
+                bits[x] = 1
+                error = value - 255
+            else:
+                bits[x] = 0
+                error = value
+            errors[x] = error
+
+        above[:] = [3*right + 5*below + left for (right, below, left) in \
+                        zip(errors[1:] + [0], errors, [0] + errors[:-1])]
+
+        return bits
+
+
+def dither(image, method=FLOYD_STEINBERG, threshold=128, bayer_size=_DEFAULT_BAYER_SIZE):
+    """
+        Convert one image to the display's page layout.
+
+        :param image: The image - a 2D NumPy array, a sequence of rows, or a PIL image
+        :param method: THRESHOLD, BAYER or FLOYD_STEINBERG. Default is FLOYD_STEINBERG
+        :param threshold: Gray values equal to or above this are WHITE. Default is 128
+        :param bayer_size: The Bayer matrix size - 2, 4 or 8. Default is 4
+
+        :return: The page packed image, width * ceil(height / 8) bytes
+        :rtype: bytes
+
+    """
+    if _is_image(image):
+        (width, height) = image.size
+    else:
+        np = qwiic_micro_oled._get_numpy()
+        if np is not None:
+            image = np.asarray(image)
+            if image.ndim != 2:
+                raise ValueError("dither - image must be two dimensional.")
+            (height, width) = image.shape
+        else:
+            image = [list(row) for row in image]
+            height = len(image)
+            width = len(image[0]) if image else 0
+
+    return bytes(Ditherer(width, height, method, threshold, bayer_size).convert(image))
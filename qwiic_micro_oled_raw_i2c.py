@@ -0,0 +1,291 @@
+#-----------------------------------------------------------------------------
+# qwiic_micro_oled_raw_i2c.py
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, May 2021
+#
+#
+# More information on qwiic is at https:= www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2021 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name, too-few-public-methods
+
+"""
+qwiic_micro_oled_raw_i2c
+========================
+A write only I2C driver for Linux that sends plain I2C messages through the /dev/i2c-N
+device, rather than SMBus block writes.
+
+SMBus block writes carry at most 32 bytes, so a window of the display takes several
+transactions. Plain I2C messages can be up to 8 KB, so each window is written in a single
+message. With the I2C_RDWR ioctl, all the messages of a frame are sent to the kernel in
+one call.
+
+Use it with the raw_i2c option of the display object - it falls back to the qwiic SMBus
+driver if the bus doesn't support plain I2C::
+
+    oled = qwiic_micro_oled.QwiicMicroOled(raw_i2c=True)
+
+or create the driver directly::
+
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=qwiic_micro_oled_raw_i2c.get_i2c_driver(bus=1))
+
+"""
+
+from __future__ import print_function
+import os
+import sys
+import errno
+import ctypes
+import contextlib
+
+import qwiic_i2c
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# i2c-dev ioctls and flags, from linux/i2c-dev.h and linux/i2c.h
+_I2C_SLAVE              = 0x0703
+_I2C_FUNCS              = 0x0705
+_I2C_RDWR               = 0x0707
+_I2C_FUNC_I2C           = 0x00000001
+
+# The most messages i2c-dev takes in one I2C_RDWR call, and the longest message
+_RDWR_MAX_MESSAGES      = 42
+_MAX_MESSAGE_SIZE       = 8192
+
+# Write modes
+MODE_RDWR               = "rdwr"    # I2C_RDWR ioctl - messages can be batched
+MODE_WRITE              = "write"   # I2C_SLAVE ioctl, then write()
+
+_DEVICE_PATH            = "/dev/i2c-%d"
+
+# The system calls, kept here so they can be replaced to test without a device
+_ioctl = fcntl.ioctl if fcntl is not None else None
+_open = os.open
+_write = os.write
+_close = os.close
+
+
+class _I2CMessage(ctypes.Structure):
+
+    # struct i2c_msg
+    _fields_ = [("addr", ctypes.c_uint16),
+                ("flags", ctypes.c_uint16),
+                ("len", ctypes.c_uint16),
+                ("buf", ctypes.POINTER(ctypes.c_uint8))]
+
+
+class _I2CRdwrData(ctypes.Structure):
+
+    # struct i2c_rdwr_ioctl_data
+    _fields_ = [("msgs", ctypes.POINTER(_I2CMessage)),
+                ("nmsgs", ctypes.c_uint32)]
+
+
+class RawI2C(object):
+    """
+    RawI2C
+
+        A write only I2C driver with the write interface of the qwiic I2C drivers, sending
+        each write as one plain I2C message on a Linux /dev/i2c-N device.
+
+        :param bus: The I2C bus number. Default is 1
+        :param mode: "rdwr" to write with the I2C_RDWR ioctl, "write" to write() to the
+                        device. Default is None, for I2C_RDWR.
+        :param device: The device path. Default is /dev/i2c-<bus>
+        :return: The driver object. Raises an OSError if the device can't be opened, or
+                        the bus doesn't support plain I2C messages.
+        :rtype: Object
+    """
+
+    # The most bytes written in one block write, after the control byte
+    max_block_size = _MAX_MESSAGE_SIZE - 1
+
+    def __init__(self, bus=1, mode=None, device=None):
+
+        if _ioctl is None:
+            raise OSError(errno.ENOSYS, "RawI2C - I2C devices are only available on Linux")
+
+        if mode is None:
+            mode = MODE_RDWR
+        if mode not in (MODE_RDWR, MODE_WRITE):
+            raise ValueError("RawI2C - unknown mode %r" % mode)
+
+        self.mode = mode
+        self.device = device if device is not None else _DEVICE_PATH % bus
+        self._fd = _open(self.device, os.O_RDWR)
+
+        # Check that the adapter does plain I2C, not only SMBus
+        try:
+            funcs = ctypes.c_ulong(0)
+            _ioctl(self._fd, _I2C_FUNCS, funcs)
+            if not funcs.value & _I2C_FUNC_I2C:
+                raise OSError(errno.EOPNOTSUPP, "RawI2C - %s doesn't support plain I2C messages" % self.device)
+        except OSError:
+            _close(self._fd)
+            self._fd = None
+            raise
+
+        self._slaveAddress = None
+        self._batch = None
+
+    def close(self):
+        """
+            Close the I2C device.
+
+            :return: No return value
+
+        """
+        if self._fd is not None:
+            _close(self._fd)
+            self._fd = None
+
+    #--------------------------------------------------------------------------
+    @contextlib.contextmanager
+    def batch(self):
+        """
+            Collect the writes made in a with block, and send them in as few I2C_RDWR calls as
+            possible when the block ends. Each write is still a message of its own on the bus.
+            In "write" mode, writes are sent right away.
+
+            :return: A context manager
+
+        """
+        if self.mode != MODE_RDWR or self._batch is not None:
+            yield
+            return
+
+        self._batch = []
+        try:
+            yield
+            messages = self._batch
+        finally:
+            self._batch = None
+
+        for iStart in range(0, len(messages), _RDWR_MAX_MESSAGES):
+            self._transfer(messages[iStart:iStart + _RDWR_MAX_MESSAGES])
+
+    def _message(self, address, payload):
+
+        payload = bytes(payload)
+        if len(payload) > _MAX_MESSAGE_SIZE:
+            raise ValueError("RawI2C - a message is limited to %d bytes" % _MAX_MESSAGE_SIZE)
+
+        if self.mode == MODE_WRITE:
+            if self._slaveAddress != address:
+                _ioctl(self._fd, _I2C_SLAVE, address)
+                self._slaveAddress = address
+            _write(self._fd, payload)
+            return
+
+        # the buffer goes with the message, to keep it alive until it's sent
+        buf = (ctypes.c_uint8 * max(len(payload), 1)).from_buffer_copy(payload or b"\x00")
+        message = (_I2CMessage(address, 0, len(payload), ctypes.cast(buf, ctypes.POINTER(ctypes.c_uint8))), buf)
+
+        if self._batch is not None:
+            self._batch.append(message)
+        else:
+            self._transfer([message])
+
+    def _transfer(self, messages):
+
+        msgs = (_I2CMessage * len(messages))(*[message for (message, _) in messages])
+        _ioctl(self._fd, _I2C_RDWR, _I2CRdwrData(msgs, len(messages)))
+
+    #--------------------------------------------------------------------------
+    # qwiic I2C driver write interface
+
+    def writeCommand(self, address, commandCode):
+        self._message(address, bytes((commandCode,)))
+
+    def write_command(self, address, commandCode):
+        return self.writeCommand(address, commandCode)
+
+    def writeByte(self, address, commandCode, value):
+        self._message(address, bytes((commandCode, value & 0xFF)))
+
+    def write_byte(self, address, commandCode, value):
+        return self.writeByte(address, commandCode, value)
+
+    def writeWord(self, address, commandCode, value):
+        self._message(address, bytes((commandCode, value & 0xFF, (value >> 8) & 0xFF)))
+
+    def write_word(self, address, commandCode, value):
+        return self.writeWord(address, commandCode, value)
+
+    def writeBlock(self, address, commandCode, value):
+        self._message(address, bytes((commandCode,)) + bytes(value))
+
+    def write_block(self, address, commandCode, value):
+        return self.writeBlock(address, commandCode, value)
+
+    def isDeviceConnected(self, devAddress):
+        """
+            Determine if a device answers at an address, with an empty write.
+
+            :param devAddress: The I2C address of the device
+
+            :return: True if the device answered, otherwise False.
+            :rtype: bool
+
+        """
+        try:
+            if self.mode == MODE_RDWR:
+                self._transfer([(_I2CMessage(devAddress, 0, 0, None), None)])
+            else:
+                self._message(devAddress, b"")
+        except OSError:
+            return False
+
+        return True
+
+    def is_device_connected(self, devAddress):
+        return self.isDeviceConnected(devAddress)
+
+
+def get_i2c_driver(bus=1, mode=None):
+    """
+        Return a raw I2C driver for the bus if it supports plain I2C messages, otherwise the
+        qwiic I2C driver for the platform.
+
+        :param bus: The I2C bus number. Default is 1
+        :param mode: The raw driver's write mode, see RawI2C. Default is None
+
+        :return: The I2C driver
+        :rtype: Object
+
+    """
+    try:
+        return RawI2C(bus, mode)
+    except OSError as exError:
+        print("Raw I2C isn't available on bus %d (%s), using the qwiic I2C driver" % (bus, exError),
+              file=sys.stderr)
+
+    return qwiic_i2c.getI2CDriver() if bus == 1 else qwiic_i2c.getI2CDriver(iBus=bus)
@@ -0,0 +1,555 @@
+#-----------------------------------------------------------------------------
+# qwiic_micro_oled_recorder.py
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, May 2021
+#
+#
+# More information on qwiic is at https:= www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2021 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name, too-many-instance-attributes, too-many-arguments
+# pylint: disable=too-many-branches
+
+"""
+qwiic_micro_oled_recorder
+=========================
+Record the frames sent to a display into a compact file, and play them back.
+
+A Recorder captures each frame written to the device by display(), with the time it was
+written::
+
+    with qwiic_micro_oled_recorder.Recorder("demo.qmor", oled):
+        run_demo(oled)
+
+Each frame is stored as the difference from the frame before it: runs of unchanged bytes
+are skipped, runs of one repeated value are filled, and only the remaining bytes are copied.
+A frame that didn't change costs a couple of bytes.
+
+A Player reads a recording back. It can stream the frames to a display - at the recorded
+speed, or as fast as the bus allows - and since only the bytes that changed are written to
+the screen buffer, playback is mostly just the I2C writes. The frames can also be read for
+comparing against a reference, or exported as PNG images or an animated GIF (requires Pillow).
+
+"""
+
+from __future__ import print_function, division
+import struct
+import threading
+import time
+
+# File header - magic, format version, display width and height
+_MAGIC                  = b"QMOR"
+_VERSION                = 1
+_HEADER                 = struct.Struct("<4sBHH")
+
+# Default display size, the Micro OLED's
+_LCDWIDTH               = 64
+_LCDHEIGHT              = 48
+
+# Delta operations. Each is a varint of (count << 2) | operation, followed by the count
+# bytes to copy (_COPY) or the single byte value to fill with (_FILL).
+_SKIP                   = 0
+_COPY                   = 1
+_FILL                   = 2
+
+# Runs of one value shorter than this are cheaper to copy than to fill
+_MIN_FILL               = 4
+
+# Unchanged runs shorter than this are cheaper to copy than to skip
+_MIN_SKIP               = 3
+
+# GIF frame time for the last frame, which has no next frame to time it, in milliseconds
+_LAST_FRAME_MS          = 100
+
+def _put_varint(out, value):
+
+    # unsigned LEB128 - 7 bits per byte, low bits first
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _get_varint(data, i):
+
+    value = 0
+    shift = 0
+    while True:
+        byte = data[i]
+        i += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return (value, i)
+        shift += 7
+
+def _encode_delta(frame, prev, lineSize):
+    """
+        Encode a frame as the delta operations that turn the previous frame into it.
+    """
+    out = bytearray()
+    n = len(frame)
+    i = 0
+    while i < n:
+
+        # skip unchanged bytes - whole lines at a time while possible
+        start = i
+        while i + lineSize <= n and frame[i:i + lineSize] == prev[i:i + lineSize]:
+            i += lineSize
+        while i < n and frame[i] == prev[i]:
+            i += 1
+        if i == n:
+            break
+        if i > start:
+            _put_varint(out, ((i - start) << 2) | _SKIP)
+
+        # the changed run - ended by enough unchanged bytes in a row
+        copyStart = i
+        while i < n:
+            value = frame[i]
+            if value == prev[i]:
+                k = i + 1
+                while k < n and k - i < _MIN_SKIP and frame[k] == prev[k]:
+                    k += 1
+                if k - i >= _MIN_SKIP or k == n:
+                    break
+                i = k
+                continue
+
+            k = i + 1
+            while k < n and frame[k] == value:
+                k += 1
+            if k - i >= _MIN_FILL:
+                if i > copyStart:
+                    _put_varint(out, ((i - copyStart) << 2) | _COPY)
+                    out += frame[copyStart:i]
+                _put_varint(out, ((k - i) << 2) | _FILL)
+                out.append(value)
+                copyStart = k
+            i = k
+
+        if i > copyStart:
+            _put_varint(out, ((i - copyStart) << 2) | _COPY)
+            out += frame[copyStart:i]
+
+    return out
+
+def _apply_delta(payload, frame):
+    """
+        Apply a frame's delta operations to the previous frame, in place. Returns the
+        [start, end) byte ranges that were written.
+    """
+    ranges = []
+    n = len(payload)
+    i = 0
+    pos = 0
+    while i < n:
+        (header, i) = _get_varint(payload, i)
+        operation = header & 0x03
+        count = header >> 2
+        if pos + count > len(frame):
+            raise ValueError("Recording frame data is larger than the display.")
+
+        if operation == _SKIP:
+            pos += count
+            continue
+
+        if operation == _COPY:
+            frame[pos:pos + count] = payload[i:i + count]
+            i += count
+        elif operation == _FILL:
+            frame[pos:pos + count] = bytes((payload[i],)) * count
+            i += 1
+        else:
+            raise ValueError("Recording frame data is corrupt.")
+
+        # join touching ranges, so they're written to the display together
+        if ranges and ranges[-1][1] == pos:
+            ranges[-1] = (ranges[-1][0], pos + count)
+        else:
+            ranges.append((pos, pos + count))
+        pos += count
+
+    return ranges
+
+def _frame_image(frame, width, height, scale):
+
+    # A PIL image of a page packed frame. Each page is unpacked with its column bytes as the
+    # rows of an 8 pixel wide image (bit 0 on the left), then turned on its side.
+    from PIL import Image
+
+    transpose = getattr(Image, "Transpose", Image)
+    resampling = getattr(Image, "Resampling", Image)
+
+    nPages = (height + 7) // 8
+    image = Image.new("1", (width, nPages * 8), 0)
+    for page in range(nPages):
+        strip = Image.frombytes("1", (8, width), bytes(frame[page * width:(page + 1) * width]), "raw", "1;R")
+        image.paste(strip.transpose(transpose.TRANSPOSE), (0, page * 8))
+
+    if height != nPages * 8:
+        image = image.crop((0, 0, width, height))
+    if scale > 1:
+        image = image.resize((width * scale, height * scale), resampling.NEAREST)
+
+    return image
+
+
+class Recorder(object):
+    """
+    Recorder
+
+        Records frames into a file. Frames are added with add_frame(), or - if a display is
+        given - captured from the display each time a frame is written to the device.
+
+        :param target: The file name to write, or a file object open for binary writing.
+        :param oled: The display to capture frames from. Default is None, for frames
+                        added with add_frame()
+        :param width: The frame width, if no display is given. Default is 64
+        :param height: The frame height, if no display is given. Default is 48
+        :return: The recorder object.
+        :rtype: Object
+    """
+
+    def __init__(self, target, oled=None, width=_LCDWIDTH, height=_LCDHEIGHT):
+
+        self._target = target
+        self._oled = oled
+        if oled is not None:
+            (width, height) = (oled.LCDWIDTH, oled.LCDHEIGHT)
+
+        self.width = int(width)
+        self.height = int(height)
+        self._frameSize = self.width * ((self.height + 7) // 8)
+
+        self._file = None
+        self._ownFile = False
+        self._prev = None
+        self._startTime = 0.
+        self._lastTime = 0.
+        self._nFrames = 0
+        self._nBytes = 0
+
+        # frames from a display may arrive from its background display thread
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    #--------------------------------------------------------------------------
+    def start(self):
+        """
+            Open the recording, and start capturing frames from the display, if there is one.
+            Frame times are measured from this call.
+
+            :return: No return value
+
+        """
+        with self._lock:
+            if self._file is not None:
+                return
+
+            if hasattr(self._target, "write"):
+                self._file = self._target
+                self._ownFile = False
+            else:
+                self._file = open(self._target, "wb")
+                self._ownFile = True
+
+            header = _HEADER.pack(_MAGIC, _VERSION, self.width, self.height)
+            self._file.write(header)
+            self._nBytes = len(header)
+
+            # the first frame is stored as the difference from a blank frame
+            self._prev = bytearray(self._frameSize)
+            self._startTime = time.perf_counter()
+            self._lastTime = 0.
+            self._nFrames = 0
+
+        if self._oled is not None:
+            self._oled.set_frame_hook(self.add_frame)
+
+    def stop(self):
+        """
+            Stop capturing frames and close the recording. A file object passed to the
+            recorder is flushed, but not closed.
+
+            :return: No return value
+
+        """
+        if self._oled is not None:
+            self._oled.set_frame_hook(None)
+
+        with self._lock:
+            if self._file is None:
+                return
+
+            if self._ownFile:
+                self._file.close()
+            else:
+                self._file.flush()
+            self._file = None
+
+    #--------------------------------------------------------------------------
+    def add_frame(self, frame, timestamp=None):
+        """
+            Add a frame to the recording.
+
+            :param frame: The page packed frame - one byte per column for each page,
+                        bit 0 at the top. The layout of a display's screen buffer.
+            :param timestamp: The time of the frame, in seconds from start(). Default is now.
+
+            :return: No return value
+
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter() - self._startTime
+
+        if len(frame) != self._frameSize:
+            raise ValueError("add_frame - the frame size doesn't match the recording.")
+
+        with self._lock:
+            if self._file is None:
+                raise ValueError("add_frame - the recorder isn't started.")
+
+            # times are stored in microseconds, relative to the frame before
+            delta = max(int(round((timestamp - self._lastTime) * 1000000)), 0)
+            self._lastTime += delta / 1000000.
+
+            payload = _encode_delta(frame, self._prev, self.width)
+            record = bytearray()
+            _put_varint(record, delta)
+            _put_varint(record, len(payload))
+            record += payload
+
+            self._file.write(record)
+            self._prev[:] = frame
+            self._nFrames += 1
+            self._nBytes += len(record)
+
+    def get_frame_count(self):
+        """
+            Return the number of frames recorded.
+
+            :return: The number of frames
+            :rtype: integer
+
+        """
+        return self._nFrames
+
+    frame_count = property(get_frame_count)
+
+    def get_size(self):
+        """
+            Return the size of the recording so far, in bytes.
+
+            :return: The recording size
+            :rtype: integer
+
+        """
+        return self._nBytes
+
+    size = property(get_size)
+
+
+class Player(object):
+    """
+    Player
+
+        Reads a recording, to play it on a display, read its frames or export them as images.
+
+        :param source: The file name to read, or a file object open for binary reading.
+        :return: The player object.
+        :rtype: Object
+    """
+
+    def __init__(self, source):
+
+        if hasattr(source, "read"):
+            data = source.read()
+        else:
+            with open(source, "rb") as fRecording:
+                data = fRecording.read()
+
+        if len(data) < _HEADER.size:
+            raise ValueError("Player - not a recording.")
+
+        (magic, version, self.width, self.height) = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Player - not a recording.")
+        if version != _VERSION:
+            raise ValueError("Player - unsupported recording version %d." % version)
+
+        self._frameSize = self.width * ((self.height + 7) // 8)
+
+        # Index the frames - (time in seconds, delta payload)
+        view = memoryview(data)
+        self._frames = []
+        timestamp = 0
+        i = _HEADER.size
+        while i < len(data):
+            (delta, i) = _get_varint(data, i)
+            (nPayload, i) = _get_varint(data, i)
+            if i + nPayload > len(data):
+                raise ValueError("Player - the recording is truncated.")
+
+            timestamp += delta
+            self._frames.append((timestamp / 1000000., view[i:i + nPayload]))
+            i += nPayload
+
+    def __len__(self):
+        return len(self._frames)
+
+    def get_duration(self):
+        """
+            Return the time of the last frame, from the start of the recording.
+
+            :return: The duration, in seconds
+            :rtype: float
+
+        """
+        return self._frames[-1][0] if self._frames else 0.
+
+    duration = property(get_duration)
+
+    #--------------------------------------------------------------------------
+    def frames(self):
+        """
+            Iterate over the frames of the recording.
+
+            :return: A generator of (timestamp, frame) tuples - the time of the frame in seconds
+                        from the start of the recording, and the page packed frame.
+            :rtype: generator
+
+        """
+        frame = bytearray(self._frameSize)
+        for (timestamp, payload) in self._frames:
+            _apply_delta(payload, frame)
+            yield (timestamp, bytes(frame))
+
+    def play(self, oled, realtime=True, speed=1.0, loop=False):
+        """
+            Play the recording on a display. Each frame's changes are written to the screen
+            buffer, and sent to the device with display().
+
+            :param oled: The display to play on. It has to be the size of the recording.
+            :param realtime: True to play the frames at the times they were recorded, False to
+                        play them as fast as possible. Default is True
+            :param speed: Playback speed, relative to the recorded speed. Default is 1.0
+            :param loop: True to play the recording over and over. Default is False
+
+            :return: The number of frames played
+            :rtype: integer
+
+        """
+        if (oled.LCDWIDTH, oled.LCDHEIGHT) != (self.width, self.height):
+            raise ValueError("play - the display size doesn't match the recording.")
+
+        nPlayed = 0
+        frame = bytearray(self._frameSize)
+        while True:
+            frame[:] = bytes(self._frameSize)
+            tStart = time.perf_counter()
+            for (i, (timestamp, payload)) in enumerate(self._frames):
+                ranges = _apply_delta(payload, frame)
+
+                # the display's contents aren't known before the first frame, so it's sent whole
+                if i == 0:
+                    ranges = [(0, self._frameSize)]
+
+                if realtime:
+                    wait = tStart + timestamp / speed - time.perf_counter()
+                    if wait > 0:
+                        time.sleep(wait)
+
+                for (start, end) in ranges:
+                    oled.write_buffer(frame[start:end], start)
+                oled.display()
+                nPlayed += 1
+
+            if not loop or not self._frames:
+                return nPlayed
+
+    #--------------------------------------------------------------------------
+    def images(self, scale=1):
+        """
+            Iterate over the frames of the recording as images. Requires Pillow.
+
+            :param scale: Size of each display pixel in the images, in image pixels. Default is 1
+
+            :return: A generator of (timestamp, image) tuples - the time of the frame in seconds
+                        from the start of the recording, and a PIL image (mode "1") of the frame.
+            :rtype: generator
+
+        """
+        for (timestamp, frame) in self.frames():
+            yield (timestamp, _frame_image(frame, self.width, self.height, int(scale)))
+
+    def export_png(self, pattern, scale=1):
+        """
+            Save each frame of the recording as a PNG image. Requires Pillow.
+
+            :param pattern: The file name pattern, formatted with the frame number - for
+                        example "frame%04d.png"
+            :param scale: Size of each display pixel in the images, in image pixels. Default is 1
+
+            :return: The number of images saved
+            :rtype: integer
+
+        """
+        nImages = 0
+        for (_, image) in self.images(scale):
+            image.save(pattern % nImages, "PNG")
+            nImages += 1
+
+        return nImages
+
+    def export_gif(self, path, scale=1, loop=0):
+        """
+            Save the recording as an animated GIF, with the recorded frame times. Requires Pillow.
+
+            :param path: The file name to save
+            :param scale: Size of each display pixel in the image, in image pixels. Default is 1
+            :param loop: The number of times the animation repeats - 0 repeats forever.
+                        Default is 0
+
+            :return: No return value
+
+        """
+        frames = list(self.images(scale))
+        if not frames:
+            raise ValueError("export_gif - the recording has no frames.")
+
+        images = [image for (_, image) in frames]
+        durations = [int(round((frames[i + 1][0] - frames[i][0]) * 1000)) for i in range(len(frames) - 1)]
+        durations.append(_LAST_FRAME_MS)
+
+        images[0].save(path, "GIF", save_all=True, append_images=images[1:],
+                        duration=durations, loop=loop)
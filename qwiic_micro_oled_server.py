@@ -0,0 +1,536 @@
+#-----------------------------------------------------------------------------
+# qwiic_micro_oled_server.py
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, May 2021
+#
+#
+# More information on qwiic is at https:= www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2021 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name, too-many-instance-attributes, too-many-arguments
+
+"""
+qwiic_micro_oled_server
+=======================
+A display server, so several processes can share one display.
+
+The server owns the device: it sets the display up once, and is the only process on its
+I2C address. Clients connect to it over a Unix domain socket and send the parts of the
+screen they changed. The server copies them into its screen buffer, and sends the changes
+to the device at most once per frame tick. Start it with::
+
+    python -m qwiic_micro_oled_server --socket /tmp/qwiic_micro_oled.sock
+
+The socket is made with mode 0600, so only the user running the server can connect. Use
+--mode 660 to let the members of the socket's group connect too.
+
+A DisplayClient has the drawing API of the display object, so programs only change how the
+display is created::
+
+    oled = qwiic_micro_oled_server.DisplayClient(y=32, height=16)
+    oled.begin()
+    oled.clear(oled.PAGE)
+    oled.print("Alert!")
+    oled.display()
+
+Each client draws into a window of the screen - all of it by default - and clear() only
+clears that window, so clients sharing the screen don't overwrite each other.
+
+Protocol
+--------
+On connect, the server sends a header: the magic b"QMOS", the protocol version, and the
+display width and height (struct "<4sBHH"). Each client message is a header (struct
+"<BhhHH": operation, x, y, width, height) followed by its data:
+
+* REGION (1) - the pixels of a rectangle of the screen, page packed: one byte per column
+  for each 8 rows, bit 0 at the top. width * ((height + 7) // 8) bytes.
+* END (2) - the end of an update. The regions sent since the last END are copied into the
+  screen buffer together, so a frame never shows half an update.
+* SYNC (3) - the server answers with one byte once everything received before it has
+  been written to the device.
+
+"""
+
+from __future__ import print_function
+import os
+import sys
+import stat
+import time
+import socket
+import struct
+import argparse
+import threading
+import socketserver
+
+import qwiic_micro_oled
+
+# Default socket path
+DEFAULT_SOCKET          = "/tmp/qwiic_micro_oled.sock"
+
+# Default socket permissions - only the user running the server can connect
+DEFAULT_MODE            = 0o600
+
+# Default frame tick rate, in frames per second
+_DEFAULT_FPS            = 30
+
+# Connection header - magic, protocol version, display width and height
+_MAGIC                  = b"QMOS"
+_VERSION                = 1
+_HELLO                  = struct.Struct("<4sBHH")
+
+# Client messages - operation, x, y, width, height
+_MESSAGE                = struct.Struct("<BhhHH")
+_OP_REGION              = 1
+_OP_END                 = 2
+_OP_SYNC                = 3
+
+# Answer to a SYNC message
+_SYNC_DONE              = b"\x01"
+
+
+class _ClientHandler(socketserver.BaseRequestHandler):
+
+    def handle(self):
+        self.server.displayServer._serve_client(self.request)
+
+
+class _SocketServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+
+    daemon_threads = True
+
+
+class DisplayServer(object):
+    """
+    DisplayServer
+
+        Serves a display to clients over a Unix domain socket. The display should already be
+        set up with begin(); the server takes it over, and writes frames with background
+        display enabled.
+
+        :param oled: The display object to serve
+        :param path: The socket path. Default is /tmp/qwiic_micro_oled.sock
+        :param fps: The most frames per second written to the device. Default is 30
+        :param mode: The socket's permissions. Default is 0o600, for the user running the server
+                        only. Use 0o660 to let a group of users connect.
+        :return: The display server object.
+        :rtype: Object
+    """
+
+    def __init__(self, oled, path=DEFAULT_SOCKET, fps=_DEFAULT_FPS, mode=DEFAULT_MODE):
+
+        self.oled = oled
+        self.path = path
+        self.mode = mode
+        self._interval = 1. / fps
+
+        self._server = None
+        self._threads = []
+        self._stopped = threading.Event()
+
+        # The screen buffer is shared by the client threads and the frame tick. _changed
+        # is set when a client update hasn't been displayed yet. Frames are counted when
+        # handed to the device (_submitSeq), and when written (_flushedSeq).
+        self._cond = threading.Condition()
+        self._changed = False
+        self._submitSeq = 0
+        self._flushedSeq = 0
+
+        # Set while writes to the device fail, so an error is reported once
+        self._failing = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    #--------------------------------------------------------------------------
+    def start(self):
+        """
+            Start serving clients, and start the frame tick. Returns once the socket is
+            listening.
+
+            :return: No return value
+
+        """
+        if self._server is not None:
+            return
+
+        # A socket left behind by a server that didn't stop cleanly is removed. If a server
+        # is still listening on it, don't take over - and anything that isn't a socket is
+        # never removed.
+        if os.path.lexists(self.path):
+            if not stat.S_ISSOCK(os.lstat(self.path).st_mode):
+                raise RuntimeError("DisplayServer - %s exists and isn't a socket" % self.path)
+
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.path)
+                raise RuntimeError("DisplayServer - a server is already running on %s" % self.path)
+            except OSError:
+                os.unlink(self.path)
+            finally:
+                probe.close()
+
+        self._stopped.clear()
+        self.oled.set_background_display(True)
+
+        # The socket is made with the permissions asked for, so no other user can connect
+        # before they're set
+        oldUmask = os.umask(~self.mode & 0o777)
+        try:
+            self._server = _SocketServer(self.path, _ClientHandler)
+        finally:
+            os.umask(oldUmask)
+        os.chmod(self.path, self.mode)
+        self._server.displayServer = self
+
+        self._threads = [threading.Thread(target=self._server.serve_forever, name="DisplayServer clients"),
+                         threading.Thread(target=self._run_ticks, name="DisplayServer frames")]
+        for thread in self._threads:
+            thread.daemon = True
+            thread.start()
+
+    def stop(self):
+        """
+            Stop serving, and remove the socket. Changes already received are written to the
+            device first.
+
+            :return: No return value
+
+        """
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+
+        with self._cond:
+            self._stopped.set()
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+        self._server = None
+        self._threads = []
+
+        if os.path.lexists(self.path) and stat.S_ISSOCK(os.lstat(self.path).st_mode):
+            os.unlink(self.path)
+
+        self.oled.set_background_display(False)
+
+    def serve_forever(self):
+        """
+            Start the server, and serve until interrupted (KeyboardInterrupt).
+
+            :return: No return value
+
+        """
+        self.start()
+        try:
+            while not self._stopped.wait(1.):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    #--------------------------------------------------------------------------
+    def _run_ticks(self):
+
+        # Write the screen buffer to the device at most once a tick, and only if it changed
+        nextTick = time.perf_counter()
+        while True:
+            nextTick += self._interval
+            wait = nextTick - time.perf_counter()
+            if wait > 0:
+                self._stopped.wait(wait)
+            else:
+                nextTick = time.perf_counter()
+
+            stopping = self._stopped.is_set()
+            error = None
+            with self._cond:
+                if self._changed:
+                    self._changed = False
+                    try:
+                        self.oled.display()
+                    except Exception as exError: # pylint: disable=broad-except
+                        error = exError
+                    self._submitSeq += 1
+                seq = self._submitSeq
+
+            if seq != self._flushedSeq:
+                try:
+                    self.oled.wait_display()
+                except Exception as exError: # pylint: disable=broad-except
+                    error = exError
+
+                # Waiting clients are released either way. After an error the regions that
+                # weren't written are still dirty, and are tried again next tick.
+                with self._cond:
+                    if error is not None:
+                        self._changed = True
+                    self._flushedSeq = seq
+                    self._cond.notify_all()
+
+            if error is not None and not self._failing:
+                print("DisplayServer - error writing to the display: %s" % error, file=sys.stderr)
+            self._failing = error is not None
+
+            if stopping:
+                return
+
+    def _serve_client(self, sock):
+
+        reader = sock.makefile("rb")
+        try:
+            sock.sendall(_HELLO.pack(_MAGIC, _VERSION, self.oled.LCDWIDTH, self.oled.LCDHEIGHT))
+
+            regions = []
+            while True:
+                header = reader.read(_MESSAGE.size)
+                if len(header) < _MESSAGE.size:
+                    return
+                (operation, x, y, width, height) = _MESSAGE.unpack(header)
+
+                if operation == _OP_REGION:
+                    nBytes = width * ((height + 7) // 8)
+                    data = reader.read(nBytes)
+                    if len(data) < nBytes:
+                        return
+                    regions.append((x, y, width, height, data))
+
+                elif operation == _OP_END:
+                    with self._cond:
+                        for region in regions:
+                            self._apply_region(*region)
+                        self._changed = True
+                    regions = []
+
+                elif operation == _OP_SYNC:
+                    with self._cond:
+                        # a tick with nothing to write still counts, so the wait ends
+                        self._changed = True
+                        target = self._submitSeq + 1
+                        self._cond.wait_for(lambda: self._flushedSeq >= target or self._stopped.is_set())
+                    sock.sendall(_SYNC_DONE)
+
+                else:
+                    print("DisplayServer - unknown message %d, closing the connection." % operation,
+                          file=sys.stderr)
+                    return
+        except OSError:
+            return
+        finally:
+            reader.close()
+
+    def _apply_region(self, x, y, width, height, data):
+
+        # Whole pages on the screen are copied straight into the screen buffer. Anything
+        # else is blitted, which masks the rows outside the region and clips it.
+        oled = self.oled
+        lineWidth = oled.LCDWIDTH
+        if y % 8 == 0 and x >= 0 and x + width <= lineWidth and y + height <= oled.LCDHEIGHT \
+                and (height % 8 == 0 or y + height == oled.LCDHEIGHT):
+            for page in range((height + 7) // 8):
+                oled.write_buffer(data[page * width:(page + 1) * width], (y // 8 + page) * lineWidth + x)
+            return
+
+        oled.blit(qwiic_micro_oled.Sprite(width, height, data), x, y, oled.MASK)
+
+
+class DisplayClient(qwiic_micro_oled.Canvas):
+    """
+    DisplayClient
+
+        A display on a display server, with the drawing API of the display object. The client
+        draws into a window of the server's screen, and display() sends the parts of it that
+        changed. Coordinates are relative to the window.
+
+        The server owns the device - begin() does nothing, and device commands (contrast,
+        invert, hardware scrolling and so on) aren't available.
+
+        :param path: The server's socket path. Default is /tmp/qwiic_micro_oled.sock
+        :param x: The left edge of the window on the screen. Default is 0
+        :param y: The top edge of the window on the screen. Default is 0
+        :param width: The width of the window. Default is the rest of the screen
+        :param height: The height of the window. Default is the rest of the screen
+        :return: The display client object.
+        :rtype: Object
+    """
+
+    def __init__(self, path=DEFAULT_SOCKET, x=0, y=0, width=None, height=None):
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(path)
+        reader = sock.makefile("rb")
+
+        hello = reader.read(_HELLO.size)
+        if len(hello) < _HELLO.size:
+            sock.close()
+            raise ValueError("DisplayClient - no answer from the display server.")
+        (magic, version, screenWidth, screenHeight) = _HELLO.unpack(hello)
+        if magic != _MAGIC or version != _VERSION:
+            sock.close()
+            raise ValueError("DisplayClient - not a compatible display server.")
+
+        if width is None:
+            width = screenWidth - x
+        if height is None:
+            height = screenHeight - y
+
+        super().__init__(width, height)
+
+        self._sock = sock
+        self._reader = reader
+        self._windowX = int(x)
+        self._windowY = int(y)
+
+        # Nothing is sent until the client draws something
+        self._mark_clean()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    #--------------------------------------------------------------------------
+    def begin(self):
+        """
+            The server has already set up the display - nothing to do.
+
+            :return: No return value
+
+        """
+
+    def is_connected(self):
+        """
+            Determine if the client is connected to the display server.
+
+            :return: True if connected, otherwise False.
+            :rtype: bool
+
+        """
+        return self._sock is not None
+
+    connected = property(is_connected)
+
+    def close(self):
+        """
+            Close the connection to the display server.
+
+            :return: No return value
+
+        """
+        if self._sock is None:
+            return
+
+        self._reader.close()
+        self._sock.close()
+        self._sock = None
+
+    #--------------------------------------------------------------------------
+    def display(self):
+        """
+            Send the parts of the window changed since the last call to the server, in one
+            update. The server shows them on its next frame.
+
+            :return: No return value
+
+        """
+        message = bytearray()
+        for page in range(self._nPages):
+            lo = self._dirtyLo[page]
+            hi = self._dirtyHi[page]
+            if lo >= hi:
+                continue
+
+            iLine = page * self.LCDWIDTH
+            message += _MESSAGE.pack(_OP_REGION, self._windowX + lo, self._windowY + page * 8,
+                                     hi - lo, min(8, self.LCDHEIGHT - page * 8))
+            message += self._screenbuffer[iLine + lo:iLine + hi]
+
+        if not message:
+            return
+
+        message += _MESSAGE.pack(_OP_END, 0, 0, 0, 0)
+        self._sock.sendall(message)
+
+        self._mark_clean()
+        self._pages = None
+
+    def sync(self):
+        """
+            Wait until everything sent to the server has been written to the device.
+
+            :return: No return value
+
+        """
+        self._sock.sendall(_MESSAGE.pack(_OP_SYNC, 0, 0, 0, 0))
+        if self._reader.read(len(_SYNC_DONE)) != _SYNC_DONE:
+            raise ValueError("DisplayClient - the display server closed the connection.")
+
+
+def main():
+    """
+        Run a display server, with the options given on the command line.
+    """
+    parser = argparse.ArgumentParser(description="Qwiic Micro OLED display server")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET,
+                        help="the Unix domain socket path to listen on (default: %(default)s)")
+    parser.add_argument("--address", type=lambda value: int(value, 0), default=None,
+                        help="the display's I2C address (default: 0x3D)")
+    parser.add_argument("--fps", type=float, default=_DEFAULT_FPS,
+                        help="the most frames per second written to the display (default: %(default)s)")
+    parser.add_argument("--mode", type=lambda value: int(value, 8), default=DEFAULT_MODE,
+                        help="the socket's permissions, in octal (default: %(default)o)")
+    parser.add_argument("--raw-i2c", action="store_true",
+                        help="write plain I2C messages through /dev/i2c-1, rather than SMBus blocks")
+    args = parser.parse_args()
+
+    oled = qwiic_micro_oled.QwiicMicroOled(args.address, raw_i2c=args.raw_i2c)
+    if not oled.connected:
+        print("The Qwiic Micro OLED device isn't connected to the system. Please check your connection", \
+            file=sys.stderr)
+        return 1
+
+    oled.begin()
+    oled.clear(oled.ALL)
+    oled.clear(oled.PAGE)
+    oled.display()
+
+    print("Serving the display on %s" % args.socket)
+    DisplayServer(oled, args.socket, args.fps, args.mode).serve_forever()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,446 @@
+#-----------------------------------------------------------------------------
+# qwiic_micro_oled_sim.py
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, May 2021
+#
+#
+# More information on qwiic is at https:= www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2021 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name, too-many-instance-attributes
+# pylint: disable=too-many-branches, too-many-statements
+
+"""
+qwiic_micro_oled_sim
+====================
+A simulated I2C driver with an emulated SSD1306 OLED controller, for running the
+qwiic_micro_oled package without hardware.
+
+The simulated driver is passed to the display object in place of a qwiic I2C driver::
+
+    bus = qwiic_micro_oled_sim.SimulatedI2C(bus_speed=400000)
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+
+It emulates the controller's display memory (GDDRAM), addressing modes and column/page
+windows, so the image on the display can be checked. Every transaction is recorded, and the
+time each one takes on the bus is modeled for the configured bus speed.
+
+"""
+
+from __future__ import print_function
+import time
+
+# SSD1306 I2C control byte bits
+_CONTROL_CONTINUATION   = 0x80      # Co - one byte follows, then another control byte
+_CONTROL_DATA           = 0x40      # D/C# - the byte(s) are display data, not commands
+
+# GDDRAM size
+_RAM_COLUMNS            = 128
+_RAM_PAGES              = 8
+
+# Addressing modes - set with command 0x20
+HORIZONTAL_ADDRESSING   = 0
+VERTICAL_ADDRESSING     = 1
+PAGE_ADDRESSING         = 2
+
+# Number of argument bytes of each multi-byte command
+_COMMAND_ARGS = {
+    0x20: 1,    # memory addressing mode
+    0x21: 2,    # column address window
+    0x22: 2,    # page address window
+    0x26: 6,    # right horizontal scroll setup
+    0x27: 6,    # left horizontal scroll setup
+    0x29: 5,    # vertical and right horizontal scroll setup
+    0x2A: 5,    # vertical and left horizontal scroll setup
+    0x2C: 6,    # content scroll setup - right, one column
+    0x2D: 6,    # content scroll setup - left, one column
+    0x81: 1,    # contrast
+    0x8D: 1,    # charge pump
+    0xA3: 2,    # vertical scroll area
+    0xA8: 1,    # multiplex ratio
+    0xD3: 1,    # display offset
+    0xD5: 1,    # display clock divide ratio
+    0xD9: 1,    # pre-charge period
+    0xDA: 1,    # COM pins configuration
+    0xDB: 1,    # VCOMH deselect level
+}
+
+# I2C timing - each byte on the bus is 8 data bits plus an ack. A transaction adds the
+# address byte, plus a start and stop condition (about a bit time each).
+_BITS_PER_BYTE          = 9
+_BITS_START_STOP        = 2
+
+
+class SimulatedSSD1306(object):
+    """
+    SimulatedSSD1306
+
+        An emulated SSD1306 OLED controller. Commands and display data sent to it update
+        its display memory (GDDRAM) and settings.
+
+        :param column_offset: The first GDDRAM column shown on the panel. The 64 column
+                        Micro OLED panel shows columns 32 to 95. Default is 32
+        :param width: The width of the panel in pixels. Default is 64
+        :param height: The height of the panel in pixels. Default is 48
+        :return: The emulated controller object.
+        :rtype: Object
+    """
+
+    def __init__(self, column_offset=32, width=64, height=48):
+
+        self.column_offset = column_offset
+        self.width = width
+        self.height = height
+
+        # display memory - one bytearray of 128 columns per page
+        self.ram = [bytearray(_RAM_COLUMNS) for _ in range(_RAM_PAGES)]
+
+        self.addressing_mode = PAGE_ADDRESSING
+        self.column = 0
+        self.page = 0
+        self.column_start = 0
+        self.column_end = _RAM_COLUMNS - 1
+        self.page_start = 0
+        self.page_end = _RAM_PAGES - 1
+
+        self.display_on = False
+        self.inverted = False
+        self.contrast = 0x7F
+        self.scrolling = False
+        self.commands = 0
+        self.data_bytes = 0
+
+        self._command = []
+
+    #--------------------------------------------------------------------------
+    def write(self, is_data, value):
+        """
+            Send a command byte or display data byte to the controller.
+
+            :param is_data: True if the byte is display data, False if it's a command byte
+            :param value: The byte value
+
+            :return: No return value
+
+        """
+        if is_data:
+            self._write_data(value)
+        else:
+            self._write_command(value)
+
+    def _write_data(self, value):
+
+        self.data_bytes += 1
+        self.ram[self.page][self.column] = value & 0xFF
+
+        if self.addressing_mode == VERTICAL_ADDRESSING:
+            self.page += 1
+            if self.page > self.page_end:
+                self.page = self.page_start
+                self.column = self.column + 1 if self.column < self.column_end else self.column_start
+            return
+
+        self.column += 1
+        if self.column > self.column_end or self.column >= _RAM_COLUMNS:
+            self.column = self.column_start
+            if self.addressing_mode == HORIZONTAL_ADDRESSING:
+                self.page = self.page + 1 if self.page < self.page_end else self.page_start
+
+    def _write_command(self, value):
+
+        # collect the command and its arguments, then run it
+        self._command.append(value & 0xFF)
+        if len(self._command) <= _COMMAND_ARGS.get(self._command[0], 0):
+            return
+
+        command = self._command
+        self._command = []
+        self.commands += 1
+
+        cmd = command[0]
+        if cmd < 0x10:                      # page mode - lower column nibble
+            self.column = (self.column & 0xF0) | cmd
+        elif cmd < 0x20:                    # page mode - higher column nibble
+            self.column = (self.column & 0x0F) | ((cmd & 0x07) << 4)
+        elif cmd == 0x20:
+            self.addressing_mode = command[1] & 0x03
+        elif cmd == 0x21:
+            self.column_start = command[1] & 0x7F
+            self.column_end = command[2] & 0x7F
+            self.column = self.column_start
+        elif cmd == 0x22:
+            # Applied in every addressing mode - the base driver sets the page this way
+            self.page_start = command[1] & 0x07
+            self.page_end = command[2] & 0x07
+            self.page = self.page_start
+        elif 0xB0 <= cmd <= 0xB7:          # page mode - page address
+            self.page = cmd & 0x07
+        elif cmd in (0x2C, 0x2D):
+            # arguments: dummy, start page, dummy, end page, start column, end column
+            self._content_scroll(cmd == 0x2C, command[2] & 0x07, command[4] & 0x07,
+                                    command[5] & 0x7F, command[6] & 0x7F)
+        elif cmd == 0x2E:
+            self.scrolling = False
+        elif cmd == 0x2F:
+            self.scrolling = True
+        elif cmd == 0x81:
+            self.contrast = command[1]
+        elif cmd == 0xA6:
+            self.inverted = False
+        elif cmd == 0xA7:
+            self.inverted = True
+        elif cmd == 0xAE:
+            self.display_on = False
+        elif cmd == 0xAF:
+            self.display_on = True
+
+    def _content_scroll(self, right, page_start, page_end, column_start, column_end):
+
+        # Scroll the contents of the pages and columns one column - the column shifted out
+        # wraps around to the other side.
+        if column_end < column_start:
+            return
+
+        for page in range(page_start, page_end + 1):
+            row = self.ram[page]
+            if right:
+                row[column_start:column_end + 1] = row[column_end:column_end + 1] + row[column_start:column_end]
+            else:
+                row[column_start:column_end + 1] = row[column_start + 1:column_end + 1] + row[column_start:column_start + 1]
+
+    #--------------------------------------------------------------------------
+    def image(self):
+        """
+            The image shown on the panel, in the same page packed layout as the screen buffer
+            of the display object: one byte per column for each page, bit 0 at the top.
+
+            :return: The panel image
+            :rtype: bytes
+
+        """
+        lenPages = (self.height + 7) // 8
+        return b"".join(bytes(self.ram[page][self.column_offset:self.column_offset + self.width]) \
+                            for page in range(lenPages))
+
+    def get_pixel(self, x, y):
+        """
+            Return the value of a pixel shown on the panel.
+
+            :param x: The X position on the panel
+            :param y: The Y position on the panel
+
+            :return: 1 if the pixel is on, otherwise 0
+            :rtype: integer
+
+        """
+        return (self.ram[y // 8][self.column_offset + x] >> (y % 8)) & 0x01
+
+    def ascii(self, on="#", off="."):
+        """
+            Render the image shown on the panel as text, one line per row of pixels.
+
+            :param on: The character for pixels that are on. Default is #
+            :param off: The character for pixels that are off. Default is .
+
+            :return: The image as text
+            :rtype: string
+
+        """
+        return "\n".join("".join(on if self.get_pixel(x, y) else off for x in range(self.width)) \
+                            for y in range(self.height))
+
+
+class SimulatedI2C(object):
+    """
+    SimulatedI2C
+
+        A simulated I2C bus driver, with the same interface as the qwiic I2C drivers. Writes
+        are sent to emulated SSD1306 controllers, recorded, and charged the time they'd take
+        on a real bus.
+
+        :param addresses: The I2C addresses of the emulated controllers on the bus. Default is [0x3D]
+        :param bus_speed: The bus clock speed in Hz - for example 100000, 400000 or 1000000.
+                        Default is 100000
+        :param transaction_overhead: Time added to each transaction for the host (driver call,
+                        system call), in seconds. Default is 0
+        :param realtime: If True, each transaction sleeps for its modeled time. Default is False
+        :param record: If True, every transaction is kept in the transactions list. Default is True
+        :param max_block_size: The most bytes a block write takes after the control byte - 32
+                        for SMBus, like the Linux driver. Larger writes raise an IOError. Default is 32
+        :return: The simulated driver object.
+        :rtype: Object
+    """
+
+    def __init__(self, addresses=None, bus_speed=100000, transaction_overhead=0.0,
+                    realtime=False, record=True, max_block_size=32):
+
+        if addresses is None:
+            addresses = [0x3D]
+
+        self.devices = dict((address, SimulatedSSD1306()) for address in addresses)
+        self.bus_speed = bus_speed
+        self.transaction_overhead = transaction_overhead
+        self.realtime = realtime
+        self.record = record
+        self.max_block_size = max_block_size
+
+        self.transactions = []
+        self.reset_stats()
+
+    #--------------------------------------------------------------------------
+    def reset_stats(self):
+        """
+            Clear the transaction log and counters, and the modeled bus time.
+
+            :return: No return value
+
+        """
+        del self.transactions[:]
+        self.n_transactions = 0
+        self.bytes_written = 0
+        self.command_bytes = 0
+        self.data_bytes = 0
+        self.bus_time = 0.0
+
+    def transaction_time(self, n_bytes):
+        """
+            The modeled time for a write transaction on the bus.
+
+            :param n_bytes: The number of bytes written, not counting the address byte
+
+            :return: Transaction time, in seconds
+            :rtype: float
+
+        """
+        bits = (n_bytes + 1) * _BITS_PER_BYTE + _BITS_START_STOP
+        return float(bits) / self.bus_speed + self.transaction_overhead
+
+    def _transaction(self, address, payload):
+
+        payload = bytes(bytearray(payload))
+        device = self.devices.get(address)
+        if device is None:
+            raise IOError("No device at I2C address 0x%02X" % address)
+
+        # Split the payload with the SSD1306 control byte rules
+        i = 0
+        while i < len(payload):
+            control = payload[i]
+            i += 1
+            isData = (control & _CONTROL_DATA) != 0
+
+            if control & _CONTROL_CONTINUATION:
+                if i < len(payload):
+                    device.write(isData, payload[i])
+                    self._count(isData, 1)
+                    i += 1
+                continue
+
+            for value in payload[i:]:
+                device.write(isData, value)
+            self._count(isData, len(payload) - i)
+            break
+
+        tTransaction = self.transaction_time(len(payload))
+        if self.record:
+            self.transactions.append((self.bus_time, address, payload))
+
+        self.n_transactions += 1
+        self.bytes_written += len(payload)
+        self.bus_time += tTransaction
+
+        if self.realtime:
+            time.sleep(tTransaction)
+
+    def _count(self, isData, n):
+
+        if isData:
+            self.data_bytes += n
+        else:
+            self.command_bytes += n
+
+    #--------------------------------------------------------------------------
+    # qwiic I2C driver interface
+
+    def writeCommand(self, address, commandCode):
+        self._transaction(address, [commandCode])
+
+    def write_command(self, address, commandCode):
+        return self.writeCommand(address, commandCode)
+
+    def writeWord(self, address, commandCode, value):
+        self._transaction(address, [commandCode, value & 0xFF, (value >> 8) & 0xFF])
+
+    def write_word(self, address, commandCode, value):
+        return self.writeWord(address, commandCode, value)
+
+    def writeByte(self, address, commandCode, value):
+        self._transaction(address, [commandCode, value])
+
+    def write_byte(self, address, commandCode, value):
+        return self.writeByte(address, commandCode, value)
+
+    def writeBlock(self, address, commandCode, value):
+        if len(value) > self.max_block_size:
+            raise IOError("Block write of %d bytes, the most is %d" % (len(value), self.max_block_size))
+        self._transaction(address, bytearray([commandCode]) + bytearray(value))
+
+    def write_block(self, address, commandCode, value):
+        return self.writeBlock(address, commandCode, value)
+
+    # the SSD1306 can't be read over I2C - reads return zeros
+    def readByte(self, address, commandCode=None):
+        return 0
+
+    def read_byte(self, address, commandCode=None):
+        return self.readByte(address, commandCode)
+
+    def readWord(self, address, commandCode):
+        return 0
+
+    def read_word(self, address, commandCode):
+        return self.readWord(address, commandCode)
+
+    def readBlock(self, address, commandCode, nBytes):
+        return [0] * nBytes
+
+    def read_block(self, address, commandCode, nBytes):
+        return self.readBlock(address, commandCode, nBytes)
+
+    def isDeviceConnected(self, devAddress):
+        return devAddress in self.devices
+
+    def is_device_connected(self, devAddress):
+        return self.isDeviceConnected(devAddress)
+
+    def ping(self, devAddress):
+        return self.isDeviceConnected(devAddress)
+
+    def scan(self):
+        """ Returns a list of addresses for the devices connected to the I2C bus."""
+        return sorted(self.devices)
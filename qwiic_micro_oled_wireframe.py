@@ -0,0 +1,328 @@
+#-----------------------------------------------------------------------------
+# qwiic_micro_oled_wireframe.py
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, May 2021
+#
+#
+# More information on qwiic is at https:= www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2021 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+#
+# pylint: disable=line-too-long, invalid-name, too-many-instance-attributes, too-many-arguments
+# pylint: disable=too-many-locals
+
+"""
+qwiic_micro_oled_wireframe
+==========================
+3D wireframe drawing for the qwiic_micro_oled package.
+
+A mesh is a list of vertices and the edges joining them. A Wireframe object draws a mesh
+on a display, rotated and in perspective::
+
+    cube = qwiic_micro_oled_wireframe.Wireframe(qwiic_micro_oled_wireframe.cube_mesh())
+    cube.rotate(1, 1, 1)
+    cube.draw(oled)
+
+Angles are in degrees. Sines and cosines come from lookup tables, built once at import,
+and the rotations about the three axes are composed into a single matrix once per frame.
+All the vertices are then projected in one pass - as array operations, if NumPy is
+available and the mesh is large enough to gain from it - and the edges are drawn with the
+display's batched lines() call.
+
+"""
+
+from __future__ import print_function, division
+import math
+
+import qwiic_micro_oled
+
+# Sine and cosine lookup tables, with TRIG_STEPS entries per turn (0.1 degree steps)
+TRIG_STEPS = 3600
+
+_SIN = tuple(math.sin(2. * math.pi * i / TRIG_STEPS) for i in range(TRIG_STEPS))
+_COS = tuple(math.cos(2. * math.pi * i / TRIG_STEPS) for i in range(TRIG_STEPS))
+
+_STEPS_PER_DEGREE = TRIG_STEPS / 360.
+
+# Smallest mesh worth projecting with NumPy
+_NUMPY_MIN_VERTICES = 64
+
+#-------------------------------------------------------------------
+def sin_cos(angle):
+    """
+        Return the sine and cosine of an angle, from the lookup tables. The angle is
+        rounded to the nearest table step.
+
+        :param angle: The angle, in degrees
+
+        :return: (sine, cosine) of the angle
+        :rtype: tuple
+
+    """
+    i = int(round(angle * _STEPS_PER_DEGREE)) % TRIG_STEPS
+    return (_SIN[i], _COS[i])
+
+def rotation_matrix(rx, ry, rz):
+    """
+        Compose the rotations about the X, Y and Z axes, applied in that order, into a
+        single 3x3 rotation matrix.
+
+        :param rx: Rotation about the X axis, in degrees
+        :param ry: Rotation about the Y axis, in degrees
+        :param rz: Rotation about the Z axis, in degrees
+
+        :return: The matrix, as a tuple of its 9 elements in row order
+        :rtype: tuple
+
+    """
+    (sx, cx) = sin_cos(rx)
+    (sy, cy) = sin_cos(ry)
+    (sz, cz) = sin_cos(rz)
+
+    # Rz * Ry * Rx
+    return (cz*cy, cz*sy*sx - sz*cx, cz*sy*cx + sz*sx,
+            sz*cy, sz*sy*sx + cz*cx, sz*sy*cx - cz*sx,
+            -sy,   cy*sx,            cy*cx)
+
+#-------------------------------------------------------------------
+class Mesh(object):
+    """
+    Mesh
+
+        A wireframe mesh - a list of 3D vertices, and the edges joining them.
+
+        :param vertices: Sequence of (x, y, z) vertex positions
+        :param edges: Sequence of (i, j) pairs of vertex indices, one for each edge
+        :return: The mesh object.
+        :rtype: Object
+    """
+
+    def __init__(self, vertices, edges):
+
+        self.vertices = [(float(x), float(y), float(z)) for (x, y, z) in vertices]
+        self.edges = [(int(i), int(j)) for (i, j) in edges]
+
+        nVertices = len(self.vertices)
+        for (i, j) in self.edges:
+            if not (0 <= i < nVertices and 0 <= j < nVertices):
+                raise ValueError("Edge (%d, %d) refers to a vertex that isn't in the mesh" % (i, j))
+
+        # The vertices and edge ends as separate lists - or arrays, for NumPy
+        self._xs = [v[0] for v in self.vertices]
+        self._ys = [v[1] for v in self.vertices]
+        self._zs = [v[2] for v in self.vertices]
+        self._starts = [i for (i, _) in self.edges]
+        self._ends = [j for (_, j) in self.edges]
+        self._arrays = None
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def _get_arrays(self, np):
+
+        if self._arrays is None:
+            self._arrays = (np.array(self.vertices, dtype=float).T,
+                            np.array(self._starts, dtype=np.intp),
+                            np.array(self._ends, dtype=np.intp))
+        return self._arrays
+
+def cube_mesh(size=3):
+    """
+        Return a cube mesh, centered on the origin.
+
+        :param size: Half the length of the cube's sides. Default is 3
+
+        :return: The cube mesh
+        :rtype: Mesh
+
+    """
+    d = size
+    vertices = [(-d, -d, -d), (d, -d, -d), (d, d, -d), (-d, d, -d),
+                (-d, -d, d), (d, -d, d), (d, d, d), (-d, d, d)]
+    edges = [(0, 1), (1, 2), (2, 3), (3, 0),
+             (4, 5), (5, 6), (6, 7), (7, 4),
+             (0, 4), (1, 5), (2, 6), (3, 7)]
+
+    return Mesh(vertices, edges)
+
+def pyramid_mesh(size=3):
+    """
+        Return a square based pyramid mesh, centered on the origin.
+
+        :param size: Half the width and height of the pyramid. Default is 3
+
+        :return: The pyramid mesh
+        :rtype: Mesh
+
+    """
+    d = size
+    vertices = [(-d, d, -d), (d, d, -d), (d, d, d), (-d, d, d), (0, -d, 0)]
+    edges = [(0, 1), (1, 2), (2, 3), (3, 0),
+             (0, 4), (1, 4), (2, 4), (3, 4)]
+
+    return Mesh(vertices, edges)
+
+#-------------------------------------------------------------------
+class Wireframe(object):
+    """
+    Wireframe
+
+        Draws a mesh on a display, rotated and in perspective. Each vertex is rotated,
+        then moved `distance` away from the viewer, and projected on the screen with
+        x = center + x * focal / z.
+
+        :param mesh: The Mesh to draw
+        :param focal: The focal length of the projection, in pixels. Default is 600
+        :param distance: The distance from the viewer to the mesh center. Default is 150
+        :param center: The (x, y) screen position of the mesh center. Default is the center
+                        of the display
+        :return: The wireframe object.
+        :rtype: Object
+    """
+
+    def __init__(self, mesh, focal=600, distance=150, center=None):
+
+        self.mesh = mesh
+        self.focal = float(focal)
+        self.distance = float(distance)
+        self.center = center
+        self._rotation = (0., 0., 0.)
+
+    #--------------------------------------------------------------------------
+    def set_rotation(self, rx, ry, rz):
+        """
+            Set the rotation of the mesh about the X, Y and Z axes.
+
+            :param rx: Rotation about the X axis, in degrees
+            :param ry: Rotation about the Y axis, in degrees
+            :param rz: Rotation about the Z axis, in degrees
+
+            :return: No return value
+
+        """
+        self._rotation = (rx % 360., ry % 360., rz % 360.)
+
+    def get_rotation(self):
+        """
+            Return the rotation of the mesh about the X, Y and Z axes.
+
+            :return: (rx, ry, rz), in degrees
+            :rtype: tuple
+
+        """
+        return self._rotation
+
+    rotation = property(get_rotation)
+
+    def rotate(self, dx, dy, dz):
+        """
+            Add to the rotation of the mesh about the X, Y and Z axes.
+
+            :param dx: Rotation to add about the X axis, in degrees
+            :param dy: Rotation to add about the Y axis, in degrees
+            :param dz: Rotation to add about the Z axis, in degrees
+
+            :return: No return value
+
+        """
+        (rx, ry, rz) = self._rotation
+        self.set_rotation(rx + dx, ry + dy, rz + dz)
+
+    #--------------------------------------------------------------------------
+    def project(self, cx, cy):
+        """
+            Rotate and project all the vertices of the mesh on the screen.
+
+            :param cx: The screen X position of the mesh center
+            :param cy: The screen Y position of the mesh center
+
+            :return: The screen X and Y positions of the vertices - lists, or NumPy arrays
+                        for large meshes when NumPy is available
+            :rtype: tuple
+
+        """
+        (m00, m01, m02, m10, m11, m12, m20, m21, m22) = rotation_matrix(*self._rotation)
+        mesh = self.mesh
+        focal = self.focal
+        distance = self.distance
+
+        np = qwiic_micro_oled._get_numpy() if len(mesh) >= _NUMPY_MIN_VERTICES else None
+        if np is not None:
+            ((xs, ys, zs), _, _) = mesh._get_arrays(np)
+            scale = focal / (m20*xs + m21*ys + m22*zs - distance)
+            return (cx + (m00*xs + m01*ys + m02*zs) * scale,
+                    cy + (m10*xs + m11*ys + m12*zs) * scale)
+
+        px = []
+        py = []
+        for (x, y, z) in mesh.vertices:
+            scale = focal / (m20*x + m21*y + m22*z - distance)
+            px.append(cx + (m00*x + m01*y + m02*z) * scale)
+            py.append(cy + (m10*x + m11*y + m12*z) * scale)
+
+        return (px, py)
+
+    def segments(self, cx, cy):
+        """
+            Return the screen line segments of the mesh edges.
+
+            :param cx: The screen X position of the mesh center
+            :param cy: The screen Y position of the mesh center
+
+            :return: The (x0, y0, x1, y1) segments - a list, or a NumPy array of shape (N, 4)
+                        for large meshes when NumPy is available
+            :rtype: list
+
+        """
+        (px, py) = self.project(cx, cy)
+
+        if not isinstance(px, list):
+            np = qwiic_micro_oled._get_numpy()
+            (_, starts, ends) = self.mesh._get_arrays(np)
+            return np.column_stack((px[starts], py[starts], px[ends], py[ends]))
+
+        return [(px[i], py[i], px[j], py[j]) for (i, j) in self.mesh.edges]
+
+    def draw(self, oled, color=None, mode=None):
+        """
+            Draw the mesh edges in the display's screen buffer.
+
+            :param oled: The display object to draw on
+            :param color: The color to draw. If not set, the display's foreground color is used.
+            :param mode: The mode to draw the lines to the screen bufffer. Value can be either
+                        XOR or NORM. Default is NORM
+
+            :return: No return value
+
+        """
+        if self.center is not None:
+            (cx, cy) = self.center
+        else:
+            (cx, cy) = (oled.get_lcd_width() / 2, oled.get_lcd_height() / 2)
+
+        oled.lines(self.segments(cx, cy), color, mode)
@@ -98,6 +98,8 @@ setup(
 
     # You can just specify the packages manually here if your project is
     # simple. Or you can use find_packages().
-    py_modules=["qwiic_micro_oled"],
+    py_modules=["qwiic_micro_oled", "qwiic_micro_oled_sim", "qwiic_micro_oled_wireframe",
+                "qwiic_micro_oled_recorder", "qwiic_micro_oled_server", "qwiic_micro_oled_raw_i2c",
+                "qwiic_micro_oled_dither"],
 
 )
@@ -0,0 +1,111 @@
+# Failed frame writes - the next display() has to resend what didn't reach the device.
+
+import pytest
+
+import qwiic_micro_oled
+import qwiic_micro_oled_sim
+
+
+class FlakyI2C(qwiic_micro_oled_sim.SimulatedI2C):
+    """A simulated bus where one transaction fails, after a given number succeed"""
+
+    def __init__(self):
+        super().__init__(record=False)
+        self.fail_after = None
+
+    def _transaction(self, address, data):
+
+        if self.fail_after is not None:
+            if self.fail_after == 0:
+                self.fail_after = None
+                raise IOError("I2C write failed")
+            self.fail_after -= 1
+
+        super()._transaction(address, data)
+
+
+def _make_display(background, shadow):
+
+    bus = FlakyI2C()
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+    oled.begin()
+    oled.shadow_mode = shadow
+    oled.clear(oled.PAGE)
+    oled.display()
+    oled.background_display = background
+    return (bus, oled)
+
+
+def _pixel(oled, x, y):
+
+    return (oled._screenbuffer[(y >> 3) * oled.LCDWIDTH + x] >> (y & 7)) & 1
+
+
+def _device_matches(bus, oled):
+
+    device = bus.devices[oled.address]
+    return all(device.get_pixel(x, y) == _pixel(oled, x, y) \
+                    for y in range(oled.LCDHEIGHT) for x in range(oled.LCDWIDTH))
+
+
+def _display(oled):
+
+    oled.display()
+    if oled.background_display:
+        oled.wait_display()
+
+
+@pytest.mark.parametrize("background", [False, True])
+@pytest.mark.parametrize("shadow", [False, True])
+def test_failed_frame_is_resent(background, shadow):
+
+    (bus, oled) = _make_display(background, shadow)
+
+    oled.rect_fill(5, 3, 50, 30)
+    bus.fail_after = 2
+    with pytest.raises(IOError):
+        _display(oled)
+    assert not _device_matches(bus, oled)
+
+    # nothing is drawn in between - the failed regions alone have to be resent
+    _display(oled)
+    assert _device_matches(bus, oled)
+
+    oled.set_background_display(False)
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_partly_written_frame_is_not_trusted_by_the_shadow(background):
+
+    (bus, oled) = _make_display(background, True)
+
+    # part of the rectangle reaches the device, then the buffer goes back to what
+    # the shadow holds - the shadow no longer matches the device, so can't be used
+    oled.rect_fill(0, 0, 64, 48)
+    bus.fail_after = 3
+    with pytest.raises(IOError):
+        _display(oled)
+    assert not _device_matches(bus, oled)
+
+    oled.clear(oled.PAGE)
+    _display(oled)
+    assert _device_matches(bus, oled)
+
+    oled.set_background_display(False)
+
+
+def test_regions_of_a_failed_frame_are_merged_with_newer_changes():
+
+    (bus, oled) = _make_display(True, False)
+
+    oled.rect_fill(0, 0, 20, 10)
+    bus.fail_after = 1
+    with pytest.raises(IOError):
+        _display(oled)
+
+    oled.rect_fill(40, 30, 10, 10)
+    _display(oled)
+    assert _device_matches(bus, oled)
+    assert _pixel(oled, 0, 0) and _pixel(oled, 45, 35)
+
+    oled.set_background_display(False)
@@ -0,0 +1,157 @@
+# lines() and pixels() against the base class's line() and pixel(), a call at a time, with
+# and without NumPy.
+
+import random
+
+import numpy
+import pytest
+from qwiic_oled_base import QwiicOledBase
+
+import qwiic_micro_oled
+import qwiic_micro_oled_sim
+
+SIZES = [(64, 48), (37, 21)]
+
+
+class _Reference(qwiic_micro_oled.Canvas):
+    """A canvas that draws with the base class, a pixel at a time"""
+
+    pixel = QwiicOledBase.pixel
+    line = QwiicOledBase.line
+
+
+def _random_canvases(rng, width, height):
+
+    canvas = qwiic_micro_oled.Canvas(width, height)
+    reference = _Reference(width, height)
+    for y in range(height):
+        for x in range(width):
+            if rng.random() < 0.5:
+                canvas.pixel(x, y)
+                reference.pixel(x, y)
+    canvas._mark_clean()
+    return (canvas, reference)
+
+
+def _random_style(rng):
+    return (rng.choice((None, 0, 1)), rng.choice((None, qwiic_micro_oled.QwiicMicroOled.NORM,
+                                                     qwiic_micro_oled.QwiicMicroOled.XOR)))
+
+
+def _check_dirty(canvas, before):
+
+    for (index, (old, new)) in enumerate(zip(before, canvas._screenbuffer)):
+        if old != new:
+            (page, x) = divmod(index, canvas.LCDWIDTH)
+            assert canvas._dirtyLo[page] <= x < canvas._dirtyHi[page]
+
+
+def _random_segments(rng, width, height, count):
+    # mostly on the screen, some crossing an edge or entirely off it, some fractional
+    return [(rng.uniform(-20, width + 20), rng.uniform(-20, height + 20),
+             rng.uniform(-20, width + 20), rng.uniform(-20, height + 20)) if rng.random() < 0.5 else
+            (rng.randint(-5, width + 5), rng.randint(-5, height + 5),
+             rng.randint(-5, width + 5), rng.randint(-5, height + 5)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("array", [False, True])
+def test_lines_match_the_base_class(size, array):
+
+    rng = random.Random("%s %s" % (size, array))
+    for _ in range(100):
+        (canvas, reference) = _random_canvases(rng, *size)
+        before = bytes(canvas._screenbuffer)
+        segments = _random_segments(rng, *size, rng.randint(0, 12))
+        (color, mode) = _random_style(rng)
+
+        canvas.lines(numpy.array(segments).reshape(-1, 4) if array else segments, color, mode)
+        for (x0, y0, x1, y1) in segments:
+            reference.line(int(round(x0)), int(round(y0)), int(round(x1)), int(round(y1)), color, mode)
+
+        assert canvas._screenbuffer == reference._screenbuffer
+        _check_dirty(canvas, before)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("kind", ["small", "large", "large_no_numpy", "array"])
+def test_pixels_match_the_base_class(size, kind, monkeypatch):
+
+    if kind == "large_no_numpy":
+        monkeypatch.setattr(qwiic_micro_oled, "_numpy", False)
+    rng = random.Random("%s %s" % (size, kind))
+    (width, height) = size
+    for _ in range(100):
+        (canvas, reference) = _random_canvases(rng, *size)
+        before = bytes(canvas._screenbuffer)
+        count = rng.randint(0, 40) if kind == "small" else rng.randint(100, 400)
+
+        # fractional, off the screen, and repeated points
+        xs = [rng.uniform(-5, width + 5) for _ in range(count)]
+        ys = [rng.uniform(-5, height + 5) for _ in range(count)]
+        if count:
+            for _ in range(count // 4):
+                i = rng.randrange(count)
+                xs.append(xs[i])
+                ys.append(ys[i])
+        (color, mode) = _random_style(rng)
+
+        if kind == "array":
+            canvas.pixels(numpy.array(xs), numpy.array(ys), color, mode)
+        else:
+            canvas.pixels(xs, ys, color, mode)
+        for (x, y) in zip(xs, ys):
+            (x, y) = (int(round(x)), int(round(y)))
+            if 0 <= x < width and 0 <= y < height:
+                reference.pixel(x, y, color, mode)
+
+        assert canvas._screenbuffer == reference._screenbuffer
+        _check_dirty(canvas, before)
+
+
+@pytest.mark.parametrize("count", [3, 500])
+def test_repeated_xor_pixels_apply_in_turn(count):
+
+    canvas = qwiic_micro_oled.Canvas(64, 48)
+    # a point drawn twice in XOR mode is back to black, three times is white
+    xs = [10] * 2 + [20] * 3 + list(range(count))
+    ys = [10] * 2 + [20] * 3 + [40] * count
+    canvas.pixels(xs, ys, mode=canvas.XOR)
+    assert not canvas._screenbuffer[1 * 64 + 10] & 0x04
+    assert canvas._screenbuffer[2 * 64 + 20] & 0x10
+
+
+def test_display_sends_only_the_dirty_ranges():
+
+    rng = random.Random(5)
+    bus = qwiic_micro_oled_sim.SimulatedI2C(record=False)
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+    oled.begin()
+    device = bus.devices[oled.address]
+    offset = device.column_offset
+
+    for _ in range(60):
+        oled.display()
+        if rng.random() < 0.5:
+            oled.lines(_random_segments(rng, 64, 48, rng.randint(1, 4)))
+        else:
+            count = rng.randint(1, 200)
+            oled.pixels([rng.uniform(-5, 68) for _ in range(count)],
+                        [rng.uniform(-5, 52) for _ in range(count)], mode=oled.XOR)
+
+        # flip every device byte outside the dirty ranges - they have to stay flipped
+        ranges = [range(oled._dirtyLo[page], oled._dirtyHi[page]) for page in range(6)]
+        for page in range(6):
+            for col in range(64):
+                if col not in ranges[page]:
+                    device.ram[page][offset + col] ^= 0x5A
+
+        oled.display()
+        for page in range(6):
+            for col in range(64):
+                value = oled._screenbuffer[page * 64 + col]
+                if col in ranges[page]:
+                    assert device.ram[page][offset + col] == value
+                else:
+                    assert device.ram[page][offset + col] == value ^ 0x5A
+                    device.ram[page][offset + col] = value
@@ -0,0 +1,50 @@
+# Smoke test of the benchmark suite - a short run has to finish and write its results.
+
+import json
+import os
+import subprocess
+import sys
+
+_BENCHMARK = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "benchmarks", "bench_micro_oled.py")
+
+
+def _run_benchmark(tmp_path, *args):
+
+    return subprocess.run([sys.executable, _BENCHMARK, "--min-time", "0.001", "--repeat", "1",
+                           "--cube-frames", "3"] + list(args),
+                          cwd=str(tmp_path), stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          universal_newlines=True, timeout=120)
+
+
+def test_benchmark_runs(tmp_path):
+
+    output = tmp_path / "results.json"
+    result = _run_benchmark(tmp_path, "--output", str(output))
+    assert result.returncode == 0, result.stderr
+
+    results = json.loads(output.read_text())
+    assert results["primitives"]
+    assert set(results["workloads"]) == {"cube", "demo"}
+    assert results["workloads"]["cube"]["frames"] == 3
+
+
+def test_benchmark_compares_with_a_baseline(tmp_path):
+
+    baseline = tmp_path / "baseline.json"
+    assert _run_benchmark(tmp_path, "--output", str(baseline)).returncode == 0
+
+    # timings vary from run to run, bus traffic doesn't - so only the traffic can regress here
+    result = _run_benchmark(tmp_path, "--output", str(tmp_path / "results.json"),
+                            "--compare", str(baseline), "--tolerance", "1000")
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "REGRESSED" not in result.stdout
+
+    # a baseline with less bus traffic is a regression
+    data = json.loads(baseline.read_text())
+    data["workloads"]["cube"]["bus_bytes_per_frame"] -= 1
+    baseline.write_text(json.dumps(data))
+    result = _run_benchmark(tmp_path, "--output", str(tmp_path / "results.json"),
+                            "--compare", str(baseline), "--tolerance", "1000")
+    assert result.returncode == 1
+    assert "REGRESSED" in result.stdout
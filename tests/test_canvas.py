@@ -0,0 +1,100 @@
+# Canvases have the display object's state, and refuse device operations clearly.
+
+import asyncio
+import inspect
+
+import pytest
+
+import qwiic_micro_oled
+import qwiic_micro_oled_sim
+
+
+def _no_argument_methods():
+
+    # the public methods that can be called without arguments
+    names = []
+    for (name, method) in inspect.getmembers(qwiic_micro_oled.QwiicMicroOled, inspect.isfunction):
+        if name.startswith("_"):
+            continue
+        parameters = list(inspect.signature(method).parameters.values())[1:]
+        if all(p.default is not p.empty or p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD) for p in parameters):
+            names.append(name)
+    return names
+
+
+@pytest.mark.parametrize("name", _no_argument_methods())
+def test_inherited_methods_have_their_state(name):
+
+    canvas = qwiic_micro_oled.Canvas(40, 20)
+    method = getattr(canvas, name)
+
+    # device operations raise a TypeError - nothing fails for lack of an attribute
+    try:
+        result = method()
+        if inspect.iscoroutine(result):
+            asyncio.run(result)
+    except TypeError as exError:
+        assert "Canvas" in str(exError)
+
+
+def test_device_operations_raise_type_error():
+
+    canvas = qwiic_micro_oled.Canvas()
+
+    with pytest.raises(TypeError):
+        canvas.begin()
+    with pytest.raises(TypeError):
+        canvas.display()
+    with pytest.raises(TypeError):
+        asyncio.run(canvas.display_async())
+    with pytest.raises(TypeError):
+        canvas.set_background_display(True)
+    with pytest.raises(TypeError):
+        canvas.background_display = True
+    with pytest.raises(TypeError):
+        canvas.scroll_content(True, 0, 1)
+    with pytest.raises(TypeError):
+        canvas.contrast(10)
+
+    assert not canvas.is_connected()
+    assert not canvas.background_display
+
+
+def test_buffer_settings_work():
+
+    canvas = qwiic_micro_oled.Canvas(30, 12)
+
+    # starts blank, the size asked for
+    assert (canvas.LCDWIDTH, canvas.LCDHEIGHT) == (30, 12)
+    assert canvas.get_screenbuffer() == bytearray(60)
+
+    canvas.set_shadow_mode(True)
+    assert canvas.get_shadow_mode()
+    canvas.set_chunk_size(16)
+    assert canvas.chunk_size == 16
+
+    canvas.stats_enabled = True
+    canvas.line(0, 0, 29, 11)
+    canvas.print("ab")
+    stats = canvas.stats()
+    assert stats["draw_calls"]["line"] == 1
+    assert stats["draw_calls"]["print"] == 1
+    canvas.reset_stats()
+    canvas.stats_enabled = False
+
+
+def test_canvas_draws_into_a_display():
+
+    bus = qwiic_micro_oled_sim.SimulatedI2C(record=False)
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+    oled.begin()
+    oled.clear(oled.PAGE)
+
+    canvas = qwiic_micro_oled.Canvas(16, 16)
+    canvas.rect_fill(0, 0, 16, 16)
+    oled.draw_canvas(canvas, 8, 8)
+    oled.display()
+
+    device = bus.devices[oled.address]
+    assert sum(device.get_pixel(x, y) for y in range(48) for x in range(64)) == 256
+    assert device.get_pixel(8, 8) and device.get_pixel(23, 23) and not device.get_pixel(24, 24)
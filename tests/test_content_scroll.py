@@ -0,0 +1,150 @@
+# Content scrolling (0x2C/0x2D) and the ticker - the screen buffer, the shadow buffer and
+# the simulated controller's memory have to agree after every step.
+
+import random
+
+import pytest
+
+import qwiic_micro_oled
+import qwiic_micro_oled_sim
+
+
+@pytest.fixture(autouse=True)
+def no_scroll_interval(monkeypatch):
+
+    # the simulated controller doesn't need the two frames between scrolls
+    monkeypatch.setattr(qwiic_micro_oled, "_CONTENT_SCROLL_INTERVAL", 0.)
+
+
+def _make_display(shadow):
+
+    bus = qwiic_micro_oled_sim.SimulatedI2C(record=False)
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+    oled.begin()
+    oled.shadow_mode = shadow
+    return (bus, oled)
+
+
+def _check(bus, oled):
+
+    oled.display()
+    image = bus.devices[oled.address].image()
+    assert bytes(oled._screenbuffer) == image
+    if oled._shadow is not None:
+        assert bytes(oled._shadow) == image
+
+
+@pytest.mark.parametrize("shadow", [False, True])
+def test_scroll_content_steps(shadow):
+
+    (bus, oled) = _make_display(shadow)
+    rng = random.Random(shadow)
+
+    # something to scroll
+    for _ in range(20):
+        oled.line(rng.randint(0, 63), rng.randint(0, 47), rng.randint(0, 63), rng.randint(0, 47))
+    oled.print("scroll")
+    oled.display()
+    _check(bus, oled)
+
+    for i in range(200):
+        pageStart = rng.randint(0, 5)
+        pageEnd = rng.randint(pageStart, 5)
+        xStart = rng.randint(0, 62)
+        xEnd = rng.randint(xStart + 1, 64)
+        column = bytes(rng.randrange(256) for _ in range(pageEnd - pageStart + 1))
+        right = rng.random() < 0.5
+
+        # now and then something is drawn between steps - it's sent before the scroll
+        if i % 10 == 0:
+            oled.rect_fill(rng.randint(0, 60), rng.randint(0, 44), 4, 4, rng.randint(0, 1))
+
+        before = bytes(oled._screenbuffer)
+        oled.scroll_content(right, pageStart, pageEnd, xStart, xEnd, column)
+
+        # the window is on the device right away - drawing elsewhere waits for display()
+        image = bus.devices[oled.address].image()
+        for page in range(pageStart, pageEnd + 1):
+            (iStart, iEnd) = (page * 64 + xStart, page * 64 + xEnd)
+            assert oled._screenbuffer[iStart:iEnd] == image[iStart:iEnd]
+        _check(bus, oled)
+
+        # the window moved one column, and the new column went into the side it uncovered
+        for (j, page) in enumerate(range(pageStart, pageEnd + 1)):
+            row = before[page * 64:(page + 1) * 64]
+            expected = row[xStart:xEnd - 1] if right else row[xStart + 1:xEnd]
+            expected = (bytes([column[j]]) + expected) if right else (expected + bytes([column[j]]))
+            assert oled._screenbuffer[page * 64 + xStart:page * 64 + xEnd] == expected
+
+
+def test_scroll_content_sends_only_the_command_and_the_new_column():
+
+    (bus, oled) = _make_display(False)
+    oled.rect_fill(0, 0, 64, 48)
+    oled.display()
+
+    bus.reset_stats()
+    oled.scroll_content(False, 1, 3, 10, 50, b"\x01\x02\x03")
+    assert bus.data_bytes == 3
+    _check(bus, oled)
+
+
+def _text_columns(text, y, pageStart, pageEnd, fontType):
+
+    # the text drawn with print() on a wide canvas, as columns of page bytes
+    probe = qwiic_micro_oled.Canvas(1, 1)
+    probe.set_font_type(fontType)
+    width = len(text) * (probe.get_font_width() + 1)
+
+    canvas = qwiic_micro_oled.Canvas(width, 48)
+    canvas.set_font_type(fontType)
+    canvas.set_cursor(0, y)
+    canvas.print(text)
+    return [bytes(canvas._screenbuffer[page * width + x] for page in range(pageStart, pageEnd + 1)) \
+                for x in range(width)]
+
+
+@pytest.mark.parametrize("shadow", [False, True])
+@pytest.mark.parametrize("right", [False, True])
+@pytest.mark.parametrize("y, x, width, fontType", [(0, 0, None, 0), (19, 7, 40, 1), (3, 20, 30, 0)])
+def test_ticker_matches_the_device_and_wraps(shadow, right, y, x, width, fontType):
+
+    (bus, oled) = _make_display(shadow)
+    oled.line(0, 47, 63, 0)
+    oled.display()
+
+    text = "Ab 12!"
+    gap = 5
+    ticker = qwiic_micro_oled.Ticker(oled, text, y=y, x=x, width=width, font_type=fontType, right=right, gap=gap)
+    xEnd = 64 if width is None else x + width
+    pageStart = ticker._pageStart
+    pageEnd = ticker._pageEnd
+
+    columns = _text_columns(text, y & 7, 0, pageEnd - pageStart, fontType)
+    columns += [bytes(pageEnd - pageStart + 1)] * gap
+    nColumns = len(columns)
+
+    bands = []
+    for k in range(1, 2 * nColumns + xEnd - x + 1):
+        ticker.step()
+        _check(bus, oled)
+
+        band = [bytes(oled._screenbuffer[page * 64 + xx] for page in range(pageStart, pageEnd + 1)) \
+                    for xx in range(x, xEnd)]
+        bands.append(band)
+
+        # the k columns that entered, the newest at the edge they enter from. Scrolling
+        # right, the text enters from its end, right after the gap.
+        expected = []
+        for i in range(xEnd - x):
+            n = k - 1 - (xEnd - x - 1 - i if not right else i)
+            if n < 0:
+                expected.append(bytes(pageEnd - pageStart + 1))
+            elif right:
+                expected.append(columns[(nColumns - gap - 1 - n) % nColumns])
+            else:
+                expected.append(columns[n % nColumns])
+        assert band == expected
+
+    # after wrapping, the band repeats every cycle of the text and gap
+    assert bands[-1] == bands[-1 - nColumns]
@@ -0,0 +1,145 @@
+# Dirty tracking - drawing matches the base class, every change is inside the dirty
+# region, and display() sends exactly the dirty column ranges of each page.
+
+import random
+
+import pytest
+from qwiic_oled_base import QwiicOledBase
+
+import qwiic_micro_oled
+import qwiic_micro_oled_sim
+
+
+class _Reference(qwiic_micro_oled.Canvas):
+    """A canvas that draws with the base class, a pixel at a time"""
+
+    pixel = QwiicOledBase.pixel
+    line = QwiicOledBase.line
+    line_h = QwiicOledBase.line_h
+    line_v = QwiicOledBase.line_v
+    rect = QwiicOledBase.rect
+    rect_fill = QwiicOledBase.rect_fill
+    circle = QwiicOledBase.circle
+    draw_char = QwiicOledBase.draw_char
+
+
+def _make_display():
+
+    bus = qwiic_micro_oled_sim.SimulatedI2C(record=False)
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+    oled.begin()
+    oled.clear(oled.PAGE)
+    oled.display()
+    return (bus, oled)
+
+
+def _random_draw(rng, target):
+
+    (x, y) = (rng.randint(-10, 70), rng.randint(-10, 55))
+    color = rng.choice((0, 1))
+    mode = rng.choice((0, 1))
+    choice = rng.randrange(8)
+    if choice == 0:
+        target.pixel(x, y, color, mode)
+    elif choice == 1:
+        target.line(x, y, rng.randint(-10, 70), rng.randint(-10, 55), color, mode)
+    elif choice == 2:
+        target.rect(x, y, rng.randint(1, 30), rng.randint(1, 30), color, mode)
+    elif choice == 3:
+        target.rect_fill(x, y, rng.randint(1, 30), rng.randint(1, 30), color, mode)
+    elif choice == 4:
+        target.circle(x, y, rng.randint(0, 15), color, mode)
+    elif choice == 5:
+        target.draw_char(x, y, rng.randint(32, 126), color, mode)
+    elif choice == 6:
+        target.line_h(x, y, rng.randint(1, 40), color, mode)
+    else:
+        target.line_v(x, y, rng.randint(1, 40), color, mode)
+
+
+def test_drawing_matches_the_base_class():
+
+    rng = random.Random(1)
+    (_, oled) = _make_display()
+    reference = _Reference(64, 48)
+
+    for _ in range(500):
+        state = rng.getstate()
+        before = bytes(oled._screenbuffer)
+        oled._mark_clean()
+
+        # the same call, with the same random arguments, on both
+        _random_draw(rng, oled)
+        rng.setstate(state)
+        _random_draw(rng, reference)
+        assert oled._screenbuffer == reference._screenbuffer
+
+        for page in range(6):
+            for x in range(64):
+                if oled._screenbuffer[page * 64 + x] != before[page * 64 + x]:
+                    assert oled._dirtyLo[page] <= x < oled._dirtyHi[page]
+
+
+def test_display_sends_only_the_dirty_ranges():
+
+    rng = random.Random(2)
+    (bus, oled) = _make_display()
+    device = bus.devices[oled.address]
+
+    for _ in range(100):
+        for _ in range(rng.randint(1, 4)):
+            _random_draw(rng, oled)
+
+        # mark every byte outside the dirty ranges on the device - display() mustn't touch them
+        ranges = list(zip(oled._dirtyLo, oled._dirtyHi))
+        for (page, (lo, hi)) in enumerate(ranges):
+            for x in range(64):
+                if not lo <= x < hi:
+                    device.ram[page][device.column_offset + x] = oled._screenbuffer[page * 64 + x] ^ 0xA5
+
+        bus.reset_stats()
+        oled.display()
+
+        for (page, (lo, hi)) in enumerate(ranges):
+            for x in range(64):
+                value = oled._screenbuffer[page * 64 + x]
+                expected = value if lo <= x < hi else value ^ 0xA5
+                assert device.ram[page][device.column_offset + x] == expected
+        assert bus.data_bytes == sum(max(hi - lo, 0) for (lo, hi) in ranges)
+
+        # put the device back in step with the buffer
+        oled.invalidate()
+        oled.display()
+
+
+def test_clean_buffer_sends_nothing_and_invalidate_sends_everything():
+
+    (bus, oled) = _make_display()
+    oled.print("Hello")
+    oled.display()
+
+    bus.reset_stats()
+    oled.display()
+    assert bus.n_transactions == 0
+
+    oled.invalidate()
+    oled.display()
+    assert bus.data_bytes == 64 * 6
+    assert bus.devices[oled.address].image() == bytes(oled._screenbuffer)
+
+
+@pytest.mark.parametrize("call", ["clear", "draw_bitmap", "get_screenbuffer"])
+def test_whole_buffer_calls_mark_everything(call):
+
+    (bus, oled) = _make_display()
+    if call == "clear":
+        oled.clear(oled.PAGE)
+    elif call == "draw_bitmap":
+        oled.draw_bitmap(bytearray(range(256)) + bytearray(128))
+    else:
+        oled.get_screenbuffer()[0] = 0xFF
+
+    bus.reset_stats()
+    oled.display()
+    assert bus.data_bytes == 64 * 6
+    assert bus.devices[oled.address].image() == bytes(oled._screenbuffer)
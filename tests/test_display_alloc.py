@@ -0,0 +1,96 @@
+# Steady-state display() memory use, measured with tracemalloc.
+
+import tracemalloc
+
+import pytest
+
+import qwiic_micro_oled
+
+# Short-lived objects display() may make - see the comment above QwiicMicroOled.display().
+# None of them depends on the frame size, so this is well below one copy of the frame.
+_TEMPORARY_BYTES = 2048
+
+
+class NullI2C(object):
+    """An I2C driver that accepts every write and keeps nothing."""
+
+    def writeCommand(self, address, commandCode):
+        pass
+
+    def writeByte(self, address, commandCode, value):
+        pass
+
+    def writeWord(self, address, commandCode, value):
+        pass
+
+    def writeBlock(self, address, commandCode, value):
+        pass
+
+    def isDeviceConnected(self, devAddress):
+        return True
+
+
+def _measure(oled, draw, nFrames=200):
+
+    # the frame numbers are made up front, so the loop doesn't allocate them
+    frameNumbers = list(range(nFrames))
+
+    # warm up - first calls fill caches and make the shadow buffer
+    for i in frameNumbers[:50]:
+        draw(i)
+        oled.display()
+
+    tracemalloc.start()
+    try:
+        for i in frameNumbers[:10]:
+            draw(i)
+            oled.display()
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+        for i in frameNumbers:
+            draw(i)
+            oled.display()
+
+        (after, peak) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return (after - before, peak - before)
+
+
+@pytest.mark.parametrize("shadow", [False, True])
+@pytest.mark.parametrize("flushCost", [None, 20])
+def test_full_flush_allocates_nothing(shadow, flushCost):
+
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=NullI2C())
+    oled.begin()
+    oled.set_shadow_mode(shadow)
+    if flushCost is not None:
+        oled.set_flush_cost(flushCost)      # commands and data share transactions
+
+    buf = oled.get_screenbuffer()
+    frames = [bytes([i]) * len(buf) for i in range(2)]
+
+    def draw(i):
+        buf[:] = frames[i & 1]
+        oled.invalidate()
+
+    (net, peak) = _measure(oled, draw)
+
+    assert net == 0
+    assert peak < min(_TEMPORARY_BYTES, len(buf) * 4)
+
+
+def test_partial_flush_allocates_nothing():
+
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=NullI2C())
+    oled.begin()
+
+    def draw(i):
+        oled.pixel(i % 64, (i * 7) % 48)
+
+    (net, peak) = _measure(oled, draw, 500)
+
+    assert net == 0
+    assert peak < _TEMPORARY_BYTES
@@ -0,0 +1,79 @@
+# DisplayGroup scaling, on simulated buses that take real time per byte.
+
+import time
+
+import qwiic_micro_oled
+import qwiic_micro_oled_sim
+
+# A full frame at this speed takes about 40 ms on the bus
+_BUS_SPEED = 100000
+
+
+def _make_display(bus, address=0x3D):
+
+    oled = qwiic_micro_oled.QwiicMicroOled(address, i2c_driver=bus)
+    bus.realtime = False
+    oled.begin()
+    bus.realtime = True
+    oled.invalidate()
+    return oled
+
+
+def _simulated_bus():
+
+    return qwiic_micro_oled_sim.SimulatedI2C(addresses=[0x3D, 0x3C], bus_speed=_BUS_SPEED, record=False)
+
+
+def _single_display_time():
+
+    oled = _make_display(_simulated_bus())
+    tStart = time.perf_counter()
+    oled.display()
+    return time.perf_counter() - tStart
+
+
+def test_buses_are_written_in_parallel():
+
+    nBuses = 4
+    tSingle = _single_display_time()
+
+    with qwiic_micro_oled.DisplayGroup([_make_display(_simulated_bus()) for _ in range(nBuses)]) as group:
+        tStart = time.perf_counter()
+        latencies = group.display()
+        tWall = time.perf_counter() - tStart
+
+    # close to one bus's time, not nBuses times it
+    assert tWall < tSingle * 1.8
+    assert len(latencies) == nBuses
+    for latency in latencies:
+        assert 0.7 * tSingle < latency < 1.5 * tSingle
+
+
+def test_displays_on_one_bus_are_serialized():
+
+    tSingle = _single_display_time()
+
+    bus = _simulated_bus()
+    group = qwiic_micro_oled.DisplayGroup([_make_display(bus, 0x3D), _make_display(bus, 0x3C)])
+
+    tStart = time.perf_counter()
+    latencies = group.display()
+    tWall = time.perf_counter() - tStart
+
+    assert tWall > tSingle * 1.7
+
+    # each display's latency is its own update, not including the display before it
+    for latency in latencies:
+        assert 0.7 * tSingle < latency < 1.5 * tSingle
+
+
+def test_latency_is_per_display():
+
+    # a slow bus doesn't make the displays on other buses look slow
+    slowBus = qwiic_micro_oled_sim.SimulatedI2C(bus_speed=_BUS_SPEED / 4, record=False)
+    displays = [_make_display(slowBus), _make_display(_simulated_bus()), _make_display(_simulated_bus())]
+
+    with qwiic_micro_oled.DisplayGroup(displays) as group:
+        latencies = group.display()
+
+    assert latencies[0] > 2.5 * max(latencies[1:])
@@ -0,0 +1,134 @@
+# Dithering - the NumPy and pure Python paths against per pixel references.
+
+import random
+
+import pytest
+
+import qwiic_micro_oled
+import qwiic_micro_oled_dither as dither
+
+np = pytest.importorskip("numpy")
+
+
+def _pack(bits, width, height):
+
+    out = bytearray(width * ((height + 7) // 8))
+    for y in range(height):
+        for x in range(width):
+            if bits[y][x]:
+                out[(y >> 3) * width + x] |= 1 << (y & 7)
+    return bytes(out)
+
+
+def _reference(gray, width, height, method, threshold=128, bayerSize=4):
+
+    # one pixel at a time, the textbook way
+    matrix = dither._bayer_matrix(bayerSize)
+    error = [[0] * (width + 2) for _ in range(height + 1)]
+    bits = [[0] * width for _ in range(height)]
+    for y in range(height):
+        for x in range(width):
+            if method == dither.THRESHOLD:
+                bits[y][x] = gray[y][x] >= threshold
+            elif method == dither.BAYER:
+                level = (2 * matrix[y % bayerSize][x % bayerSize] + 1) * 128 // (bayerSize * bayerSize)
+                bits[y][x] = gray[y][x] >= level + threshold - 128
+            else:
+                value = gray[y][x] + ((error[y][x + 1] + 8) >> 4)
+                bits[y][x] = value >= threshold
+                e = value - 255 if bits[y][x] else value
+                error[y][x + 2] += 7 * e
+                error[y + 1][x] += 3 * e
+                error[y + 1][x + 1] += 5 * e
+                error[y + 1][x + 2] += e
+    return _pack(bits, width, height)
+
+
+@pytest.mark.parametrize("method", [dither.THRESHOLD, dither.BAYER, dither.FLOYD_STEINBERG])
+@pytest.mark.parametrize("size", [(64, 48), (13, 11), (8, 1), (30, 17)])
+@pytest.mark.parametrize("bayerSize", [2, 4, 8])
+def test_numpy_and_python_match_the_reference(method, size, bayerSize):
+
+    (width, height) = size
+    rng = random.Random("%s %s %d" % (method, size, bayerSize))
+    threshold = rng.randint(40, 200)
+    gray = [[rng.randrange(256) for _ in range(width)] for _ in range(height)]
+    expected = _reference(gray, width, height, method, threshold, bayerSize)
+
+    withNumpy = dither.Ditherer(width, height, method, threshold, bayerSize, use_numpy=True)
+    withoutNumpy = dither.Ditherer(width, height, method, threshold, bayerSize, use_numpy=False)
+
+    flat = bytes(value for row in gray for value in row)
+    for frame in (gray, flat, bytearray(flat), memoryview(flat)):
+        assert bytes(withNumpy.convert(frame)) == expected
+        assert bytes(withoutNumpy.convert(frame)) == expected
+
+    for array in (np.array(gray, dtype=np.uint8), np.array(gray, dtype=float), np.array(gray, dtype=np.int32)):
+        assert bytes(withNumpy.convert(array)) == expected
+
+
+def test_threshold_reference():
+
+    # a horizontal ramp - the columns at or above the threshold are white
+    ramp = [[x * 4 for x in range(64)] for _ in range(8)]
+    for threshold in (1, 128, 200, 252):
+        expected = bytes(0xFF if x * 4 >= threshold else 0 for x in range(64))
+        assert dither.dither(ramp, dither.THRESHOLD, threshold) == expected
+        assert bytes(dither.Ditherer(64, 8, dither.THRESHOLD, threshold, use_numpy=False).convert(ramp)) == expected
+
+
+def test_bool_and_pil_frames():
+
+    Image = pytest.importorskip("PIL.Image")
+
+    rng = np.random.default_rng(5)
+    bw = rng.random((48, 64)) > 0.5
+    gray = (bw * 255).tolist()
+    image = Image.frombytes("L", (64, 48), bytes(value for row in gray for value in row))
+
+    for method in dither._METHODS:
+        expected = _reference(gray, 64, 48, method)
+        assert bytes(dither.Ditherer(method=method).convert(bw)) == expected
+        assert bytes(dither.Ditherer(method=method, use_numpy=False).convert(bw.tolist())) == expected
+        assert bytes(dither.Ditherer(method=method, use_numpy=False).convert(image.convert("RGB"))) == expected
+        assert dither.dither(image, method) == expected
+
+
+def test_dither_without_numpy(monkeypatch):
+
+    monkeypatch.setattr(qwiic_micro_oled, "_numpy", False)
+
+    gray = [[(x * 9 + y * 5) % 256 for x in range(20)] for y in range(10)]
+    for method in dither._METHODS:
+        assert dither.dither(gray, method) == _reference(gray, 20, 10, method)
+
+    assert dither.Ditherer()._np is None
+    with pytest.raises(ImportError):
+        dither.Ditherer(use_numpy=True)
+
+
+def test_stream_reuses_its_buffer():
+
+    ditherer = dither.Ditherer(method=dither.BAYER)
+    frames = [np.full((48, 64), value, dtype=np.uint8) for value in range(0, 256, 15)]
+
+    outputs = []
+    for (frame, out) in zip(frames, ditherer.stream(frames)):
+        outputs.append(out)
+        assert bytes(out) == _reference(frame.tolist(), 64, 48, dither.BAYER)
+
+    assert all(out is outputs[0] for out in outputs)
+
+
+@pytest.mark.parametrize("useNumpy", [True, False])
+def test_wrong_size_frames_are_rejected(useNumpy):
+
+    ditherer = dither.Ditherer(use_numpy=useNumpy)
+    for frame in ([[0] * 64] * 47, b"\0" * 10, [[0] * 63] * 48):
+        with pytest.raises(ValueError):
+            ditherer.convert(frame)
+
+    with pytest.raises(ValueError):
+        dither.Ditherer(method="halftone")
+    with pytest.raises(ValueError):
+        dither.Ditherer(bayer_size=3)
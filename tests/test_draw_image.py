@@ -0,0 +1,156 @@
+# draw_image() against a pixel by pixel reference, for NumPy arrays, sequences and PIL
+# images, with and without NumPy.
+
+import random
+
+import numpy
+import pytest
+from PIL import Image
+
+import qwiic_micro_oled
+import qwiic_micro_oled_sim
+
+SIZES = [(64, 48), (37, 21)]
+
+
+def _pixels(canvas):
+    return [[(canvas._screenbuffer[(y >> 3) * canvas.LCDWIDTH + x] >> (y & 7)) & 1 \
+                for x in range(canvas.LCDWIDTH)] for y in range(canvas.LCDHEIGHT)]
+
+
+def _random_canvas(rng, width, height):
+
+    canvas = qwiic_micro_oled.Canvas(width, height)
+    for y in range(height):
+        for x in range(width):
+            if rng.random() < 0.5:
+                canvas.pixel(x, y)
+    canvas._mark_clean()
+    return canvas
+
+
+def _check(canvas, before, x, y, values):
+
+    # the image replaces the pixels it covers on the screen - the rest are untouched
+    (width, height) = (canvas.LCDWIDTH, canvas.LCDHEIGHT)
+    expected = before
+    for (row, line) in enumerate(values):
+        for (col, value) in enumerate(line):
+            if 0 <= x + col < width and 0 <= y + row < height:
+                expected[y + row][x + col] = value
+    assert _pixels(canvas) == expected
+
+    # the dirty region covers the image's part of the screen, and nothing else
+    (x0, x1) = (max(x, 0), min(x + len(values[0]), width))
+    (y0, y1) = (max(y, 0), min(y + len(values), height))
+    for page in range(canvas._nPages):
+        if x0 < x1 and y0 < y1 and y0 // 8 <= page <= (y1 - 1) // 8:
+            assert (canvas._dirtyLo[page], canvas._dirtyHi[page]) == (x0, x1)
+        else:
+            assert canvas._dirtyLo[page] >= canvas._dirtyHi[page]
+
+
+def _random_image(rng):
+
+    (width, height) = (rng.randint(1, 40), rng.randint(1, 30))
+    gray = [[rng.randrange(256) for _ in range(width)] for _ in range(height)]
+    return gray
+
+
+def _placement(rng, canvas, gray):
+    return (rng.randint(-len(gray[0]), canvas.LCDWIDTH), rng.randint(-len(gray), canvas.LCDHEIGHT))
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("kind", ["uint8", "bool", "list", "pil_l", "pil_1", "pil_rgb"])
+def test_draw_image_matches_the_reference(size, kind):
+
+    rng = random.Random("%s %s" % (size, kind))
+    for _ in range(60):
+        canvas = _random_canvas(rng, *size)
+        before = _pixels(canvas)
+        gray = _random_image(rng)
+        (x, y) = _placement(rng, canvas, gray)
+        threshold = rng.choice((1, 100, 128, 255))
+
+        values = [[int(v >= threshold) for v in row] for row in gray]
+        if kind == "uint8":
+            canvas.draw_image(numpy.array(gray, dtype=numpy.uint8), x, y, threshold)
+        elif kind == "bool":
+            canvas.draw_image(numpy.array(values, dtype=bool), x, y, threshold=0)
+        elif kind == "list":
+            canvas.draw_image(gray, x, y, threshold)
+        elif kind == "pil_1":
+            image = Image.fromarray(numpy.array(values, dtype=numpy.uint8) * 255).convert("1")
+            canvas.draw_image(image, x, y)
+        else:
+            image = Image.fromarray(numpy.array(gray, dtype=numpy.uint8), "L")
+            if kind == "pil_rgb":
+                image = image.convert("RGB")
+            canvas.draw_image(image, x, y, threshold)
+
+        _check(canvas, before, x, y, values)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_pil_images_without_numpy(size, monkeypatch):
+
+    monkeypatch.setattr(qwiic_micro_oled, "_numpy", False)
+    rng = random.Random("%s" % (size,))
+    for _ in range(60):
+        canvas = _random_canvas(rng, *size)
+        before = _pixels(canvas)
+        gray = _random_image(rng)
+        (x, y) = _placement(rng, canvas, gray)
+        threshold = rng.choice((1, 128, 255))
+
+        image = Image.new("L", (len(gray[0]), len(gray)))
+        image.putdata([v for row in gray for v in row])
+        canvas.draw_image(image, x, y, threshold)
+        _check(canvas, before, x, y, [[int(v >= threshold) for v in row] for row in gray])
+
+    # arrays need NumPy
+    with pytest.raises(TypeError):
+        canvas.draw_image([[1, 0], [0, 1]])
+
+
+def test_images_must_be_two_dimensional():
+
+    canvas = qwiic_micro_oled.Canvas(64, 48)
+    with pytest.raises(ValueError):
+        canvas.draw_image(numpy.zeros((4, 4, 3), dtype=numpy.uint8))
+    with pytest.raises(ValueError):
+        canvas.draw_image(numpy.zeros(10, dtype=numpy.uint8))
+
+
+def test_display_sends_only_the_image():
+
+    rng = random.Random(4)
+    bus = qwiic_micro_oled_sim.SimulatedI2C(record=False)
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+    oled.begin()
+    device = bus.devices[oled.address]
+    offset = device.column_offset
+
+    for _ in range(40):
+        oled.display()
+        gray = _random_image(rng)
+        (x, y) = _placement(rng, oled, gray)
+        oled.draw_image(gray, x, y, rng.choice((1, 128, 255)))
+
+        # flip every device byte outside the dirty ranges - they have to stay flipped
+        ranges = [range(oled._dirtyLo[page], oled._dirtyHi[page]) for page in range(6)]
+        for page in range(6):
+            for col in range(64):
+                if col not in ranges[page]:
+                    device.ram[page][offset + col] ^= 0x5A
+
+        oled.display()
+        for page in range(6):
+            for col in range(64):
+                value = oled._screenbuffer[page * 64 + col]
+                if col in ranges[page]:
+                    assert device.ram[page][offset + col] == value
+                else:
+                    assert device.ram[page][offset + col] == value ^ 0x5A
+                    device.ram[page][offset + col] = value
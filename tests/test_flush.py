@@ -0,0 +1,124 @@
+# The flush path - chunked block writes, window commands combined with data, and the
+# merging of changed runs with the shadow buffer - checked on the simulated controller.
+
+import random
+
+import pytest
+
+import qwiic_micro_oled
+import qwiic_micro_oled_sim
+
+
+def _make_display(shadow, chunk=None):
+
+    bus = qwiic_micro_oled_sim.SimulatedI2C()
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+    oled.begin()
+    oled.chunk_size = chunk
+    oled.shadow_mode = shadow
+    oled.clear(oled.PAGE)
+    oled.display()
+    bus.reset_stats()
+    return (bus, oled)
+
+
+def _device_matches(bus, oled):
+
+    device = bus.devices[oled.address]
+    return all(device.get_pixel(x, y) == (oled._screenbuffer[(y >> 3) * 64 + x] >> (y & 7)) & 1 \
+                    for y in range(48) for x in range(64))
+
+
+@pytest.mark.parametrize("shadow", [False, True])
+@pytest.mark.parametrize("chunk", [1, 2, 5, 10, 11, 12, 17, 31, 32])
+@pytest.mark.parametrize("flushCost", [0, 2, 8])
+def test_device_matches_the_buffer(shadow, chunk, flushCost):
+
+    (bus, oled) = _make_display(shadow, chunk)
+    oled.set_flush_cost(flushCost)
+
+    rng = random.Random("%s %d %d" % (shadow, chunk, flushCost))
+    for _ in range(12):
+        for _ in range(rng.randint(1, 6)):
+            (x, y) = (rng.randint(-5, 63), rng.randint(-5, 47))
+            choice = rng.random()
+            if choice < 0.4:
+                oled.line(x, y, rng.randint(0, 63), rng.randint(0, 47), rng.randint(0, 1))
+            elif choice < 0.7:
+                oled.pixel(x, y, rng.randint(0, 1))
+            else:
+                oled.rect_fill(x, y, rng.randint(1, 20), rng.randint(1, 20), rng.randint(0, 1))
+        oled.display()
+        assert _device_matches(bus, oled)
+
+    # no block write is larger than the chunk size
+    assert max(len(payload) - 1 for (_, _, payload) in bus.transactions) <= chunk
+
+
+# The 64x48 window commands are 5 bytes. With the default flush cost, a transaction costs
+# less than 5 bytes, so the commands are sent in a transaction of their own. At a cost of 6
+# (8 with the address and control byte) they lead the first data transaction. The merge gap
+# is 13 bytes at the default cost, and 21 at a cost of 6.
+@pytest.mark.parametrize("flushCost, columns, nTransactions, nData", [
+    (2, (10, 20), 2, 11),       # merged into one window: commands, data
+    (2, (10, 40), 4, 2),        # two windows
+    (6, (10, 20), 1, 11),       # merged, commands combined with the data
+    (6, (10, 50), 2, 2),        # two windows, each one transaction
+])
+def test_transactions_for_adjacent_and_distant_runs(flushCost, columns, nTransactions, nData):
+
+    (bus, oled) = _make_display(True)
+    oled.set_flush_cost(flushCost)
+
+    for x in columns:
+        oled.pixel(x, 3)
+    oled.display()
+
+    assert bus.n_transactions == nTransactions
+    assert _device_matches(bus, oled)
+
+    # merged windows resend the unchanged bytes between the runs
+    assert bus.data_bytes == nData
+
+
+def test_runs_without_the_shadow_send_the_dirty_range():
+
+    (bus, oled) = _make_display(False)
+
+    # with no shadow to compare with, the whole dirty range of the page is one window -
+    # its commands, and 41 bytes of data in two chunks
+    oled.pixel(10, 3)
+    oled.pixel(50, 3)
+    oled.display()
+    assert bus.n_transactions == 3
+    assert bus.data_bytes == 41
+
+
+@pytest.mark.parametrize("flushCost", [2, 6])
+def test_long_run_is_split_into_chunks(flushCost):
+
+    (bus, oled) = _make_display(False, 16)
+    oled.set_flush_cost(flushCost)
+
+    oled.line_h(0, 0, 64)
+    oled.display()
+
+    # 64 bytes in chunks of 16 - the 10 byte command prefix doesn't fit beside data in a
+    # chunk without costing an extra transaction, so the commands are always separate
+    assert bus.data_bytes == 64
+    assert bus.n_transactions == 5
+    assert _device_matches(bus, oled)
+
+
+@pytest.mark.parametrize("size", [0, -1, 33, 1000])
+def test_out_of_range_chunk_sizes_are_rejected(size):
+
+    (_, oled) = _make_display(False)
+    with pytest.raises(ValueError):
+        oled.set_chunk_size(size)
+    assert oled.chunk_size == 32
+
+    oled.chunk_size = 7
+    assert oled.chunk_size == 7
+    oled.chunk_size = None
+    assert oled.chunk_size == 32
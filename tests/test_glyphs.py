@@ -0,0 +1,88 @@
+# draw_char() from pre-packed glyph strips against the base class, which draws a glyph a
+# pixel at a time.
+
+import random
+
+import pytest
+from qwiic_oled_base import QwiicOledBase
+
+import qwiic_micro_oled
+
+SIZES = [(64, 48), (37, 21)]
+
+
+class _Reference(qwiic_micro_oled.Canvas):
+    """A canvas that draws characters with the base class, a pixel at a time"""
+
+    pixel = QwiicOledBase.pixel
+    draw_char = QwiicOledBase.draw_char
+
+
+def _random_pair(rng, width, height):
+
+    canvas = qwiic_micro_oled.Canvas(width, height)
+    reference = _Reference(width, height)
+    for y in range(height):
+        for x in range(width):
+            if rng.random() < 0.3:
+                canvas.pixel(x, y)
+                reference.pixel(x, y)
+    canvas._mark_clean()
+    return (canvas, reference)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("fontType", [0, 1, 2, 3, 4])
+def test_draw_char_matches_the_base_class(size, fontType):
+
+    (width, height) = size
+    rng = random.Random("%s %d" % (size, fontType))
+    (canvas, reference) = _random_pair(rng, width, height)
+    canvas.set_font_type(fontType)
+    reference.set_font_type(fontType)
+    font = canvas._font
+    (fontWidth, fontHeight) = (canvas.get_font_width(), canvas.get_font_height())
+
+    # every character of the font, and one past each end
+    for c in range(font.start_char - 1, font.start_char + font.total_char + 1):
+        x = rng.randint(-fontWidth, width)
+        y = rng.randint(-fontHeight, height)
+        color = rng.choice((canvas.WHITE, canvas.BLACK))
+        mode = rng.choice((canvas.NORM, canvas.XOR))
+
+        before = bytes(canvas._screenbuffer)
+        canvas.draw_char(x, y, c, color, mode)
+        reference.draw_char(x, y, c, color, mode)
+        assert canvas._screenbuffer == reference._screenbuffer, (c, x, y, color, mode)
+
+        # every byte that changed is inside the dirty region of its page
+        for page in range(canvas._nPages):
+            for xx in range(width):
+                if canvas._screenbuffer[page * width + xx] != before[page * width + xx]:
+                    assert canvas._dirtyLo[page] <= xx < canvas._dirtyHi[page]
+        canvas._mark_clean()
+
+
+@pytest.mark.parametrize("fontType", [0, 1])
+def test_glyphs_at_every_row_offset(fontType):
+
+    # each of the 8 shifts within a page has its own strips
+    (canvas, reference) = (qwiic_micro_oled.Canvas(64, 48), _Reference(64, 48))
+    for canvas_ in (canvas, reference):
+        canvas_.set_font_type(fontType)
+    for y in range(-2, 14):
+        for c in (ord("A"), ord("g"), ord("0"), ord("~")):
+            canvas.draw_char(3 + y, y, c)
+            reference.draw_char(3 + y, y, c)
+    assert canvas._screenbuffer == reference._screenbuffer
+
+
+def test_strips_are_shared_between_displays():
+
+    first = qwiic_micro_oled.Canvas(64, 48)
+    second = qwiic_micro_oled.Canvas(64, 48)
+    first.draw_char(0, 3, ord("Q"))
+    second.draw_char(0, 3, ord("Q"))
+    assert first._screenbuffer == second._screenbuffer
+    assert qwiic_micro_oled._get_glyph_strips(0, first._font, 3) is \
+                qwiic_micro_oled._get_glyph_strips(0, second._font, 3)
@@ -0,0 +1,107 @@
+# NumericField - only the character cells that change are redrawn and sent.
+
+import pytest
+
+import qwiic_micro_oled
+import qwiic_micro_oled_sim
+
+
+def _make_display():
+
+    bus = qwiic_micro_oled_sim.SimulatedI2C(record=False)
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+    oled.begin()
+    oled.clear(oled.PAGE)
+    oled.display()
+    return (bus, oled)
+
+
+def _printed(text, x, y, fontType):
+
+    # the field's text as print() draws it
+    canvas = qwiic_micro_oled.Canvas(64, 48)
+    canvas.set_font_type(fontType)
+    canvas.set_cursor(x, y)
+    canvas.print(text)
+    return bytes(canvas._screenbuffer)
+
+
+@pytest.mark.parametrize("x, y, fontType", [(0, 0, 0), (7, 5, 2), (3, 20, 1)])
+def test_one_digit_change_marks_only_its_cell(x, y, fontType):
+
+    (bus, oled) = _make_display()
+    field = qwiic_micro_oled.NumericField(oled, x, y, 4, font_type=fontType, fmt="%d")
+    oled.set_font_type(fontType)
+    (advance, height) = (oled.get_font_width() + 1, oled.get_font_height())
+
+    assert field.set_value(1234) == 4
+    oled.display()
+    bus.reset_stats()
+
+    assert field.set_value(1284) == 1
+
+    # the dirty region is the third cell - the glyph and the blank column after it - on
+    # the pages the font covers
+    cellLo = x + 2 * advance
+    for page in range(oled._nPages):
+        if y // 8 <= page <= (y + height - 1) // 8:
+            assert (oled._dirtyLo[page], oled._dirtyHi[page]) == (cellLo, cellLo + advance)
+        else:
+            assert oled._dirtyLo[page] >= oled._dirtyHi[page]
+
+    oled.display()
+    nPages = (y + height - 1) // 8 - y // 8 + 1
+    assert bus.data_bytes == advance * nPages
+    assert bus.devices[oled.address].image() == _printed("1284", x, y, fontType)
+
+    # the same value again redraws nothing
+    assert field.set_value(1284) == 0
+    assert all(lo >= hi for (lo, hi) in zip(oled._dirtyLo, oled._dirtyHi))
+
+
+def test_text_is_right_aligned_and_cut():
+
+    (_, oled) = _make_display()
+    field = qwiic_micro_oled.NumericField(oled, 2, 8, 5, fmt="%.1f")
+
+    field.set_value(3.25)
+    assert oled._screenbuffer == bytearray(_printed("  3.2", 2, 8, 0))
+
+    assert field.set_value(12.5) == 3
+    assert oled._screenbuffer == bytearray(_printed(" 12.5", 2, 8, 0))
+
+    # shorter text clears the cells it no longer covers
+    assert field.set_value(7) == 3
+    assert oled._screenbuffer == bytearray(_printed("  7.0", 2, 8, 0))
+
+    field.set_text("1234567")
+    assert oled._screenbuffer == bytearray(_printed("34567", 2, 8, 0))
+    assert field.set_text("") == 5
+    assert not any(oled._screenbuffer)
+
+
+def test_cells_are_replaced_not_merged():
+
+    (_, oled) = _make_display()
+    oled.rect_fill(0, 0, 64, 16)
+    field = qwiic_micro_oled.NumericField(oled, 0, 0, 3, font_type=0)
+    field.set_text("8.8")
+
+    expected = bytearray(_printed("8.8", 0, 0, 0))
+    expected[18:64] = b"\xFF" * 46
+    expected[64:128] = b"\xFF" * 64
+    assert oled._screenbuffer == expected
+
+
+def test_redraw_after_clear():
+
+    (_, oled) = _make_display()
+    field = qwiic_micro_oled.NumericField(oled, 4, 4, 3, fmt="%03d")
+    field.set_value(42)
+    drawn = bytes(oled._screenbuffer)
+
+    oled.clear(oled.PAGE)
+    assert field.set_value(42) == 0
+    field.redraw()
+    assert bytes(oled._screenbuffer) == drawn
+    assert field.value == 42
@@ -0,0 +1,169 @@
+# RawI2C against a fake i2c-dev device - the module's system call hooks are replaced.
+
+import ctypes
+import errno
+
+import pytest
+
+import qwiic_micro_oled
+import qwiic_micro_oled_raw_i2c as raw_i2c
+
+
+class FakeI2CDevice(object):
+    """Stands in for open/ioctl/write/close on /dev/i2c-N, and records what's sent."""
+
+    FD = 7
+
+    def __init__(self, funcs=raw_i2c._I2C_FUNC_I2C):
+        self.funcs = funcs
+        self.opened = []
+        self.closed = []
+        self.slaveAddresses = []
+        self.writes = []            # (address, bytes) sent with write()
+        self.transfers = []         # one list of (address, bytes) per I2C_RDWR call
+        self._slave = None
+
+    def open(self, path, flags):
+        self.opened.append(path)
+        return self.FD
+
+    def close(self, fd):
+        self.closed.append(fd)
+
+    def write(self, fd, data):
+        self.writes.append((self._slave, bytes(data)))
+        return len(data)
+
+    def ioctl(self, fd, request, arg):
+        if request == raw_i2c._I2C_FUNCS:
+            arg.value = self.funcs
+        elif request == raw_i2c._I2C_SLAVE:
+            self.slaveAddresses.append(arg)
+            self._slave = arg
+        elif request == raw_i2c._I2C_RDWR:
+            messages = [arg.msgs[i] for i in range(arg.nmsgs)]
+            self.transfers.append([(m.addr, ctypes.string_at(m.buf, m.len) if m.len else b"") \
+                                        for m in messages])
+        else:
+            raise OSError(errno.EINVAL, "unknown ioctl")
+        return 0
+
+    @property
+    def messages(self):
+        return [message for transfer in self.transfers for message in transfer]
+
+
+@pytest.fixture
+def device(monkeypatch):
+
+    fake = FakeI2CDevice()
+    monkeypatch.setattr(raw_i2c, "_open", fake.open)
+    monkeypatch.setattr(raw_i2c, "_close", fake.close)
+    monkeypatch.setattr(raw_i2c, "_write", fake.write)
+    monkeypatch.setattr(raw_i2c, "_ioctl", fake.ioctl)
+    return fake
+
+
+def test_unsupported_bus_closes_the_device(device):
+
+    device.funcs = 0
+
+    with pytest.raises(OSError) as exInfo:
+        raw_i2c.RawI2C(bus=3)
+
+    assert exInfo.value.errno == errno.EOPNOTSUPP
+    assert device.opened == ["/dev/i2c-3"]
+    assert device.closed == [FakeI2CDevice.FD]
+
+
+def test_rdwr_writes_one_message_per_block(device):
+
+    bus = raw_i2c.RawI2C()
+    bus.writeBlock(0x3D, 0x40, bytes(range(100)))
+    bus.writeByte(0x3D, 0x00, 0xAF)
+
+    assert device.transfers == [[(0x3D, b"\x40" + bytes(range(100)))], [(0x3D, b"\x00\xAF")]]
+
+
+def test_write_mode_caches_the_slave_address(device):
+
+    bus = raw_i2c.RawI2C(mode=raw_i2c.MODE_WRITE)
+    bus.writeByte(0x3D, 0x00, 0xAE)
+    bus.writeBlock(0x3D, 0x40, b"\x01\x02")
+    bus.writeByte(0x3C, 0x00, 0xAF)
+    bus.writeByte(0x3C, 0x00, 0xA4)
+    bus.writeByte(0x3D, 0x00, 0xA6)
+
+    assert device.slaveAddresses == [0x3D, 0x3C, 0x3D]
+    assert device.writes == [(0x3D, b"\x00\xAE"), (0x3D, b"\x40\x01\x02"), (0x3C, b"\x00\xAF"),
+                             (0x3C, b"\x00\xA4"), (0x3D, b"\x00\xA6")]
+    assert device.transfers == []
+
+
+def test_batch_splits_at_the_message_limit(device):
+
+    bus = raw_i2c.RawI2C()
+    with bus.batch():
+        for i in range(100):
+            bus.writeByte(0x3D, 0x40, i)
+        assert device.transfers == []
+
+    assert [len(transfer) for transfer in device.transfers] == [42, 42, 16]
+    assert device.messages == [(0x3D, bytes((0x40, i))) for i in range(100)]
+
+
+def test_batch_sends_nothing_when_the_block_raises(device):
+
+    bus = raw_i2c.RawI2C()
+    with pytest.raises(RuntimeError):
+        with bus.batch():
+            bus.writeByte(0x3D, 0x40, 1)
+            raise RuntimeError("drawing failed")
+
+    assert device.transfers == []
+
+    # the next write isn't held in a batch
+    bus.writeByte(0x3D, 0x40, 2)
+    assert device.transfers == [[(0x3D, b"\x40\x02")]]
+
+
+def test_message_size_limit(device):
+
+    bus = raw_i2c.RawI2C()
+    bus.writeBlock(0x3D, 0x40, bytes(raw_i2c._MAX_MESSAGE_SIZE - 1))
+
+    with pytest.raises(ValueError):
+        bus.writeBlock(0x3D, 0x40, bytes(raw_i2c._MAX_MESSAGE_SIZE))
+
+    assert len(device.transfers) == 1
+
+
+def test_get_i2c_driver_falls_back_to_qwiic(device, monkeypatch):
+
+    qwiicDriver = object()
+    monkeypatch.setattr(raw_i2c.qwiic_i2c, "getI2CDriver", lambda *args, **kwargs: qwiicDriver)
+
+    assert isinstance(raw_i2c.get_i2c_driver(), raw_i2c.RawI2C)
+
+    device.funcs = 0
+    assert raw_i2c.get_i2c_driver() is qwiicDriver
+
+    def no_device(path, flags):
+        raise OSError(errno.ENOENT, "no such device")
+    monkeypatch.setattr(raw_i2c, "_open", no_device)
+    assert raw_i2c.get_i2c_driver(bus=4) is qwiicDriver
+
+
+def test_display_frame_is_one_transfer(device):
+
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=raw_i2c.RawI2C())
+    oled.begin()
+    del device.transfers[:]
+
+    oled.invalidate()
+    oled.display()
+
+    # one ioctl, with each page's window commands and data in whole messages
+    assert len(device.transfers) == 1
+    data = b"".join(payload[1:] for (_, payload) in device.transfers[0] if payload[0] == 0x40)
+    assert data == bytes(oled._screenbuffer)
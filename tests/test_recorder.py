@@ -0,0 +1,191 @@
+# Recording round trips - the delta encoding, playback and image export.
+
+import io
+import random
+
+import pytest
+
+import qwiic_micro_oled
+import qwiic_micro_oled_sim
+import qwiic_micro_oled_recorder as recorder
+
+
+def _random_frames(rng, frameSize, nFrames):
+
+    # a mix of the changes the encoder has to handle: nothing, a few bytes, runs of one
+    # value, random noise, and whole frames
+    frame = bytearray(frameSize)
+    frames = []
+    for _ in range(nFrames):
+        kind = rng.randrange(6)
+        if kind == 1:
+            for _ in range(rng.randrange(1, 6)):
+                frame[rng.randrange(frameSize)] = rng.randrange(256)
+        elif kind == 2:
+            start = rng.randrange(frameSize)
+            end = rng.randrange(start, frameSize + 1)
+            frame[start:end] = bytes([rng.randrange(256)]) * (end - start)
+        elif kind == 3:
+            start = rng.randrange(frameSize)
+            end = min(frameSize, start + rng.randrange(1, 40))
+            frame[start:end] = bytes(rng.randrange(256) for _ in range(end - start))
+        elif kind == 4:
+            frame[:] = bytes(rng.randrange(256) for _ in range(frameSize))
+        elif kind == 5:
+            frame[:] = bytes([rng.choice((0, 0xFF))]) * frameSize
+        frames.append(bytes(frame))
+    return frames
+
+
+def _record(frames, times, width, height):
+
+    target = io.BytesIO()
+    with recorder.Recorder(target, width=width, height=height) as rec:
+        for (frame, timestamp) in zip(frames, times):
+            rec.add_frame(frame, timestamp)
+        assert rec.frame_count == len(frames)
+    return target.getvalue()
+
+
+@pytest.mark.parametrize("size", [(64, 48), (128, 32), (20, 13), (1, 1)])
+@pytest.mark.parametrize("seed", range(5))
+def test_random_frames_round_trip(size, seed):
+
+    (width, height) = size
+    rng = random.Random(seed)
+    frames = _random_frames(rng, width * ((height + 7) // 8), 60)
+    times = []
+    t = 0.
+    for _ in frames:
+        t += rng.choice((0., 0.000001, 1 / 60., rng.random() * 5))
+        times.append(t)
+
+    player = recorder.Player(io.BytesIO(_record(frames, times, width, height)))
+
+    assert (player.width, player.height) == size
+    assert len(player) == len(frames)
+    played = list(player.frames())
+    assert [frame for (_, frame) in played] == frames
+    for ((timestamp, _), expected) in zip(played, times):
+        assert timestamp == pytest.approx(expected, abs=2e-6)
+
+
+def test_unchanged_frames_are_small():
+
+    frame = bytes(range(256)) + bytes(128)
+    data = _record([frame] * 101, [i / 30. for i in range(101)], 64, 48)
+
+    # the first frame, then a couple of bytes for each repeat
+    assert len(data) < len(frame) + 100 * 4
+
+
+def test_delta_encoding_round_trip():
+
+    rng = random.Random(7)
+    lineSize = 64
+    prev = bytearray(384)
+    for frame in _random_frames(rng, 384, 200):
+        payload = recorder._encode_delta(frame, prev, lineSize)
+        decoded = bytearray(prev)
+        recorder._apply_delta(payload, decoded)
+        assert bytes(decoded) == frame
+        prev = bytearray(frame)
+
+
+def test_bad_recordings_are_rejected():
+
+    with pytest.raises(ValueError):
+        recorder.Player(io.BytesIO(b"QMO"))
+    with pytest.raises(ValueError):
+        recorder.Player(io.BytesIO(b"XXXX\x01\x40\x00\x30\x00"))
+
+    data = _record([bytes(range(256)) + bytes(128)], [0.], 64, 48)
+    with pytest.raises(ValueError):
+        recorder.Player(io.BytesIO(data[:-10]))
+
+
+def test_recording_a_display_plays_back_exactly():
+
+    bus = qwiic_micro_oled_sim.SimulatedI2C(record=False)
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+    oled.begin()
+    oled.clear(oled.PAGE)
+
+    expected = []
+    target = io.BytesIO()
+    with recorder.Recorder(target, oled):
+        for i in range(20):
+            oled.line(i, 0, 63 - i, 47)
+            oled.circle(32, 24, i)
+            oled.set_cursor(0, i)
+            oled.print(str(i))
+            oled.display()
+            expected.append(bytes(oled._screenbuffer))
+
+    player = recorder.Player(io.BytesIO(target.getvalue()))
+    assert [frame for (_, frame) in player.frames()] == expected
+
+    # playing back on another display leaves its device showing the last frame
+    playBus = qwiic_micro_oled_sim.SimulatedI2C(record=False)
+    playOled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=playBus)
+    playOled.begin()
+    assert player.play(playOled, realtime=False) == len(expected)
+
+    device = bus.devices[oled.address]
+    playDevice = playBus.devices[playOled.address]
+    assert [playDevice.get_pixel(x, y) for y in range(48) for x in range(64)] == \
+           [device.get_pixel(x, y) for y in range(48) for x in range(64)]
+
+
+def _pixel(frame, width, x, y):
+    return (frame[(y >> 3) * width + x] >> (y & 7)) & 1
+
+
+def test_png_export(tmp_path):
+
+    Image = pytest.importorskip("PIL.Image")
+
+    frames = _random_frames(random.Random(3), 20 * 2, 4)
+    player = recorder.Player(io.BytesIO(_record(frames, [0., .1, .2, .3], 20, 13)))
+
+    pattern = str(tmp_path / "frame%02d.png")
+    assert player.export_png(pattern, scale=2) == 4
+
+    for (i, frame) in enumerate(frames):
+        path = pattern % i
+        with open(path, "rb") as fImage:
+            assert fImage.read(8) == b"\x89PNG\r\n\x1a\n"
+
+        image = Image.open(path)
+        assert image.size == (40, 26)
+        for y in range(13):
+            for x in range(20):
+                expected = _pixel(frame, 20, x, y)
+                assert bool(image.getpixel((2 * x, 2 * y))) == bool(expected)
+                assert bool(image.getpixel((2 * x + 1, 2 * y + 1))) == bool(expected)
+
+
+def test_gif_export(tmp_path):
+
+    Image = pytest.importorskip("PIL.Image")
+
+    frames = [bytes([1 << (i % 8)]) * 384 for i in range(5)]
+    player = recorder.Player(io.BytesIO(_record(frames, [0., .1, .3, .35, 1.], 64, 48)))
+
+    path = str(tmp_path / "anim.gif")
+    player.export_gif(path, scale=3)
+
+    with open(path, "rb") as fImage:
+        assert fImage.read(6) == b"GIF89a"
+
+    image = Image.open(path)
+    assert image.size == (192, 144)
+    assert image.n_frames == len(frames)
+
+    durations = []
+    for i in range(image.n_frames):
+        image.seek(i)
+        durations.append(image.info["duration"])
+        row = i % 8
+        assert bool(image.convert("1").getpixel((0, row * 3))) and not image.convert("1").getpixel((0, ((row + 1) % 8) * 3))
+    assert durations[:4] == [100, 200, 50, 650]
@@ -0,0 +1,181 @@
+# Region operations against a pixel by pixel reference.
+
+import random
+
+import pytest
+
+import qwiic_micro_oled
+import qwiic_micro_oled_sim
+
+SIZES = [(64, 48), (37, 21), (20, 8), (64, 5)]
+
+
+def _pixels(canvas):
+    return [[(canvas._screenbuffer[(y >> 3) * canvas.LCDWIDTH + x] >> (y & 7)) & 1 \
+                for x in range(canvas.LCDWIDTH)] for y in range(canvas.LCDHEIGHT)]
+
+
+def _random_canvas(rng, width, height):
+
+    canvas = qwiic_micro_oled.Canvas(width, height)
+    canvas._screenbuffer[:] = bytes(rng.randrange(256) for _ in range(len(canvas._screenbuffer)))
+    # bits below the last row aren't pixels
+    for (page, mask) in enumerate(canvas._page_masks(0, height, 0, canvas._nPages)):
+        for x in range(width):
+            canvas._screenbuffer[page * width + x] &= mask
+    canvas._mark_clean()
+    return canvas
+
+
+def _random_rect(rng, width, height):
+    # often unaligned, crossing pages, and hanging off any edge
+    return (rng.randint(-10, width + 5), rng.randint(-10, height + 5),
+            rng.randint(-2, width + 10), rng.randint(-2, height + 10))
+
+
+def _in_screen(width, height, x, y):
+    return 0 <= x < width and 0 <= y < height
+
+
+def _check(canvas, before, expected):
+
+    assert _pixels(canvas) == expected
+
+    # every byte that changed is inside the dirty region of its page
+    width = canvas.LCDWIDTH
+    for page in range(canvas._nPages):
+        for x in range(width):
+            i = page * width + x
+            if canvas._screenbuffer[i] != before[i]:
+                assert canvas._dirtyLo[page] <= x < canvas._dirtyHi[page]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_fill_region(size):
+
+    (width, height) = size
+    rng = random.Random("fill %s" % (size,))
+    for _ in range(150):
+        canvas = _random_canvas(rng, width, height)
+        before = bytes(canvas._screenbuffer)
+        expected = _pixels(canvas)
+        (x, y, w, h) = _random_rect(rng, width, height)
+        color = rng.choice((canvas.BLACK, canvas.WHITE))
+        mode = rng.choice((canvas.NORM, canvas.XOR))
+
+        canvas.fill_region(x, y, w, h, color, mode)
+
+        for yy in range(y, y + h):
+            for xx in range(x, x + w):
+                if _in_screen(width, height, xx, yy):
+                    if mode == canvas.XOR:
+                        expected[yy][xx] ^= color
+                    else:
+                        expected[yy][xx] = color
+        _check(canvas, before, expected)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_rect_fill_and_invert_region(size):
+
+    (width, height) = size
+    rng = random.Random("invert %s" % (size,))
+    for _ in range(150):
+        canvas = _random_canvas(rng, width, height)
+        before = bytes(canvas._screenbuffer)
+        expected = _pixels(canvas)
+        (x, y, w, h) = _random_rect(rng, width, height)
+
+        if rng.random() < 0.5:
+            canvas.invert_region(x, y, w, h)
+            value = None
+        else:
+            canvas.rect_fill(x, y, w, h)
+            value = 1
+
+        for yy in range(y, y + h):
+            for xx in range(x, x + w):
+                if _in_screen(width, height, xx, yy):
+                    expected[yy][xx] = expected[yy][xx] ^ 1 if value is None else value
+        _check(canvas, before, expected)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_copy_region(size):
+
+    (width, height) = size
+    rng = random.Random("copy %s" % (size,))
+    for _ in range(200):
+        canvas = _random_canvas(rng, width, height)
+        before = bytes(canvas._screenbuffer)
+        source = _pixels(canvas)
+        expected = [row[:] for row in source]
+        (x, y, w, h) = _random_rect(rng, width, height)
+        # small offsets overlap the source - the memmove case
+        (dx, dy) = (rng.randint(-width, width), rng.randint(-height, height)) if rng.random() < 0.5 \
+                        else (rng.randint(-3, 3), rng.randint(-9, 9))
+
+        canvas.copy_region(x, y, w, h, x + dx, y + dy)
+
+        for yy in range(y, y + h):
+            for xx in range(x, x + w):
+                if _in_screen(width, height, xx, yy) and _in_screen(width, height, xx + dx, yy + dy):
+                    expected[yy + dy][xx + dx] = source[yy][xx]
+        _check(canvas, before, expected)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_scroll_buffer(size):
+
+    (width, height) = size
+    rng = random.Random("scroll %s" % (size,))
+    for _ in range(200):
+        canvas = _random_canvas(rng, width, height)
+        before = bytes(canvas._screenbuffer)
+        source = _pixels(canvas)
+        expected = [row[:] for row in source]
+        (dx, dy) = (rng.randint(-width - 3, width + 3), rng.randint(-height - 3, height + 3))
+        fill = rng.choice((None, canvas.WHITE))
+
+        if rng.random() < 0.3:
+            canvas.scroll_buffer(dx, dy, fill=fill)
+            (x, y, w, h) = (0, 0, width, height)
+        else:
+            (x, y, w, h) = _random_rect(rng, width, height)
+            canvas.scroll_buffer(dx, dy, x, y, w, h, fill)
+
+        (x0, y0, x1, y1) = (max(x, 0), max(y, 0), min(x + w, width), min(y + h, height))
+        if x0 < x1 and y0 < y1 and (dx or dy):
+            for yy in range(y0, y1):
+                for xx in range(x0, x1):
+                    (sx, sy) = (xx - dx, yy - dy)
+                    expected[yy][xx] = source[sy][sx] if x0 <= sx < x1 and y0 <= sy < y1 else (fill or 0)
+        _check(canvas, before, expected)
+
+
+def test_region_operations_reach_the_device():
+
+    bus = qwiic_micro_oled_sim.SimulatedI2C(record=False)
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+    oled.begin()
+    oled.clear(oled.PAGE)
+    oled.display()
+    device = bus.devices[oled.address]
+
+    rng = random.Random(3)
+    for i in range(300):
+        rect = [rng.randint(-5, 60) for _ in range(4)]
+        choice = rng.random()
+        if choice < 0.3:
+            oled.scroll_buffer(rng.randint(-9, 9), rng.randint(-9, 9), *rect)
+        elif choice < 0.5:
+            oled.copy_region(*rect, rng.randint(-5, 60), rng.randint(-5, 50))
+        elif choice < 0.7:
+            oled.invert_region(*rect)
+        else:
+            oled.fill_region(*rect, color=rng.randint(0, 1))
+
+        if i % 7 == 0:
+            oled.display()
+            image = [device.get_pixel(x, y) for y in range(48) for x in range(64)]
+            assert image == [pixel for row in _pixels(oled) for pixel in row]
@@ -0,0 +1,191 @@
+# The display server and its clients, over a socket in a temporary directory.
+
+import os
+import socket
+import stat
+
+import pytest
+
+import qwiic_micro_oled
+import qwiic_micro_oled_sim
+import qwiic_micro_oled_server
+
+
+@pytest.fixture
+def server(tmp_path):
+
+    bus = qwiic_micro_oled_sim.SimulatedI2C(record=False)
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+    oled.begin()
+    oled.clear(oled.PAGE)
+    oled.display()
+
+    displayServer = qwiic_micro_oled_server.DisplayServer(oled, str(tmp_path / "oled.sock"), fps=200)
+    displayServer.start()
+    displayServer.device = bus.devices[oled.address]
+    yield displayServer
+    displayServer.stop()
+
+
+def _window_pixel(client, x, y):
+
+    # the pixel of the screen at x, y if it's in the client's window, otherwise None
+    x -= client._windowX
+    y -= client._windowY
+    if 0 <= x < client.LCDWIDTH and 0 <= y < client.LCDHEIGHT:
+        return (client._screenbuffer[(y >> 3) * client.LCDWIDTH + x] >> (y & 7)) & 1
+    return None
+
+
+def _expected_image(clients, width=64, height=48):
+
+    image = []
+    for y in range(height):
+        for x in range(width):
+            values = [_window_pixel(client, x, y) for client in clients]
+            values = [value for value in values if value is not None]
+            image.append(values[-1] if values else 0)
+    return image
+
+
+def _device_image(device, width=64, height=48):
+
+    return [device.get_pixel(x, y) for y in range(height) for x in range(width)]
+
+
+def test_two_clients_are_composited(server):
+
+    # a status line at the top, and a window that starts and ends inside pages
+    status = qwiic_micro_oled_server.DisplayClient(server.path, y=0, height=16)
+    gauge = qwiic_micro_oled_server.DisplayClient(server.path, x=10, y=21, width=40, height=19)
+
+    with status, gauge:
+        status.begin()
+        status.print("Status")
+        gauge.rect(0, 0, 40, 19)
+        gauge.circle(20, 9, 7)
+        gauge.line(0, 0, 39, 18)
+
+        status.display()
+        gauge.display()
+        status.sync()
+        gauge.sync()
+        assert _device_image(server.device) == _expected_image([status, gauge])
+
+        # clearing one window doesn't touch the other
+        gauge.clear()
+        gauge.rect_fill(5, 3, 11, 9)
+        gauge.display()
+        gauge.sync()
+        assert _device_image(server.device) == _expected_image([status, gauge])
+
+        # an update that changes nothing sends nothing
+        gauge.display()
+        gauge.sync()
+        assert _device_image(server.device) == _expected_image([status, gauge])
+
+
+def test_client_window_clips_to_the_screen(server):
+
+    with qwiic_micro_oled_server.DisplayClient(server.path, x=50, y=40) as corner:
+        assert (corner.LCDWIDTH, corner.LCDHEIGHT) == (14, 8)
+        corner.rect_fill(0, 0, 14, 8)
+        corner.display()
+        corner.sync()
+
+    image = _device_image(server.device)
+    assert sum(image) == 14 * 8
+    assert image[40 * 64 + 50] == 1 and image[47 * 64 + 63] == 1
+
+
+def test_socket_permissions(server):
+
+    assert stat.S_IMODE(os.stat(server.path).st_mode) == qwiic_micro_oled_server.DEFAULT_MODE
+
+
+def test_socket_mode_is_configurable(tmp_path):
+
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=qwiic_micro_oled_sim.SimulatedI2C())
+    with qwiic_micro_oled_server.DisplayServer(oled, str(tmp_path / "group.sock"), mode=0o660) as displayServer:
+        assert stat.S_IMODE(os.stat(displayServer.path).st_mode) == 0o660
+
+
+def test_running_server_is_not_replaced(server):
+
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=qwiic_micro_oled_sim.SimulatedI2C())
+    with pytest.raises(RuntimeError):
+        qwiic_micro_oled_server.DisplayServer(oled, server.path).start()
+
+    # the first server still answers
+    with qwiic_micro_oled_server.DisplayClient(server.path) as client:
+        client.sync()
+
+
+def test_stale_socket_is_replaced(tmp_path):
+
+    path = str(tmp_path / "stale.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=qwiic_micro_oled_sim.SimulatedI2C())
+    with qwiic_micro_oled_server.DisplayServer(oled, path):
+        with qwiic_micro_oled_server.DisplayClient(path) as client:
+            client.sync()
+
+    assert not os.path.exists(path)
+
+
+def test_path_that_is_not_a_socket_is_left_alone(tmp_path):
+
+    path = tmp_path / "important.txt"
+    path.write_text("keep me")
+
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=qwiic_micro_oled_sim.SimulatedI2C())
+    with pytest.raises(RuntimeError):
+        qwiic_micro_oled_server.DisplayServer(oled, str(path)).start()
+
+    assert path.read_text() == "keep me"
+
+
+class _FailingI2C(qwiic_micro_oled_sim.SimulatedI2C):
+    """A simulated bus whose writes fail while failing is set"""
+
+    failing = False
+
+    def _transaction(self, address, data):
+
+        if self.failing:
+            raise IOError("I2C write failed")
+        super()._transaction(address, data)
+
+
+def test_write_errors_dont_stop_the_server(tmp_path, capsys):
+
+    bus = _FailingI2C(record=False)
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+    oled.begin()
+    oled.clear(oled.PAGE)
+    oled.display()
+    device = bus.devices[oled.address]
+
+    with qwiic_micro_oled_server.DisplayServer(oled, str(tmp_path / "oled.sock"), fps=200) as displayServer:
+        with qwiic_micro_oled_server.DisplayClient(displayServer.path) as client:
+            client._sock.settimeout(10)
+
+            # a sync still returns while the device can't be written
+            bus.failing = True
+            client.rect_fill(3, 5, 30, 20)
+            client.display()
+            client.sync()
+            client.sync()
+            assert sum(_device_image(device)) == 0
+
+            # the error is reported once, not every tick
+            assert capsys.readouterr().err.count("error writing to the display") == 1
+
+            # once the bus works again, the update reaches the device with no new drawing
+            bus.failing = False
+            client.sync()
+            client.sync()
+            assert _device_image(device) == _expected_image([client])
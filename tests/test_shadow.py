@@ -0,0 +1,145 @@
+# The shadow buffer - display() sends only the byte runs that differ from what the device
+# shows, joining runs separated by no more than the merge gap.
+
+import random
+
+import pytest
+
+import qwiic_micro_oled
+import qwiic_micro_oled_sim
+
+
+def _make_display():
+
+    bus = qwiic_micro_oled_sim.SimulatedI2C(record=False)
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+    oled.begin()
+    oled.shadow_mode = True
+    oled.clear(oled.PAGE)
+    oled.display()
+    return (bus, oled)
+
+
+def _expected_columns(oled):
+
+    # the columns of each page display() should write: the bytes of the dirty range that
+    # differ from the shadow, and the gaps of at most the merge gap between them
+    gap = oled.get_flush_cost()
+    written = []
+    for page in range(oled._nPages):
+        iLine = page * oled.LCDWIDTH
+        changed = [x for x in range(oled._dirtyLo[page], oled._dirtyHi[page]) \
+                        if oled._screenbuffer[iLine + x] != oled._shadow[iLine + x]]
+        columns = set(changed)
+        for (a, b) in zip(changed, changed[1:]):
+            if b - a - 1 <= gap:
+                columns.update(range(a, b))
+        written.append(columns)
+    return written
+
+
+def _random_draw(rng, oled):
+
+    (x, y) = (rng.randint(-5, 63), rng.randint(-5, 47))
+    choice = rng.random()
+    if choice < 0.4:
+        oled.pixel(x, y, rng.randint(0, 1), rng.randint(0, 1))
+    elif choice < 0.7:
+        oled.line(x, y, rng.randint(0, 63), rng.randint(0, 47), rng.randint(0, 1))
+    else:
+        oled.rect_fill(x, y, rng.randint(1, 12), rng.randint(1, 12), rng.randint(0, 1), rng.randint(0, 1))
+
+
+@pytest.mark.parametrize("flushCost", [0, 2, 6])
+def test_only_changed_runs_are_sent(flushCost):
+
+    rng = random.Random(flushCost)
+    (bus, oled) = _make_display()
+    oled.set_flush_cost(flushCost)
+    device = bus.devices[oled.address]
+    offset = device.column_offset
+
+    for _ in range(150):
+        for _ in range(rng.randint(1, 4)):
+            _random_draw(rng, oled)
+
+        # flip every device byte display() shouldn't write - they have to stay flipped
+        written = _expected_columns(oled)
+        for page in range(6):
+            for x in range(64):
+                if x not in written[page]:
+                    device.ram[page][offset + x] ^= 0x5A
+
+        bus.reset_stats()
+        oled.display()
+        assert bus.data_bytes == sum(len(columns) for columns in written)
+
+        for page in range(6):
+            for x in range(64):
+                value = oled._screenbuffer[page * 64 + x]
+                if x in written[page]:
+                    assert device.ram[page][offset + x] == value
+                else:
+                    assert device.ram[page][offset + x] == value ^ 0x5A
+                    device.ram[page][offset + x] = value
+
+        assert oled._shadow == oled._screenbuffer
+
+
+def test_undone_changes_send_nothing():
+
+    (bus, oled) = _make_display()
+    oled.print("Shadow")
+    oled.display()
+
+    bus.reset_stats()
+    oled.rect_fill(3, 3, 40, 30, oled.WHITE, oled.XOR)
+    oled.rect_fill(3, 3, 40, 30, oled.WHITE, oled.XOR)
+    oled.display()
+    assert bus.n_transactions == 0
+
+    # a single changed byte in a large dirty range is one byte of data
+    oled.invalidate()
+    oled.pixel(20, 20, oled.BLACK if oled._screenbuffer[2 * 64 + 20] & 0x10 else oled.WHITE)
+    oled.display()
+    assert bus.data_bytes == 1
+
+
+def test_clear_all_resets_the_shadow():
+
+    (bus, oled) = _make_display()
+    oled.rect_fill(0, 0, 64, 48)
+    oled.display()
+
+    # the device was cleared - so is the shadow, and a blank buffer sends nothing
+    oled.clear(oled.ALL)
+    assert not any(oled._shadow)
+    bus.reset_stats()
+    oled.clear(oled.PAGE)
+    oled.display()
+    assert bus.data_bytes == 0
+
+    # the first frame after begin() only sends the bytes that aren't blank
+    oled.begin()
+    oled.clear(oled.PAGE)
+    oled.pixel(5, 5)
+    oled.pixel(50, 40)
+    bus.reset_stats()
+    oled.display()
+    assert bus.data_bytes == 2
+    assert bus.devices[oled.address].image() == bytes(oled._screenbuffer)
+
+
+def test_toggling_shadow_mode_resends_the_screen():
+
+    (bus, oled) = _make_display()
+    oled.print("abc")
+    oled.display()
+
+    oled.shadow_mode = False
+    assert oled._shadow is None
+    oled.shadow_mode = True
+    bus.reset_stats()
+    oled.display()
+    assert bus.data_bytes == 64 * 6
+    assert bus.devices[oled.address].image() == bytes(oled._screenbuffer)
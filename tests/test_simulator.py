@@ -0,0 +1,198 @@
+# The emulated SSD1306 and the simulated bus that the other tests rely on.
+
+import time
+
+import pytest
+
+import qwiic_micro_oled_sim
+from qwiic_micro_oled_sim import SimulatedSSD1306, SimulatedI2C
+
+_ADDRESS = 0x3D
+
+
+def _commands(device, *commands):
+    for command in commands:
+        device.write(False, command)
+
+
+def _data(device, values):
+    for value in values:
+        device.write(True, value)
+
+
+def test_page_addressing():
+
+    device = SimulatedSSD1306()
+    assert device.addressing_mode == qwiic_micro_oled_sim.PAGE_ADDRESSING
+
+    # page 3, column 0x5E - the column wraps to the start of the window, on the same page
+    _commands(device, 0xB3, 0x0E, 0x15)
+    assert (device.page, device.column) == (3, 0x5E)
+    _data(device, range(1, 40))
+    assert device.ram[3][0x5E:0x80] == bytearray(range(1, 35))
+    assert device.ram[3][0:5] == bytearray(range(35, 40))
+    assert not any(device.ram[4])
+    assert device.data_bytes == 39
+
+
+def test_horizontal_addressing():
+
+    device = SimulatedSSD1306()
+    # columns 10-13 of pages 2-3 - data fills a row of the window, then moves to the next page,
+    # and wraps back to the top of the window
+    _commands(device, 0x20, qwiic_micro_oled_sim.HORIZONTAL_ADDRESSING, 0x21, 10, 13, 0x22, 2, 3)
+    _data(device, range(1, 11))
+
+    assert device.ram[2][10:14] == bytearray([9, 10, 3, 4])
+    assert device.ram[3][10:14] == bytearray([5, 6, 7, 8])
+    assert device.ram[2][9] == 0 and device.ram[2][14] == 0
+    assert (device.page, device.column) == (2, 12)
+
+
+def test_vertical_addressing():
+
+    device = SimulatedSSD1306()
+    # columns 5-6 of pages 1-3 - data goes down the pages of a column, then to the next column
+    _commands(device, 0x20, qwiic_micro_oled_sim.VERTICAL_ADDRESSING, 0x21, 5, 6, 0x22, 1, 3)
+    _data(device, range(1, 9))
+
+    # the window's 6 bytes are full after 6 - the last 2 wrap to its first column
+    assert [device.ram[page][5] for page in (1, 2, 3)] == [7, 8, 3]
+    assert [device.ram[page][6] for page in (1, 2, 3)] == [4, 5, 6]
+    assert device.ram[1][5 - 1] == 0 and device.ram[0][5] == 0
+
+
+def test_command_arguments_and_settings():
+
+    device = SimulatedSSD1306()
+    # a command's arguments can arrive one byte at a time
+    _commands(device, 0x81)
+    assert device.contrast == 0x7F
+    _commands(device, 0x33)
+    assert device.contrast == 0x33
+
+    _commands(device, 0xAF, 0xA7, 0x2F)
+    assert (device.display_on, device.inverted, device.scrolling) == (True, True, True)
+    _commands(device, 0xAE, 0xA6, 0x2E)
+    assert (device.display_on, device.inverted, device.scrolling) == (False, False, False)
+
+    # setup commands that aren't emulated still take their arguments
+    _commands(device, 0xD5, 0xAF, 0xA8, 0xAF)
+    assert not device.display_on
+    assert device.commands == 9
+
+
+def test_control_bytes():
+
+    bus = SimulatedI2C()
+    device = bus.devices[_ADDRESS]
+
+    # 0x00: the rest are commands
+    bus.writeBlock(_ADDRESS, 0x00, [0xB1, 0x02, 0x12])
+    assert (device.page, device.column) == (1, 0x22)
+
+    # 0x40: the rest are data
+    bus.writeBlock(_ADDRESS, 0x40, [0xAF, 0x81, 0x01])
+    assert device.ram[1][0x22:0x25] == bytearray([0xAF, 0x81, 0x01])
+    assert not device.display_on
+
+    # 0x80: one command, then another control byte. 0xC0 is one data byte.
+    bus.writeBlock(_ADDRESS, 0x80, [0xB4, 0x80, 0x00, 0x80, 0x13, 0xC0, 0x55, 0x40, 0x66, 0x77])
+    assert device.ram[4][0x30:0x33] == bytearray([0x55, 0x66, 0x77])
+
+    # a command split across transactions
+    bus.writeBlock(_ADDRESS, 0x80, [0x81])
+    bus.writeByte(_ADDRESS, 0x00, 0x10)
+    assert device.contrast == 0x10
+
+    assert bus.command_bytes == 3 + 3 + 1 + 1
+    assert bus.data_bytes == 3 + 3
+    assert bus.n_transactions == 5
+    assert [payload for (_, _, payload) in bus.transactions][0] == bytes([0x00, 0xB1, 0x02, 0x12])
+
+
+def test_panel_column_offset():
+
+    # the 64 column panel shows GDDRAM columns 32-95
+    device = SimulatedSSD1306()
+    _commands(device, 0xB0, 0x00, 0x12)         # column 32
+    _data(device, [0x01, 0x80])
+    _commands(device, 0xB5, 0x0F, 0x15)         # column 95, the last on the panel
+    _data(device, [0xFF, 0x0F])                 # the second byte is off the panel
+
+    assert device.get_pixel(0, 0) == 1 and device.get_pixel(1, 7) == 1
+    assert all(device.get_pixel(63, y) for y in range(40, 48))
+    assert device.ram[5][96] == 0x0F
+    image = device.image()
+    assert len(image) == 64 * 6
+    assert image[0:2] == b"\x01\x80" and image[5 * 64 + 63] == 0xFF
+    assert device.ascii().splitlines()[0].startswith("#.")
+
+    # another panel size and offset
+    small = SimulatedSSD1306(column_offset=0, width=128, height=32)
+    _commands(small, 0xB3, 0x0F, 0x17)          # column 127
+    _data(small, [0x80, 0x01])                  # the next column wraps to 0
+    assert small.get_pixel(127, 31) == 1 and small.get_pixel(0, 24) == 1
+    assert len(small.image()) == 128 * 4
+
+
+def test_content_scroll_wraps_the_window():
+
+    device = SimulatedSSD1306()
+    _commands(device, 0xB2, 0x00, 0x12)
+    _data(device, [1, 2, 3, 4])
+
+    # right, page 2, columns 32-35
+    _commands(device, 0x2C, 0x00, 2, 0x01, 2, 32, 35)
+    assert device.ram[2][32:36] == bytearray([4, 1, 2, 3])
+    # left
+    _commands(device, 0x2D, 0x00, 2, 0x01, 2, 32, 35)
+    _commands(device, 0x2D, 0x00, 2, 0x01, 2, 32, 35)
+    assert device.ram[2][32:36] == bytearray([2, 3, 4, 1])
+
+
+def test_bus_errors():
+
+    bus = SimulatedI2C(max_block_size=4)
+    with pytest.raises(IOError):
+        bus.writeBlock(_ADDRESS, 0x40, [0] * 5)
+    bus.writeBlock(_ADDRESS, 0x40, [0] * 4)
+
+    with pytest.raises(IOError):
+        bus.writeByte(0x3C, 0x00, 0xAF)
+
+    assert bus.isDeviceConnected(_ADDRESS) and not bus.isDeviceConnected(0x3C)
+    assert bus.scan() == [_ADDRESS]
+
+
+def test_timing_model():
+
+    bus = SimulatedI2C(bus_speed=400000, transaction_overhead=0.0001)
+
+    # address byte and payload, 9 bits each, plus start and stop
+    assert bus.transaction_time(32) == pytest.approx((33 * 9 + 2) / 400000. + 0.0001)
+
+    bus.writeBlock(_ADDRESS, 0x40, [0] * 32)
+    bus.writeByte(_ADDRESS, 0x00, 0xAF)
+    assert bus.bus_time == pytest.approx(bus.transaction_time(33) + bus.transaction_time(2))
+    assert bus.bytes_written == 33 + 2
+
+    # each transaction is logged with the bus time it started at
+    assert [start for (start, _, _) in bus.transactions] == [0.0, pytest.approx(bus.transaction_time(33))]
+
+    bus.reset_stats()
+    assert (bus.n_transactions, bus.bytes_written, bus.bus_time, bus.transactions) == (0, 0, 0.0, [])
+
+
+def test_realtime_sleeps_for_the_modeled_time():
+
+    bus = SimulatedI2C(bus_speed=10000, realtime=True, record=False)
+    tStart = time.perf_counter()
+    for _ in range(5):
+        bus.writeBlock(_ADDRESS, 0x40, [0] * 32)
+    elapsed = time.perf_counter() - tStart
+
+    # 5 transactions of 34 bytes at 10 kHz - about 0.15 s
+    assert elapsed >= bus.bus_time * 0.95
+    assert bus.bus_time == pytest.approx(5 * (34 * 9 + 2) / 10000.)
+    assert bus.transactions == []
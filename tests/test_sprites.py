@@ -0,0 +1,129 @@
+# Sprites and blit() against a pixel by pixel reference.
+
+import random
+
+import pytest
+
+import qwiic_micro_oled
+
+SIZES = [(64, 48), (37, 21), (20, 8)]
+
+
+def _pixels(canvas):
+    return [[(canvas._screenbuffer[(y >> 3) * canvas.LCDWIDTH + x] >> (y & 7)) & 1 \
+                for x in range(canvas.LCDWIDTH)] for y in range(canvas.LCDHEIGHT)]
+
+
+def _random_canvas(rng, width, height):
+
+    canvas = qwiic_micro_oled.Canvas(width, height)
+    for y in range(height):
+        for x in range(width):
+            if rng.random() < 0.5:
+                canvas._screenbuffer[(y >> 3) * width + x] |= 1 << (y & 7)
+    canvas._mark_clean()
+    return canvas
+
+
+def _random_sprite(rng, masked):
+
+    (width, height) = (rng.randint(1, 20), rng.randint(1, 20))
+    pixels = [[rng.randint(0, 1) for _ in range(width)] for _ in range(height)]
+    mask = [[rng.randint(0, 1) for _ in range(width)] for _ in range(height)] if masked else None
+    return (qwiic_micro_oled.Sprite.from_pixels(pixels, mask), pixels, mask)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("mode", ["OR", "XOR", "AND_NOT", "MASK", "NORM"])
+def test_blit_matches_the_reference(size, mode):
+
+    (width, height) = size
+    rng = random.Random("%s %s" % (size, mode))
+    for i in range(150):
+        canvas = _random_canvas(rng, width, height)
+        before = bytes(canvas._screenbuffer)
+        expected = _pixels(canvas)
+        (sprite, pixels, mask) = _random_sprite(rng, i % 2 == 1)
+
+        # anywhere from fully off the left or top edge to fully off the right or bottom edge
+        x = rng.randint(-sprite.width - 2, width + 2)
+        y = rng.randint(-sprite.height - 2, height + 2)
+        canvas.blit(sprite, x, y, getattr(canvas, mode))
+
+        for row in range(sprite.height):
+            for col in range(sprite.width):
+                (xx, yy) = (x + col, y + row)
+                if not (0 <= xx < width and 0 <= yy < height):
+                    continue
+                value = pixels[row][col]
+                if mode == "OR":
+                    expected[yy][xx] |= value
+                elif mode == "XOR":
+                    expected[yy][xx] ^= value
+                elif mode == "AND_NOT":
+                    expected[yy][xx] &= 1 - value
+                elif mask is None or mask[row][col]:
+                    expected[yy][xx] = value
+        assert _pixels(canvas) == expected
+
+        # the bits of the last page below the last row aren't pixels, and stay clear
+        if height & 7:
+            lastPage = canvas._nPages - 1
+            below = 0xFF & ~((1 << (height & 7)) - 1)
+            assert not any(b & below for b in canvas._screenbuffer[lastPage * width:])
+
+        # every byte that changed is inside the dirty region of its page
+        for page in range(canvas._nPages):
+            for xx in range(width):
+                if canvas._screenbuffer[page * width + xx] != before[page * width + xx]:
+                    assert canvas._dirtyLo[page] <= xx < canvas._dirtyHi[page]
+
+
+def test_blit_at_every_edge():
+
+    # a solid sprite hanging off each edge and corner draws exactly its part on the screen
+    canvas = qwiic_micro_oled.Canvas(64, 48)
+    sprite = qwiic_micro_oled.Sprite.from_pixels([[1] * 10 for _ in range(11)])
+    for (x, y) in [(-5, 20), (59, 20), (30, -6), (30, 43), (-5, -6), (59, 43), (-10, 0), (64, 0), (0, 48)]:
+        canvas.clear(canvas.PAGE)
+        canvas.blit(sprite, x, y)
+        onScreen = (min(x + 10, 64) - max(x, 0)) * (min(y + 11, 48) - max(y, 0))
+        onScreen = onScreen if x < 64 and y < 48 and x > -10 and y > -11 else 0
+        assert sum(map(sum, _pixels(canvas))) == onScreen
+
+
+def test_xor_twice_restores_the_screen():
+
+    rng = random.Random(5)
+    canvas = _random_canvas(rng, 64, 48)
+    before = bytes(canvas._screenbuffer)
+    (sprite, _, _) = _random_sprite(rng, False)
+    for y in range(-3, 12):
+        canvas.blit(sprite, 17, y, canvas.XOR)
+        canvas.blit(sprite, 17, y, canvas.XOR)
+        assert bytes(canvas._screenbuffer) == before
+
+
+def test_get_sprite_copies_the_screen():
+
+    rng = random.Random(6)
+    canvas = _random_canvas(rng, 64, 48)
+    screen = _pixels(canvas)
+    for _ in range(50):
+        (x, y) = (rng.randint(-10, 60), rng.randint(-10, 44))
+        (w, h) = (rng.randint(1, 25), rng.randint(1, 25))
+        sprite = canvas.get_sprite(x, y, w, h)
+        assert (sprite.width, sprite.height) == (w, h)
+
+        copy = qwiic_micro_oled.Canvas(w, h)
+        copy.blit(sprite, 0, 0)
+        assert _pixels(copy) == [[screen[y + row][x + col] if 0 <= x + col < 64 and 0 <= y + row < 48 else 0 \
+                                    for col in range(w)] for row in range(h)]
+
+
+def test_sprite_sizes_are_checked():
+
+    with pytest.raises(ValueError):
+        qwiic_micro_oled.Sprite(4, 9, bytes(4))
+    with pytest.raises(ValueError):
+        qwiic_micro_oled.Sprite(4, 8, bytes(4), bytes(3))
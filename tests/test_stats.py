@@ -0,0 +1,170 @@
+# Stats counters against the simulated bus's own record, nesting of drawing calls, the
+# stats hook, and the wrappers being removed when stats are disabled.
+
+import pytest
+
+import qwiic_micro_oled
+import qwiic_micro_oled_sim
+
+_CONTROL_CONTINUATION = 0x80
+_CONTROL_DATA = 0x40
+
+
+def _make_display(**kwargs):
+
+    bus = qwiic_micro_oled_sim.SimulatedI2C(**kwargs)
+    oled = qwiic_micro_oled.QwiicMicroOled(i2c_driver=bus)
+    return (bus, oled)
+
+
+def _count_transactions(transactions):
+
+    # (command transactions, data transactions) in the bus record - a transaction carrying
+    # any display data is a data transaction
+    nData = 0
+    for (_, _, payload) in transactions:
+        i = 0
+        hasData = False
+        while i < len(payload):
+            control = payload[i]
+            hasData = hasData or bool(control & _CONTROL_DATA)
+            if not control & _CONTROL_CONTINUATION:
+                break
+            i += 2
+        nData += hasData
+    return (len(transactions) - nData, nData)
+
+
+def _draw(oled):
+
+    oled.clear(oled.PAGE)
+    oled.line(0, 0, 63, 47)
+    oled.rect(10, 10, 20, 15)
+    oled.circle(40, 20, 9)
+    oled.set_cursor(0, 30)
+    oled.print("Stats 123")
+
+
+@pytest.mark.parametrize("shadow", [False, True])
+def test_counts_match_the_bus(shadow):
+
+    (bus, oled) = _make_display()
+    oled.stats_enabled = True
+    oled.begin()
+    oled.shadow_mode = shadow
+
+    for i in range(5):
+        _draw(oled)
+        oled.pixel(i * 7, i * 5)
+        oled.display()
+    oled.clear(oled.ALL)
+
+    stats = oled.stats()
+    (nCommand, nData) = _count_transactions(bus.transactions)
+    assert stats["transactions"] == bus.n_transactions
+    assert (stats["command_transactions"], stats["data_transactions"]) == (nCommand, nData)
+    assert stats["command_bytes"] == bus.command_bytes
+    assert stats["data_bytes"] == bus.data_bytes
+    # each transaction also carries the address byte
+    assert stats["bus_bytes"] == bus.bytes_written + bus.n_transactions
+    assert stats["display_calls"] == 5
+
+    # resetting zeroes the counters, and later traffic is counted from there
+    oled.reset_stats()
+    bus.reset_stats()
+    oled.invalidate()
+    oled.display()
+    stats = oled.stats()
+    assert stats["transactions"] == bus.n_transactions > 0
+    assert stats["data_bytes"] == bus.data_bytes
+    if not shadow:
+        assert stats["data_bytes"] == 64 * 6
+    assert stats["display_calls"] == 1
+
+
+def test_nested_drawing_calls_count_once():
+
+    (_, oled) = _make_display(record=False)
+    oled.begin()
+    oled.stats_enabled = True
+
+    oled.line(0, 0, 30, 20)
+    oled.print("Hello")
+    oled.draw_char(0, 0, "A")
+    oled.rect_fill(5, 5, 10, 10)
+
+    calls = oled.stats()["draw_calls"]
+    assert calls["line"] == 1
+    assert calls["print"] == 1
+    assert calls["draw_char"] == 1
+    assert calls["rect_fill"] == 1
+    # the calls they make inside are not counted
+    assert calls["pixel"] == 0
+    assert calls["write"] == 0
+    assert calls["blit"] == 0
+    assert calls["fill_region"] == 0
+
+    # drawing done by begin() isn't counted either
+    oled.reset_stats()
+    oled.begin()
+    assert sum(oled.stats()["draw_calls"].values()) == 0
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_hook_reports_each_timed_call(background):
+
+    (bus, oled) = _make_display()
+    events = []
+    oled.stats_enabled = True
+    oled.set_stats_hook(lambda event, seconds, bus_bytes: events.append((event, seconds, bus_bytes)))
+
+    oled.begin()
+    oled.background_display = background
+    bus.reset_stats()
+    oled.rect_fill(0, 0, 64, 48)
+    oled.display()
+    oled.wait_display()
+    oled.background_display = False
+
+    names = [event for (event, _, _) in events]
+    assert names[0] == "begin"
+    assert sorted(names[1:]) == ["display", "flush"]
+    assert all(seconds >= 0 for (_, seconds, _) in events)
+
+    # the frame's bytes are reported by the flush - the display() call writes them itself
+    # unless a worker does
+    busBytes = dict((event, nBytes) for (event, _, nBytes) in events[1:])
+    assert busBytes["flush"] == bus.bytes_written + bus.n_transactions
+    assert busBytes["display"] == (0 if background else busBytes["flush"])
+
+    stats = oled.stats()
+    for name in ("begin_latency", "display_latency", "flush_latency"):
+        assert stats[name]["count"] == 1
+        assert sum(n for (_, n) in stats[name]["buckets"]) == 1
+        assert stats[name]["max_ms"] == pytest.approx(stats[name]["total_ms"])
+
+
+def test_disabling_removes_the_wrappers():
+
+    (bus, oled) = _make_display(record=False)
+    oled.begin()
+    before = set(vars(oled))
+
+    oled.stats_enabled = True
+    assert oled._i2c is not bus
+    assert "display" in vars(oled) and "print" in vars(oled)
+
+    oled.stats_enabled = False
+    assert oled.stats() is None
+    assert oled._i2c is bus
+    assert set(vars(oled)) - before == set()
+    # the methods are the class's own again - nothing is left in the call path
+    for name in qwiic_micro_oled._STATS_DRAW_CALLS + ("begin", "display", "_flush_frame"):
+        assert getattr(oled, name).__func__ is getattr(type(oled), name)
+
+    # nothing is counted while disabled, and enabling again starts from zero
+    oled.print("x")
+    oled.display()
+    oled.stats_enabled = True
+    stats = oled.stats()
+    assert stats["transactions"] == 0 and sum(stats["draw_calls"].values()) == 0
@@ -0,0 +1,120 @@
+# The rendered text cache - LRU limits and counters - and print() drawing the same pixels
+# and cursor position as writing the text a character at a time.
+
+import random
+
+import pytest
+
+import qwiic_micro_oled
+
+
+@pytest.fixture
+def oled():
+
+    canvas = qwiic_micro_oled.Canvas(64, 48)
+    canvas.clear_text_cache()
+    yield canvas
+    canvas.set_text_cache_limits()
+    canvas.clear_text_cache()
+
+
+def _entry_size(text, advance=6, nRows=1):
+
+    # the data and mask bytes of a rendered font 0 string
+    return 2 * len(text) * advance * nRows
+
+
+def test_hits_and_misses(oled):
+
+    oled.render_text("abc")
+    oled.render_text("abc")
+    oled.render_text("abd")
+    oled.render_text("abc", font_type=1)     # another font is another entry
+
+    stats = oled.get_text_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 3, 0)
+    assert stats["entries"] == 3
+    assert stats["bytes"] == 2 * _entry_size("abc") + 2 * 3 * 9 * 2
+    assert oled.render_text("abc") is oled.render_text("abc")
+
+
+def test_eviction_at_the_entry_limit(oled):
+
+    oled.set_text_cache_limits(max_entries=3)
+    for text in ("one", "two", "six"):
+        oled.render_text(text)
+    oled.render_text("one")             # now the most recently used
+    oled.render_text("ten")             # evicts "two", the least recently used
+
+    stats = oled.get_text_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["entries"]) == (1, 4, 1, 3)
+
+    oled.render_text("one")
+    oled.render_text("six")
+    oled.render_text("ten")
+    assert oled.get_text_cache_stats()["hits"] == 4
+    oled.render_text("two")
+    stats = oled.get_text_cache_stats()
+    assert (stats["misses"], stats["evictions"], stats["entries"]) == (5, 2, 3)
+
+
+def test_eviction_at_the_size_limit(oled):
+
+    # room for exactly two 4 character strings
+    oled.set_text_cache_limits(max_bytes=2 * _entry_size("abcd"))
+    oled.render_text("abcd")
+    oled.render_text("efgh")
+    stats = oled.get_text_cache_stats()
+    assert (stats["entries"], stats["bytes"], stats["evictions"]) == (2, 2 * _entry_size("abcd"), 0)
+
+    # a longer string pushes out both older ones
+    oled.render_text("ijklmn")
+    stats = oled.get_text_cache_stats()
+    assert (stats["entries"], stats["bytes"], stats["evictions"]) == (1, _entry_size("ijklmn"), 2)
+
+    # a string bigger than the whole cache isn't kept
+    oled.render_text("x" * 20)
+    stats = oled.get_text_cache_stats()
+    assert (stats["entries"], stats["bytes"]) == (0, 0)
+
+    # lowering the limits trims the cache right away
+    oled.set_text_cache_limits()
+    for text in ("a", "b", "c", "d"):
+        oled.render_text(text)
+    oled.set_text_cache_limits(max_entries=1)
+    stats = oled.get_text_cache_stats()
+    assert (stats["entries"], stats["bytes"]) == (1, _entry_size("d"))
+
+
+def test_clear_resets_the_counters(oled):
+
+    oled.render_text("abc")
+    oled.render_text("abc")
+    oled.clear_text_cache()
+    stats = oled.get_text_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["entries"], stats["bytes"]) == (0, 0, 0, 0, 0)
+
+
+@pytest.mark.parametrize("fontType", [0, 1, 2, 3])
+@pytest.mark.parametrize("mode", ["NORM", "XOR"])
+def test_print_matches_writing_each_character(oled, fontType, mode):
+
+    rng = random.Random("%d %s" % (fontType, mode))
+    reference = qwiic_micro_oled.Canvas(64, 48)
+    for _ in range(40):
+        text = "".join(chr(rng.randint(32, 126)) for _ in range(rng.randint(1, 25)))
+        (x, y) = (rng.randint(-3, 63), rng.randint(-3, 47))
+
+        for canvas in (oled, reference):
+            canvas.clear(canvas.PAGE)
+            canvas.rect_fill(10, 10, 30, 20)
+            canvas.set_font_type(fontType)
+            canvas.set_draw_modee(getattr(canvas, mode))
+            canvas.set_cursor(x, y)
+
+        oled.print(text)
+        for c in bytearray(text, encoding="ascii"):
+            reference.write(c)
+
+        assert oled._screenbuffer == reference._screenbuffer
+        assert (oled.cursorX, oled.cursorY) == (reference.cursorX, reference.cursorY)